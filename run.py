@@ -1,10 +1,15 @@
 import sys
 import os
+import multiprocessing
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.main import main
-
 if __name__ == "__main__":
+    # Regex searches and indexing run in spawned child processes, which frozen
+    # builds must dispatch; children re-import this file, so the UI is only
+    # imported here
+    multiprocessing.freeze_support()
+    from src.main import main
+
     main()
@@ -0,0 +1,254 @@
+"""
+Glassnotes Note Catalog
+Persistent hub metadata so the note list can be shown before touching the disk
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+from src.logic.config import Config
+from src.logic.scanner import workspace_scanner
+from src.logic.corpus import MAX_INDEXED_CHARS, index_key, read_note_text
+
+
+class NoteCatalog:
+    """SQLite catalog of the hub's notes: path, size, mtime, preview, words, last opened
+
+    The rows are loaded into memory at startup so the hub renders straight
+    from them. reconcile() later stats the files and rewrites only the rows
+    whose mtime or size changed, plus the list order.
+    """
+
+    DB_FILE = Config.APP_DIR / "catalog.db"
+    PREVIEW_CHARS = 200
+
+    def __init__(self, db_file=None):
+        self._lock = threading.Lock()
+        self._conn = None
+        self._entries = {}  # index_key -> row dict; replaced, never mutated, once published
+        try:
+            # Used from the UI thread and the reconcile worker, serialized by _lock
+            self._conn = sqlite3.connect(str(db_file or self.DB_FILE), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS notes ("
+                    " key TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER NOT NULL,"
+                    " mtime REAL NOT NULL, preview TEXT NOT NULL, words INTEGER NOT NULL,"
+                    " last_opened REAL, position INTEGER)"
+                )
+            cursor = self._conn.execute(
+                "SELECT key, path, size, mtime, preview, words, last_opened, position FROM notes"
+            )
+            columns = [c[0] for c in cursor.description]
+            for row in cursor:
+                entry = dict(zip(columns, row))
+                self._entries[entry.pop("key")] = entry
+        except sqlite3.Error as e:
+            # Without a catalog the hub simply waits for the first reconcile
+            print(f"Note catalog unavailable: {e}")
+            self._conn = None
+
+    def _write(self, rows, removed):
+        """Upsert rows and delete removed keys in one transaction"""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO notes"
+                    " (key, path, size, mtime, preview, words, last_opened, position)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, e["path"], e["size"], e["mtime"], e["preview"], e["words"],
+                         e["last_opened"], e["position"])
+                        for key, e in rows.items()
+                    ],
+                )
+                self._conn.executemany("DELETE FROM notes WHERE key = ?", [(k,) for k in removed])
+        except sqlite3.Error as e:
+            print(f"Error writing note catalog: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def paths(self):
+        """Hub note paths in the order of the last reconcile"""
+        with self._lock:
+            listed = [e for e in self._entries.values() if e["position"] is not None]
+        return [e["path"] for e in sorted(listed, key=lambda e: e["position"])]
+
+    def entry(self, path):
+        """Catalog row of path as a dict, or None; treat it as read-only"""
+        with self._lock:
+            return self._entries.get(index_key(path))
+
+    def mark_opened(self, path):
+        """Record that path was just opened"""
+        key = index_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Size -1 never matches, so the next reconcile fills the row in
+                entry = {"path": str(path), "size": -1, "mtime": 0.0, "preview": "",
+                         "words": 0, "last_opened": None, "position": None}
+            entry = dict(entry, last_opened=time.time())
+            self._entries[key] = entry
+            self._write({key: entry}, [])
+
+    def hub_files(self, recent_files, notes_dir, cancelled=None, found=None):
+        """(path, DirEntry or None) of the hub's notes
+
+        Recent files come first in user order, with no DirEntry, then the
+        remaining files anywhere under notes_dir sorted by path, so the order
+        is stable across parallel walks. found receives batches of paths
+        the catalog does not know yet while the walk is still running.
+        Missing files are not checked here; reconcile() drops them.
+        """
+        files = [(path, None) for path in recent_files]
+        seen = {os.path.normpath(path) for path in recent_files}
+        scanned = []
+        for batch in workspace_scanner.walk(notes_dir, cancelled=cancelled):
+            batch = [entry for entry in batch if os.path.normpath(entry.path) not in seen]
+            scanned += batch
+            if found:
+                with self._lock:
+                    new = [entry.path for entry in batch if index_key(entry.path) not in self._entries]
+                if new:
+                    found(new)
+        scanned.sort(key=lambda entry: entry.path)
+        return files + [(entry.path, entry) for entry in scanned]
+
+    def reconcile(self, recent_files, notes_dir, cancelled=None, touched=None, found=None):
+        """Bring the catalog in line with the disk
+
+        Only files whose mtime or size changed are read. With touched, a
+        collection of paths known to have changed, cataloged notes-dir files
+        outside it are trusted without a stat; recent files are always
+        checked since no directory listing vouches for them. found is
+        passed to hub_files() to stream new notes as they are discovered.
+        Returns (paths, changed): the hub's existing notes in order and the
+        paths whose rows were rewritten, or None if cancelled() became true
+        first.
+        """
+        with self._lock:
+            known = dict(self._entries)
+        if touched is not None:
+            touched = {index_key(path) for path in touched}
+            recent = {index_key(path) for path in recent_files}
+        paths = []
+        listed = set()
+        rows = {}
+        changed = []
+        files = self.hub_files(recent_files, notes_dir, cancelled, found)
+        if cancelled and cancelled():
+            # A partial walk would look like deleted notes
+            return None
+        for path, dir_entry in files:
+            if cancelled and cancelled():
+                return None
+            key = index_key(path)
+            if key in listed:
+                continue
+            entry = known.get(key)
+            trusted = (
+                touched is not None
+                and entry is not None
+                and entry["size"] >= 0
+                and entry["path"] == path
+                and key not in touched
+                and key not in recent
+            )
+            if not trusted:
+                try:
+                    # The scan's DirEntry caches its stat result
+                    stat = dir_entry.stat() if dir_entry is not None else os.stat(path)
+                except OSError:
+                    continue
+            position = len(paths)
+            paths.append(path)
+            listed.add(key)
+            current = trusted or (
+                entry is not None
+                and entry["path"] == path
+                and (entry["mtime"], entry["size"]) == (stat.st_mtime, stat.st_size)
+            )
+            if current:
+                if entry["position"] != position:
+                    rows[key] = dict(entry, position=position)
+                continue
+            text = read_note_text(path, MAX_INDEXED_CHARS) or ""
+            rows[key] = {
+                "path": path,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "preview": text[: self.PREVIEW_CHARS],
+                "words": len(text.split()),
+                "last_opened": entry["last_opened"] if entry else None,
+                "position": position,
+            }
+            changed.append(path)
+
+        removed = [key for key in known if key not in listed]
+        with self._lock:
+            for key, row in rows.items():
+                # Keep opens recorded while the files were being read
+                latest = self._entries.get(key)
+                if latest is not None:
+                    row["last_opened"] = latest["last_opened"]
+            for key in removed:
+                self._entries.pop(key, None)
+            self._entries.update(rows)
+            self._write(rows, removed)
+        return paths, changed
+
+
+class RootCatalogs:
+    """One NoteCatalog per workspace root, each in its own database
+
+    A catalog is opened, which loads all of its rows, only when its root's
+    hub section first needs it, so large roots cost nothing at startup.
+    """
+
+    DB_DIR = Config.APP_DIR / "catalogs"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalogs = {}  # index_key(root) -> NoteCatalog
+
+    def _db_file(self, key):
+        return self.DB_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.db"
+
+    def get(self, root):
+        """Catalog of root, opened on first use; safe to call from worker threads"""
+        key = index_key(root)
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is None:
+                self.DB_DIR.mkdir(parents=True, exist_ok=True)
+                catalog = self._catalogs[key] = NoteCatalog(self._db_file(key))
+            return catalog
+
+    def discard(self, root):
+        """Close and delete the catalog of a root that was unregistered"""
+        key = index_key(root)
+        with self._lock:
+            catalog = self._catalogs.pop(key, None)
+        if catalog is not None:
+            catalog.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(f"{self._db_file(key)}{suffix}")
+            except OSError:
+                pass
+
+
+note_catalog = NoteCatalog()
+root_catalogs = RootCatalogs()
@@ -99,10 +99,18 @@ class Config:
             "tab_size": 4,
             "auto_save": False,
             "auto_save_interval": 60,  # seconds
+            "large_file_threshold_mb": 50,  # open in the paged large-file editor above this
+            "large_file_editable": True,  # False opens large files read-only
+            "async_search_threshold": 1000000,  # characters; larger documents search on a worker
+            "regex_search_timeout_ms": 3000,  # regex searches are killed after this long
             # Data
             "recent_files": [],
             "max_recent_files": 10,
-            "session_tabs": [],  # List of {name, path, is_backup}
+            # Extra folders shown as hub sections: [{"path": str, "expanded": bool}]
+            "workspace_roots": [],
+            "session_save_delay": 1000,  # milliseconds of idle before session flush
+            # Names skipped, with everything below them, when scanning the notes folder
+            "scan_ignore_patterns": [".*", "node_modules", "__pycache__", "venv"],
             # Cloud
             "google_logged_in": False,
             # Window
@@ -148,6 +156,37 @@ class Config:
         self.settings["recent_files"] = []
         self.save()
 
+    def workspace_roots(self):
+        """Registered workspace root folders, in the order they were added"""
+        return [root["path"] for root in self.settings.get("workspace_roots", [])]
+
+    def add_workspace_root(self, path):
+        """Register a folder as a workspace root; returns False if it already is one"""
+        path_str = os.path.normpath(str(path))
+        if path_str in self.workspace_roots():
+            return False
+        self.settings.setdefault("workspace_roots", []).append({"path": path_str, "expanded": True})
+        self.save()
+        return True
+
+    def remove_workspace_root(self, path):
+        """Unregister a workspace root; its files are left alone"""
+        roots = self.settings.get("workspace_roots", [])
+        self.settings["workspace_roots"] = [root for root in roots if root["path"] != str(path)]
+        self.save()
+
+    def is_root_expanded(self, path):
+        for root in self.settings.get("workspace_roots", []):
+            if root["path"] == str(path):
+                return root.get("expanded", False)
+        return False
+
+    def set_root_expanded(self, path, expanded):
+        for root in self.settings.get("workspace_roots", []):
+            if root["path"] == str(path):
+                root["expanded"] = expanded
+        self.save()
+
     def get(self, key, default=None):
         """Get a setting value with optional default"""
         return self.settings.get(key, default)
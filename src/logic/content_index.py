@@ -0,0 +1,183 @@
+"""
+Glassnotes Content Index
+Persistent SQLite FTS5 full-text index over local notes and recent files
+"""
+
+import os
+import sqlite3
+import threading
+
+from src.logic.config import Config
+from src.logic.corpus import MAX_INDEXED_CHARS, index_key, read_note_text
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query of quoted terms, the last one a prefix
+
+    Quoting keeps user input from being parsed as FTS5 syntax, and the
+    trailing prefix lets results appear while a word is still being typed.
+    """
+    terms = [term.replace('"', '""') for term in text.split()]
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class ContentIndex:
+    """Full-text index kept in sync with files by mtime and size
+
+    Files are refreshed off the UI thread by the CorpusIndexer whenever the
+    hub reconciles its list, including after a save or delete; a file whose
+    mtime and size match the stored values is never read again.
+    """
+
+    DB_FILE = Config.APP_DIR / "index.db"
+    SYNC_BATCH = 500  # files written per transaction during a sync
+
+    def __init__(self, db_file=None):
+        self._lock = threading.Lock()
+        self._conn = None
+        self.available = False
+        try:
+            # Used from the UI thread and the sync worker, serialized by _lock
+            self._conn = sqlite3.connect(str(db_file or self.DB_FILE), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema()
+            self.available = True
+        except sqlite3.Error as e:
+            # Missing FTS5 support or an unreadable database disables content search
+            print(f"Content index unavailable: {e}")
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,"
+                " display_path TEXT NOT NULL, mtime REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS notes USING fts5("
+                " name, body, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def stored_stats(self, paths=None):
+        """Map of normalized path to the (mtime, size) it was indexed at
+
+        Covers every indexed file, or only the given paths.
+        """
+        if not self.available:
+            return {}
+        with self._lock:
+            if paths is None:
+                rows = self._conn.execute("SELECT path, mtime, size FROM files").fetchall()
+            else:
+                rows = []
+                for path in paths:
+                    rows += self._conn.execute(
+                        "SELECT path, mtime, size FROM files WHERE path = ?", (index_key(path),)
+                    ).fetchall()
+        return {path: (mtime, size) for path, mtime, size in rows}
+
+    def _store(self, path, text, mtime, size):
+        key = index_key(path)
+        row = self._conn.execute("SELECT id FROM files WHERE path = ?", (key,)).fetchone()
+        if row is None:
+            cursor = self._conn.execute(
+                "INSERT INTO files (path, display_path, mtime, size) VALUES (?, ?, ?, ?)",
+                (key, str(path), mtime, size),
+            )
+            file_id = cursor.lastrowid
+        else:
+            file_id = row[0]
+            self._conn.execute(
+                "UPDATE files SET display_path = ?, mtime = ?, size = ? WHERE id = ?",
+                (str(path), mtime, size, file_id),
+            )
+            self._conn.execute("DELETE FROM notes WHERE rowid = ?", (file_id,))
+        self._conn.execute(
+            "INSERT INTO notes (rowid, name, body) VALUES (?, ?, ?)",
+            (file_id, os.path.basename(str(path)), text),
+        )
+
+    def store_many(self, entries):
+        """Replace the indexed copies of [(path, text, mtime, size)] in one transaction"""
+        if not self.available or not entries:
+            return
+        with self._lock, self._conn:
+            for path, text, mtime, size in entries:
+                self._store(path, text, mtime, size)
+
+    def remove_many(self, paths):
+        """Drop paths from the index in one transaction"""
+        if not self.available:
+            return
+        with self._lock, self._conn:
+            for path in paths:
+                row = self._conn.execute(
+                    "SELECT id FROM files WHERE path = ?", (index_key(path),)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM notes WHERE rowid = ?", (row[0],))
+                    self._conn.execute("DELETE FROM files WHERE id = ?", (row[0],))
+
+    def sync_paths(self, paths, cancelled=None):
+        """Re-index whichever of paths changed, returning how many were read
+
+        Paths that no longer exist are dropped. Returns None if cancelled()
+        became true first; the batches stored until then are kept.
+        """
+        if not self.available:
+            return 0
+        paths = list(paths)
+        # A handful of saved files is cheaper to look up one by one
+        stored = self.stored_stats(paths if len(paths) < self.SYNC_BATCH else None)
+        batch = []
+        missing = []
+        changed = 0
+        for path in paths:
+            if cancelled and cancelled():
+                self.store_many(batch)
+                return None
+            try:
+                stat = os.stat(path)
+            except OSError:
+                missing.append(path)
+                continue
+            if stored.get(index_key(path)) == (stat.st_mtime, stat.st_size):
+                continue
+            text = read_note_text(path, MAX_INDEXED_CHARS)
+            if text is None:
+                continue
+            batch.append((path, text, stat.st_mtime, stat.st_size))
+            if len(batch) >= self.SYNC_BATCH:
+                self.store_many(batch)
+                changed += len(batch)
+                batch = []
+        self.store_many(batch)
+        self.remove_many(missing)
+        return changed + len(batch)
+
+    def search(self, text, limit=50):
+        """Return [(path, snippet)] for notes matching text, best match first"""
+        query = fts_query(text)
+        if not self.available or not query:
+            return []
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT files.display_path,"
+                    " snippet(notes, 1, '', '', '…', 16)"
+                    " FROM notes JOIN files ON files.id = notes.rowid"
+                    " WHERE notes MATCH ? ORDER BY bm25(notes, 10.0, 1.0) LIMIT ?",
+                    (query, limit),
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error searching content index: {e}")
+            return []
+        return rows
+
+
+content_index = ContentIndex()
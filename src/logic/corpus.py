@@ -0,0 +1,56 @@
+"""
+Glassnotes Corpus Helpers
+Side-effect-free reading and tokenizing shared by the note indexes and their worker processes
+"""
+
+import os
+from array import array
+
+
+MAX_INDEXED_CHARS = 4 * 1024 * 1024  # only the head of very large files is indexed
+
+
+def index_key(path):
+    """Normalized path used as the identity of an indexed file"""
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def read_note_text(path, max_chars=-1):
+    """Read up to max_chars of a note as text, or None if unreadable"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read(max_chars)
+    except OSError:
+        return None
+
+
+def trigrams_of(text):
+    """Set of lowercase trigrams occurring in text"""
+    text = text.lower()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def tokenize_chunk(files, max_chars=MAX_INDEXED_CHARS):
+    """Read a chunk of files and build its partial trigram index
+
+    files is a list of (path, mtime, size). Returns (entries, partial) where
+    entries lists (path, text, mtime, size, truncated) for every readable
+    file and partial maps each trigram to the ascending positions in
+    entries of the files containing it. Runs in indexer worker processes.
+    """
+    entries = []
+    partial = {}
+    for path, mtime, size in files:
+        text = read_note_text(path, max_chars + 1)
+        if text is None:
+            continue
+        truncated = len(text) > max_chars
+        text = text[:max_chars]
+        position = len(entries)
+        for trigram in trigrams_of(text):
+            postings = partial.get(trigram)
+            if postings is None:
+                postings = partial[trigram] = array("I")
+            postings.append(position)
+        entries.append((path, text, mtime, size, truncated))
+    return entries, partial
@@ -1,24 +1,14 @@
 import os
-from pathlib import Path
-from functools import lru_cache
 from typing import Optional, List
 
-from src.logic.config import Config
-
-
-@lru_cache(maxsize=128)
-def _get_file_preview_cached(path: str, max_bytes: int = 200) -> str:
-    """Cached file preview - use cache key (path, max_bytes)"""
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read(max_bytes)
-    except Exception:
-        return ""
+from src.logic.config import config
+from src.logic.preview_cache import preview_cache
+from src.logic.scanner import workspace_scanner
 
 
 def clear_preview_cache():
-    """Clear the preview cache - call when files change"""
-    _get_file_preview_cached.cache_clear()
+    """Clear the preview cache; changed files are detected without this"""
+    preview_cache.clear()
 
 
 class FileManager:
@@ -43,23 +33,26 @@ class FileManager:
 
     @staticmethod
     def list_files(directory):
-        """List all supported text files in directory"""
-        files = []
+        """List all supported text files in directory and its subfolders"""
         try:
-            if not os.path.exists(directory):
-                return []
-
-            for file in os.listdir(directory):
-                if file.lower().endswith(Config.SUPPORTED_TEXT_FORMATS):
-                    files.append(str(Path(directory) / file))
+            return workspace_scanner.list_files(directory)
         except Exception as e:
             print(f"Error listing files: {e}")
-        return files
+            return []
 
     @staticmethod
     def get_file_preview(path: str, max_bytes: int = 200) -> str:
-        """Get first few lines of a file as preview (cached)"""
-        return _get_file_preview_cached(path, max_bytes)
+        """Get first few lines of a file as preview (cached until the file changes)"""
+        return preview_cache.get(path, max_bytes)
+
+    @staticmethod
+    def is_large_file(path):
+        """Check whether a file exceeds the large-file viewer threshold"""
+        threshold = config.get("large_file_threshold_mb", 50) * 1024 * 1024
+        try:
+            return os.path.getsize(path) >= threshold
+        except OSError:
+            return False
 
     @staticmethod
     def delete_file(path):
@@ -67,6 +60,7 @@ class FileManager:
         try:
             if os.path.exists(path):
                 os.remove(path)
+                preview_cache.discard(path)
                 return True
         except Exception as e:
             print(f"Error deleting file: {e}")
@@ -0,0 +1,144 @@
+"""
+Glassnotes Fuzzy Matcher
+fzf-style subsequence ranking over note names, run through C-level builtins
+"""
+
+import re
+import operator
+from itertools import compress, repeat
+
+
+# Characters after which a match counts as starting a word
+_WORD_SEPARATORS = r" _\-./"
+
+# Score fields packed into one int below the tier and word-start bits; wide
+# enough for any path length, so the fields need no clamping
+_SPAN_BITS = 16  # characters covered by the match, compact wins
+_LENGTH_BITS = 16  # length of the matched text, shorter wins ties
+
+
+def match_key(name, path):
+    """Lowercase (name, path) a note is matched on; path separators become /"""
+    return name.lower(), path.replace("\\", "/").lower()
+
+
+def _subsequence_pattern(query):
+    """Regex matching the query as a subsequence, e.g. 'abc' -> a[^b]*b[^c]*c
+
+    The negated classes find the same leftmost, greedy-forward match as fzf's
+    first pass without the backtracking a lazy .*? costs.
+    """
+    parts = [re.escape(query[0])]
+    for c in query[1:]:
+        parts.append(f"[^{re.escape(c)}]*{re.escape(c)}")
+    return re.compile("".join(parts))
+
+
+class FuzzyMatcher:
+    """Ranks notes against a query as fzf does, for lists of 100k names
+
+    Keys are lowercased once when the matcher is built. A query matches a
+    note when its characters appear in order in the name, or failing that
+    in the path. Each step runs as map/compress over C-implemented
+    callables, so no Python code runs per note; a query that extends the
+    previous one only re-checks the previous matches, and rank_chunks()
+    lets the caller spread the work over several event-loop turns.
+    """
+
+    CHUNK_SIZE = 5000  # candidates scored per rank_chunks step
+
+    # Match tiers, best first
+    TIER_SUBSTRING = 0  # the name contains the query as typed
+    TIER_NAME = 1  # the name contains the query as a subsequence
+    TIER_PATH = 2  # only the full path contains it
+
+    def __init__(self, keys):
+        self._names = [name for name, _ in keys]
+        self._paths = [path for _, path in keys]
+        self._last_query = None
+        self._last_matches = None  # ascending indices matching _last_query
+
+    def __len__(self):
+        return len(self._names)
+
+    def _candidates(self, query):
+        """Indices that may match query, narrowed from the previous query when it extends it"""
+        if self._last_query and query.startswith(self._last_query):
+            return self._last_matches
+        return range(len(self._names))
+
+    def _score_chunk(self, candidates, query, pattern, word_pattern, width):
+        """Matching indices of a chunk and their packed, ascending scores"""
+        found = list(map(pattern.search, map(self._names.__getitem__, candidates)))
+        name_hits = list(compress(candidates, found))
+        name_found = list(compress(found, found))
+
+        path_only = list(compress(candidates, map(operator.not_, found)))
+        path_found = list(map(pattern.search, map(self._paths.__getitem__, path_only)))
+        path_hits = list(compress(path_only, path_found))
+        path_found = list(compress(path_found, path_found))
+
+        hits = name_hits + path_hits
+        if not hits:
+            return [], []
+        names = list(map(self._names.__getitem__, name_hits))
+        targets = names + list(map(self._paths.__getitem__, path_hits))
+        matched = list(map(operator.methodcaller("group"), name_found + path_found))
+
+        # TIER_SUBSTRING or TIER_NAME as False or True, then TIER_PATH
+        tiers = list(map(operator.not_, map(operator.contains, names, repeat(query))))
+        tiers += repeat(self.TIER_PATH, len(path_hits))
+        # Whether some match starts a word; the leading separator stands for ^
+        off_word = map(operator.not_, map(word_pattern.search, map(operator.add, repeat("/"), targets)))
+        spans = map(len, matched)
+        lengths = map(len, targets)
+
+        # tier, off_word, span, length and index packed into one int, best lowest
+        scores = map(operator.lshift, tiers, repeat(1))
+        scores = map(operator.or_, scores, off_word)
+        scores = map(operator.lshift, scores, repeat(_SPAN_BITS))
+        scores = map(operator.or_, scores, spans)
+        scores = map(operator.lshift, scores, repeat(_LENGTH_BITS))
+        scores = map(operator.or_, scores, lengths)
+        scores = map(operator.lshift, scores, repeat(width))
+        return hits, sorted(map(operator.or_, scores, hits))
+
+    def rank_chunks(self, query):
+        """Generator doing rank()'s work in CHUNK_SIZE steps
+
+        Yields None after each step and the ranked indices last.
+        """
+        query = query.lower()
+        if not query:
+            yield list(range(len(self._names)))
+            return
+
+        candidates = self._candidates(query)
+        pattern = _subsequence_pattern(query)
+        word_pattern = re.compile(f"[{_WORD_SEPARATORS}]{pattern.pattern}")
+        width = max(1, len(self._names).bit_length())
+
+        matches = []
+        scores = []
+        for start in range(0, len(candidates), self.CHUNK_SIZE):
+            chunk = candidates[start : start + self.CHUNK_SIZE]
+            hits, chunk_scores = self._score_chunk(chunk, query, pattern, word_pattern, width)
+            matches += hits
+            scores += chunk_scores
+            yield None
+
+        self._last_query, self._last_matches = query, sorted(matches)
+        # Each chunk is already sorted, so this only merges runs
+        scores.sort()
+        yield list(map(operator.and_, scores, repeat((1 << width) - 1)))
+
+    def rank(self, query):
+        """Indices of matching notes, best first
+
+        Ranking is by tier, then by whether the match starts a word, then by
+        how compact the match is, then by the length of the matched text,
+        then by list order.
+        """
+        for result in self.rank_chunks(query):
+            pass
+        return result
@@ -0,0 +1,125 @@
+"""
+Glassnotes Corpus Indexer
+Refreshes the content and trigram indexes with tokenizing spread over worker processes
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.logic.content_index import content_index
+from src.logic.trigram_index import trigram_index
+from src.logic.corpus import index_key, tokenize_chunk
+
+
+def _under(key, root_keys):
+    """Whether the index_key key lies inside one of root_keys"""
+    return any(key.startswith(root.rstrip(os.sep) + os.sep) for root in root_keys)
+
+
+class CorpusIndexer:
+    """Brings both note indexes in line with a list of files
+
+    Stale files are split into chunks that worker processes read and
+    tokenize into partial trigram indexes; the UI process only merges them.
+    Results are committed chunk by chunk, so a cancelled or interrupted run
+    resumes after a restart with just the files that are still stale.
+    """
+
+    CHUNK_SIZE = 200  # files per worker task
+    INLINE_LIMIT = 50  # fewer stale files than this are not worth starting processes for
+    FLUSH_EVERY = 25  # chunks merged between trigram index flushes
+
+    def __init__(self, content, trigrams):
+        self.content = content
+        self.trigrams = trigrams
+
+    def stale_files(self, paths):
+        """(path, mtime, size) of every file either index holds an outdated copy of"""
+        # A few changed files are cheaper to look up one by one
+        stored = self.content.stored_stats(paths if len(paths) < self.INLINE_LIMIT else None)
+        stale = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            current = stored.get(index_key(path)) == (stat.st_mtime, stat.st_size)
+            if not current or not self.trigrams.is_current(path, stat):
+                stale.append((str(path), stat.st_mtime, stat.st_size))
+        return stale
+
+    def _merge(self, result):
+        entries, partial = result
+        self.content.store_many([(path, text, mtime, size) for path, text, mtime, size, _ in entries])
+        self.trigrams.add_many(entries, partial)
+
+    def run(self, paths, progress=None, cancelled=None, removed=None, within=None, outside=()):
+        """Make both indexes cover exactly paths
+
+        With removed, only those files are dropped and paths need only list
+        the files that may have changed, for incremental updates. Several
+        workspace roots share the indexes, so a full sync can be limited to
+        the files under the root within, or leave the files under the roots
+        in outside alone.
+        progress receives (files done, files to index) after every chunk.
+        Returns the number of files indexed, or None if cancelled() became true.
+        """
+        paths = list(paths)
+        if removed is None:
+            wanted = {index_key(path) for path in paths}
+            within = [index_key(within)] if within is not None else None
+            outside = [index_key(root) for root in outside]
+
+            def unwanted(keys):
+                keys = keys - wanted
+                if within is not None:
+                    keys = {key for key in keys if _under(key, within)}
+                if outside:
+                    keys = {key for key in keys if not _under(key, outside)}
+                return keys
+
+            self.content.remove_many(unwanted(set(self.content.stored_stats())))
+            self.trigrams.remove_many(unwanted(self.trigrams.indexed_keys()))
+        else:
+            self.content.remove_many(removed)
+            self.trigrams.remove_many(removed)
+
+        stale = self.stale_files(paths)
+        total = len(stale)
+        if progress:
+            progress(0, total)
+        chunks = [stale[i : i + self.CHUNK_SIZE] for i in range(0, total, self.CHUNK_SIZE)]
+
+        done = 0
+        try:
+            if total < self.INLINE_LIMIT:
+                for chunk in chunks:
+                    if cancelled and cancelled():
+                        return None
+                    self._merge(tokenize_chunk(chunk))
+                    done += len(chunk)
+                    if progress:
+                        progress(done, total)
+                return total
+
+            workers = max(1, (os.cpu_count() or 2) - 1)
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = {pool.submit(tokenize_chunk, chunk): len(chunk) for chunk in chunks}
+                for merged, future in enumerate(as_completed(futures), 1):
+                    if cancelled and cancelled():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        return None
+                    self._merge(future.result())
+                    done += futures[future]
+                    if progress:
+                        progress(done, total)
+                    if merged % self.FLUSH_EVERY == 0:
+                        self.trigrams.flush()
+            return total
+        finally:
+            self.trigrams.flush()
+
+
+corpus_indexer = CorpusIndexer(content_index, trigram_index)
@@ -0,0 +1,216 @@
+"""
+Glassnotes Large File Access
+Memory-mapped, line-indexed read-only access to files too big for the editor
+"""
+
+import os
+import mmap
+from array import array
+from bisect import bisect_right
+
+from src.logic.search import compile_search_pattern, is_line_local, line_matches
+
+
+SCAN_CHUNK = 8 * 1024 * 1024  # bytes scanned between progress/cancel checks
+
+
+def iter_matches(pattern, data, start, end, progress=None, cancelled=None):
+    """Yield matches of a bytes pattern over data[start:end] in line-aligned chunks
+
+    Yields None and stops if cancelled() becomes true. progress receives the
+    number of matches yielded so far after each chunk. Regex patterns only
+    yield non-empty matches within one line.
+    """
+    scan = line_matches if is_line_local(pattern) else None
+    count = 0
+    pos = start
+    while pos < end:
+        chunk_end = data.find(b"\n", min(end, pos + SCAN_CHUNK), end)
+        chunk_end = end if chunk_end == -1 else chunk_end
+        if scan is not None:
+            matches = scan(pattern, data, pos, chunk_end, b"\n")
+        else:
+            matches = pattern.finditer(data, pos, chunk_end)
+        for match in matches:
+            count += 1
+            yield match
+        pos = chunk_end + 1
+        if progress:
+            progress(count)
+        if cancelled and cancelled():
+            yield None
+            return
+
+
+def _is_continuation(byte):
+    return 0x80 <= byte < 0xC0
+
+
+def utf8_char_end(data, pos):
+    """Offset just past the UTF-8 character that starts at data[pos]
+
+    Malformed bytes count as one character each, so stepping never stalls.
+    """
+    lead = data[pos]
+    length = 1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    end = pos + 1
+    while end < min(len(data), pos + length) and _is_continuation(data[end]):
+        end += 1
+    return end
+
+
+def utf8_char_start(data, pos):
+    """Offset where the UTF-8 character ending just before data[pos] starts"""
+    start = pos - 1
+    while start > 0 and pos - start < 4 and _is_continuation(data[start]):
+        start -= 1
+    return start
+
+
+def utf8_boundary(data, pos):
+    """Move pos back to the start of the UTF-8 character it falls inside"""
+    start = pos
+    while start > 0 and pos - start < 3 and start < len(data) and _is_continuation(data[start]):
+        start -= 1
+    return start if start < len(data) and not _is_continuation(data[start]) else pos
+
+
+class LargeFile:
+    """Read-only memory-mapped file with an incrementally built line index"""
+
+    INDEX_BATCH = 65536  # newlines collected before publishing to the index
+
+    def __init__(self, path, line_offsets=None):
+        """Map path; line_offsets may hand over an index already built for the same bytes"""
+        self.path = path
+        self._map()
+
+        # Byte offset where each line starts; grows while the index is built
+        if line_offsets is not None:
+            self.line_offsets = line_offsets
+            self.indexed = True
+        else:
+            self.line_offsets = array("q", [0])
+            self.indexed = self.size == 0
+
+    def _map(self):
+        self.size = os.path.getsize(self.path)
+        self._file = open(self.path, "rb")
+        if self.size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._mm = b""
+
+    def reopen(self):
+        """Map the file again after close(), keeping its line index"""
+        self._map()
+
+    @property
+    def line_count(self):
+        """Number of lines indexed so far"""
+        return len(self.line_offsets)
+
+    @property
+    def data(self):
+        """The mapped bytes"""
+        return self._mm
+
+    def build_index(self, progress=None, cancelled=None):
+        """Scan the mapping for newlines, publishing offsets in batches"""
+        find = self._mm.find
+        offsets = self.line_offsets
+        batch = array("q")
+
+        pos = find(b"\n")
+        while pos != -1:
+            batch.append(pos + 1)
+            if len(batch) >= self.INDEX_BATCH:
+                offsets.extend(batch)
+                batch = array("q")
+                if progress:
+                    progress(len(offsets))
+                if cancelled and cancelled():
+                    return False
+            pos = find(b"\n", pos + 1)
+
+        offsets.extend(batch)
+        self.indexed = True
+        if progress:
+            progress(len(offsets))
+        return True
+
+    def line_start(self, line):
+        """Byte offset where a line starts"""
+        return self.line_offsets[line]
+
+    def line_span(self, line):
+        """Return the (start, end) byte range of a line, excluding its newline"""
+        start = self.line_offsets[line]
+        if line + 1 < len(self.line_offsets):
+            end = self.line_offsets[line + 1] - 1
+        elif self.indexed:
+            end = self.size
+        else:
+            end = self._mm.find(b"\n", start)
+            if end == -1:
+                end = self.size
+        if end > start and self._mm[end - 1 : end] == b"\r":
+            end -= 1
+        return start, end
+
+    def line_bytes(self, line, max_bytes=None):
+        """Raw bytes of a line, optionally truncated"""
+        start, end = self.line_span(line)
+        if max_bytes is not None:
+            end = min(end, start + max_bytes)
+        return self._mm[start:end]
+
+    def line_text(self, line, max_bytes=None):
+        """Decoded text of a line"""
+        return self.line_bytes(line, max_bytes).decode("utf-8", errors="replace")
+
+    def line_at_offset(self, offset):
+        """Line number containing a byte offset"""
+        return max(0, bisect_right(self.line_offsets, offset) - 1)
+
+    @staticmethod
+    def compile_pattern(text, case_sensitive=False, whole_word=False, regex=False):
+        """Compile a search term into a bytes regex"""
+        return compile_search_pattern(text.encode("utf-8"), case_sensitive, whole_word, regex)
+
+    def find_all(self, pattern, progress=None, cancelled=None, into=None):
+        """Return parallel arrays of match start and end byte offsets
+
+        into may pass the (starts, ends) arrays to fill, so another thread can
+        read the matches found so far. Returns None if cancelled() became true
+        during the scan.
+        """
+        starts, ends = into if into is not None else (array("q"), array("q"))
+        for match in iter_matches(pattern, self._mm, 0, self.size, progress, cancelled):
+            if match is None:
+                return None
+            starts.append(match.start())
+            ends.append(match.end())
+        return starts, ends
+
+    def scan_job(self, pattern):
+        """Child-process target and arguments that run find_all on this file"""
+        return scan_file, (self.path, pattern)
+
+    def close(self):
+        """Release the mapping and file handle"""
+        try:
+            if isinstance(self._mm, mmap.mmap):
+                self._mm.close()
+            self._file.close()
+        except Exception as e:
+            print(f"Error closing large file: {e}")
+
+
+def scan_file(path, pattern):
+    """Child-process target: find_all over a freshly mapped copy of path"""
+    large_file = LargeFile(path)
+    try:
+        return large_file.find_all(pattern)
+    finally:
+        large_file.close()
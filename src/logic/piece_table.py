@@ -0,0 +1,352 @@
+"""
+Glassnotes Piece Table
+Editable byte buffer layered over a memory-mapped LargeFile plus an append buffer
+"""
+
+from array import array
+from bisect import bisect_right
+
+from src.logic.large_file import SCAN_CHUNK, LargeFile, iter_matches
+
+
+ORIGINAL = 0
+ADD = 1
+
+
+class Piece:
+    """A run of bytes taken from either the original mapping or the add buffer"""
+
+    __slots__ = ("source", "start", "length", "newlines")
+
+    def __init__(self, source, start, length, newlines):
+        self.source = source
+        self.start = start
+        self.length = length
+        self.newlines = newlines
+
+
+class PieceTable:
+    """Piece table with its own undo/redo history and streaming save
+
+    Offsets are byte offsets into the UTF-8 encoded document. The original
+    LargeFile must be fully indexed, its newline offsets are reused to count
+    and locate lines inside original pieces without touching the bytes.
+    """
+
+    WRITE_CHUNK = 8 * 1024 * 1024
+
+    def __init__(self, large_file):
+        self._original = large_file
+        self._add = bytearray()
+        self.size = large_file.size
+        self.pieces = []
+        if self.size:
+            self.pieces.append(
+                Piece(ORIGINAL, 0, self.size, self._count_newlines(ORIGINAL, 0, self.size))
+            )
+        self._newlines = sum(p.newlines for p in self.pieces)
+        self._undo_stack = []
+        self._redo_stack = []
+        self._journal = None  # edits since start_journal, replayed by rebased
+
+    # -------------------------------------------------------------------------
+    # Piece helpers
+    # -------------------------------------------------------------------------
+
+    def _source(self, source):
+        return self._original.data if source == ORIGINAL else self._add
+
+    def _count_newlines(self, source, start, length):
+        if source == ORIGINAL:
+            offsets = self._original.line_offsets
+            return bisect_right(offsets, start + length) - bisect_right(offsets, start)
+        return self._add.count(b"\n", start, start + length)
+
+    def _make_piece(self, source, start, length):
+        return Piece(source, start, length, self._count_newlines(source, start, length))
+
+    def _nth_newline_end(self, piece, n):
+        """Offset within a piece just past its n-th (1-based) newline"""
+        if piece.source == ORIGINAL:
+            offsets = self._original.line_offsets
+            first = bisect_right(offsets, piece.start)
+            return offsets[first + n - 1] - piece.start
+
+        pos = piece.start - 1
+        for _ in range(n):
+            pos = self._add.find(b"\n", pos + 1, piece.start + piece.length)
+        return pos + 1 - piece.start
+
+    def _split_at(self, offset):
+        """Ensure a piece boundary at offset, returning the index of the piece after it"""
+        pos = 0
+        for index, piece in enumerate(self.pieces):
+            if offset == pos:
+                return index
+            if offset < pos + piece.length:
+                rel = offset - pos
+                left = self._make_piece(piece.source, piece.start, rel)
+                right = Piece(
+                    piece.source,
+                    piece.start + rel,
+                    piece.length - rel,
+                    piece.newlines - left.newlines,
+                )
+                self.pieces[index : index + 1] = [left, right]
+                return index + 1
+            pos += piece.length
+        return len(self.pieces)
+
+    # -------------------------------------------------------------------------
+    # Editing
+    # -------------------------------------------------------------------------
+
+    def insert(self, offset, data, record=True):
+        """Insert bytes at a document offset"""
+        if not data:
+            return
+        add_start = len(self._add)
+        self._add += data
+        newlines = data.count(b"\n")
+
+        index = self._split_at(offset)
+        previous = self.pieces[index - 1] if index > 0 else None
+        if (
+            previous is not None
+            and previous.source == ADD
+            and previous.start + previous.length == add_start
+        ):
+            # Consecutive typing extends the last add piece instead of growing the table
+            previous.length += len(data)
+            previous.newlines += newlines
+        else:
+            self.pieces.insert(index, Piece(ADD, add_start, len(data), newlines))
+
+        self.size += len(data)
+        self._newlines += newlines
+        if self._journal is not None:
+            self._journal.append(("insert", offset, bytes(data)))
+        if record:
+            self._undo_stack.append(("insert", offset, bytes(data)))
+            self._redo_stack.clear()
+
+    def delete(self, offset, length, record=True):
+        """Delete a byte range, returning the removed bytes"""
+        length = min(length, self.size - offset)
+        if length <= 0:
+            return b""
+        removed = self.read(offset, length)
+
+        first = self._split_at(offset)
+        last = self._split_at(offset + length)
+        newlines = sum(p.newlines for p in self.pieces[first:last])
+        del self.pieces[first:last]
+
+        self.size -= length
+        self._newlines -= newlines
+        if self._journal is not None:
+            self._journal.append(("delete", offset, removed))
+        if record:
+            self._undo_stack.append(("delete", offset, removed))
+            self._redo_stack.clear()
+        return removed
+
+    def _apply(self, op, offset, data):
+        if op == "insert":
+            self.insert(offset, data, record=False)
+            return offset + len(data)
+        self.delete(offset, len(data), record=False)
+        return offset
+
+    def undo(self):
+        """Revert the last edit, returning the caret offset or None"""
+        if not self._undo_stack:
+            return None
+        op, offset, data = self._undo_stack.pop()
+        self._redo_stack.append((op, offset, data))
+        return self._apply("delete" if op == "insert" else "insert", offset, data)
+
+    def redo(self):
+        """Re-apply the last undone edit, returning the caret offset or None"""
+        if not self._redo_stack:
+            return None
+        op, offset, data = self._redo_stack.pop()
+        self._undo_stack.append((op, offset, data))
+        return self._apply(op, offset, data)
+
+    def start_journal(self):
+        """Record every edit from now on so the document can be rebased"""
+        self._journal = []
+
+    def stop_journal(self):
+        self._journal = None
+
+    def rebased(self, large_file):
+        """A table over large_file, which holds this document as it was at start_journal
+
+        Edits made since are replayed on top, and the undo/redo history
+        carries over since it is kept as byte offsets into the document text.
+        """
+        table = PieceTable(large_file)
+        for op, offset, data in self._journal or ():
+            table._apply(op, offset, data)
+        table._undo_stack = self._undo_stack
+        table._redo_stack = self._redo_stack
+        self._journal = None
+        return table
+
+    # -------------------------------------------------------------------------
+    # Reading (same surface as LargeFile so the viewer can render either)
+    # -------------------------------------------------------------------------
+
+    @property
+    def line_count(self):
+        return self._newlines + 1
+
+    def read(self, offset, length):
+        """Read a byte range of the document"""
+        chunks = []
+        end = offset + length
+        pos = 0
+        for piece in self.pieces:
+            piece_end = pos + piece.length
+            if piece_end > offset and pos < end:
+                lo = max(offset, pos) - pos + piece.start
+                hi = min(end, piece_end) - pos + piece.start
+                chunks.append(self._source(piece.source)[lo:hi])
+            if piece_end >= end:
+                break
+            pos = piece_end
+        return b"".join(chunks)
+
+    def line_start(self, line):
+        """Byte offset where a line starts"""
+        if line <= 0:
+            return 0
+        remaining = line
+        pos = 0
+        for piece in self.pieces:
+            if piece.newlines >= remaining:
+                return pos + self._nth_newline_end(piece, remaining)
+            remaining -= piece.newlines
+            pos += piece.length
+        return self.size
+
+    def line_span(self, line):
+        """Return the (start, end) byte range of a line, excluding its newline"""
+        start = self.line_start(line)
+        if line + 1 < self.line_count:
+            end = self.line_start(line + 1) - 1
+        else:
+            end = self.size
+        if end > start and self.read(end - 1, 1) == b"\r":
+            end -= 1
+        return start, end
+
+    def line_bytes(self, line, max_bytes=None):
+        """Raw bytes of a line, optionally truncated"""
+        start, end = self.line_span(line)
+        if max_bytes is not None:
+            end = min(end, start + max_bytes)
+        return self.read(start, end - start)
+
+    def line_text(self, line, max_bytes=None):
+        """Decoded text of a line"""
+        return self.line_bytes(line, max_bytes).decode("utf-8", errors="replace")
+
+    def line_at_offset(self, offset):
+        """Line number containing a byte offset"""
+        line = 0
+        pos = 0
+        for piece in self.pieces:
+            if offset < pos + piece.length:
+                return line + self._count_newlines(piece.source, piece.start, offset - pos)
+            line += piece.newlines
+            pos += piece.length
+        return line
+
+    def _line_windows(self):
+        """Yield (offset, data, skip) runs of whole lines covering the document
+
+        data is contiguous document text starting at offset; the first skip
+        bytes are the newline before the run, kept so patterns see the same
+        context as in a scan of the whole document. Runs end after a newline,
+        so no line-local match can straddle two of them.
+        """
+        lo = 0
+        while lo < self.size:
+            skip = 1 if lo else 0
+            data = self.read(lo - skip, skip + SCAN_CHUNK)
+            if lo - skip + len(data) < self.size:
+                cut = data.rfind(b"\n", skip)
+                if cut != -1:
+                    data = data[: cut + 1]
+                else:
+                    # A line longer than a chunk is read up to its end
+                    parts = [data]
+                    hi = lo - skip + len(data)
+                    while hi < self.size:
+                        extra = self.read(hi, SCAN_CHUNK)
+                        cut = extra.find(b"\n")
+                        if cut != -1:
+                            extra = extra[: cut + 1]
+                        parts.append(extra)
+                        hi += len(extra)
+                        if cut != -1:
+                            break
+                    data = b"".join(parts)
+            yield lo - skip, data, skip
+            lo += len(data) - skip
+
+    def find_all(self, pattern, progress=None, cancelled=None, into=None):
+        """Return parallel arrays of match start and end byte offsets
+
+        The pieces are scanned as contiguous text, so anchors and word
+        boundaries only match where they would in the saved file. into may
+        pass the (starts, ends) arrays to fill, so another thread can read
+        the matches found so far. Returns None if cancelled() became true
+        during the scan.
+        """
+        starts, ends = into if into is not None else (array("q"), array("q"))
+        for offset, data, skip in self._line_windows():
+            for match in iter_matches(pattern, data, skip, len(data), cancelled=cancelled):
+                if match is None:
+                    return None
+                starts.append(offset + match.start())
+                ends.append(offset + match.end())
+            if progress:
+                progress(len(starts))
+            if cancelled and cancelled():
+                return None
+        return starts, ends
+
+    def scan_job(self, pattern):
+        """Child-process target and arguments that run find_all on this document
+
+        Only the piece layout and the append buffer are sent; the child maps
+        the original file itself.
+        """
+        layout = [(p.source, p.start, p.length) for p in self.pieces]
+        return scan_layout, (self._original.path, layout, bytes(self._add), pattern)
+
+    def write_to(self, f):
+        """Stream the document to a binary file object piece by piece"""
+        for piece in self.pieces:
+            source = self._source(piece.source)
+            end = piece.start + piece.length
+            for lo in range(piece.start, end, self.WRITE_CHUNK):
+                f.write(source[lo : min(end, lo + self.WRITE_CHUNK)])
+
+
+def scan_layout(path, layout, add, pattern):
+    """Child-process target: find_all over a piece table rebuilt from scan_job"""
+    large_file = LargeFile(path)
+    try:
+        # find_all and read only need the pieces, not their newline counts
+        table = PieceTable(large_file)
+        table._add = bytearray(add)
+        table.pieces = [Piece(source, start, length, 0) for source, start, length in layout]
+        table.size = sum(length for _, _, length in layout)
+        return table.find_all(pattern)
+    finally:
+        large_file.close()
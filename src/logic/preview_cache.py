@@ -0,0 +1,77 @@
+"""
+Glassnotes Preview Cache
+Note previews keyed by file identity, bounded by a byte budget
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
+class PreviewCache:
+    """Least-recently-used previews, invalidated by mtime and size
+
+    An entry is only served while the file's mtime_ns and size still match
+    the values it was read at, so edits made outside the app are picked up
+    without anyone having to clear the cache. Safe to use from worker threads.
+    """
+
+    BYTE_BUDGET = 4 * 1024 * 1024  # memory held by cached preview strings
+
+    def __init__(self, byte_budget=None):
+        self._budget = byte_budget or self.BYTE_BUDGET
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (path, max_bytes) -> (mtime_ns, size, text, cost)
+        self._used = 0
+
+    def _evict(self):
+        while self._used > self._budget and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._used -= entry[3]
+
+    def get(self, path, max_bytes=200):
+        """Preview of path, read from disk only if the cached copy is outdated"""
+        path = str(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.discard(path)
+            return ""
+        key = (path, max_bytes)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                text = f.read(max_bytes)
+        except Exception:
+            return ""
+
+        cost = sys.getsizeof(text) + sys.getsizeof(path)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._used -= old[3]
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, text, cost)
+            self._used += cost
+            self._evict()
+        return text
+
+    def discard(self, path):
+        """Drop every cached preview of path"""
+        path = str(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._used -= self._entries.pop(key)[3]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used = 0
+
+
+preview_cache = PreviewCache()
@@ -0,0 +1,86 @@
+"""
+Glassnotes Workspace Scanner
+Recursive note discovery with os.scandir, walking sibling directories in parallel
+"""
+
+import os
+from fnmatch import fnmatch
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from src.logic.config import Config, config
+
+
+class WorkspaceScanner:
+    """Finds every supported text file under a directory tree
+
+    Each directory is listed once with os.scandir on a thread pool, so
+    sibling directories are read concurrently; the listing syscalls release
+    the GIL. Files are returned as the DirEntry objects scandir produced,
+    whose cached stat() is free on Windows and costs a single call elsewhere.
+    Symlinked directories are not followed, so links cannot cause cycles.
+    """
+
+    MAX_WORKERS = 4  # directories listed at once
+    # Matched against file and directory names; overridden by the
+    # scan_ignore_patterns setting
+    DEFAULT_IGNORE = [".*", "node_modules", "__pycache__", "venv"]
+
+    @staticmethod
+    def _ignored(name, patterns):
+        return any(fnmatch(name, pattern) for pattern in patterns)
+
+    def _scan_dir(self, directory, patterns):
+        """(note DirEntries, subdirectory paths) of one directory"""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if self._ignored(entry.name, patterns):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(Config.SUPPORTED_TEXT_FORMATS) and entry.is_file():
+                            files.append(entry)
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+        return files, subdirs
+
+    def walk(self, root, ignore=None, cancelled=None):
+        """Generator of DirEntry lists, one per directory with notes, in the order found
+
+        ignore lists fnmatch patterns of names to skip along with everything
+        below them. Stops early once cancelled() becomes true.
+        """
+        if not os.path.isdir(root):
+            return
+        if ignore is None:
+            ignore = config.get("scan_ignore_patterns", self.DEFAULT_IGNORE)
+        patterns = list(ignore)
+
+        pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        try:
+            pending = {pool.submit(self._scan_dir, str(root), patterns)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending.add(pool.submit(self._scan_dir, subdir, patterns))
+                    if files:
+                        yield files
+                if cancelled and cancelled():
+                    return
+        finally:
+            # Also reached when the caller stops iterating early
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def list_files(self, root, ignore=None):
+        """Paths of every note under root, sorted"""
+        return sorted(entry.path for batch in self.walk(root, ignore) for entry in batch)
+
+
+workspace_scanner = WorkspaceScanner()
@@ -0,0 +1,489 @@
+"""
+Glassnotes Search Session
+Sorted match index with bisect navigation and line-local repair after edits
+"""
+
+import re
+import time
+import threading
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+
+
+# Outcomes of run_isolated
+DONE = "done"
+CANCELLED = "cancelled"
+TIMEOUT = "timeout"
+FAILED = "failed"
+
+
+@lru_cache(maxsize=64)
+def compile_search_pattern(text, case_sensitive=False, whole_word=False, regex=False):
+    """Compile a search term, reusing patterns across searches, F3 presses and tabs
+
+    Regex terms are compiled with MULTILINE so ^ and $ anchor at line breaks;
+    that flag also marks the pattern as one whose matches must be filtered to
+    a single line. Raises re.error for an invalid regex.
+    """
+    pattern = text if regex else re.escape(text)
+    if whole_word:
+        template = rb"\b(?:%s)\b" if isinstance(text, bytes) else r"\b(?:%s)\b"
+        pattern = template % pattern
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if regex:
+        flags |= re.MULTILINE
+    return re.compile(pattern, flags)
+
+
+def is_line_local(pattern):
+    """Whether matches of a compiled search pattern are confined to single lines"""
+    return bool(pattern.flags & re.MULTILINE)
+
+
+def line_matches(pattern, content, pos=0, endpos=None, newline="\n"):
+    """Non-empty matches of pattern in content[pos:endpos], each within one line
+
+    The range is scanned in one finditer pass; a match that runs into a
+    newline is not dropped but retried on its own line, with the line end
+    as the end of the string, so a word followed by optional whitespace is
+    still found at the end of a line.
+    content may be str or bytes, with newline of the same type.
+    """
+    end = len(content) if endpos is None else endpos
+    while pos < end:
+        for match in pattern.finditer(content, pos, end):
+            if match.end() == match.start():
+                continue
+            if newline not in match.group():
+                yield match
+                continue
+            line_end = content.find(newline, match.start(), end)
+            for clipped in pattern.finditer(content, match.start(), line_end):
+                if clipped.end() > clipped.start():
+                    yield clipped
+            pos = line_end + 1
+            break
+        else:
+            return
+
+
+def jump_index(starts, count, anchor, forward=True, wrap=True, final=True, inclusive=True):
+    """Index of the match a find next/previous from anchor lands on
+
+    Only the first count entries of starts are considered, so this can be
+    asked while a scan is still filling them in; until final it returns
+    None when the matches found so far cannot decide the answer yet.
+    Returns -1 when there is no match to land on. inclusive lets a forward
+    search land on a match starting exactly at anchor.
+    """
+    if forward:
+        index = (bisect_left if inclusive else bisect_right)(starts, anchor, 0, count)
+        if index < count:
+            return index
+    else:
+        # Every match before anchor is known once one at or after it has been found
+        index = bisect_left(starts, anchor, 0, count)
+        if index > 0 and (index < count or final):
+            return index - 1
+    if not final:
+        return None
+    if not count or not wrap:
+        return -1
+    return 0 if forward else count - 1
+
+
+def _isolated_loop(conn):
+    """Child-process main loop: run each (target, args) received and send back its outcome"""
+    while True:
+        try:
+            target, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            outcome = (DONE, target(*args))
+        except Exception as e:
+            outcome = (FAILED, str(e))
+        try:
+            conn.send(outcome)
+        except Exception as e:
+            conn.send((FAILED, str(e)))
+
+
+class _IsolatedProcess:
+    """Spawned child process that runs targets one at a time until it is killed"""
+
+    def __init__(self):
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_isolated_loop, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def close(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+
+# Children that finished their last run, reused so a search costs no interpreter start
+_idle_processes = []
+_idle_lock = threading.Lock()
+MAX_IDLE_PROCESSES = 2
+
+
+def _take_process():
+    with _idle_lock:
+        while _idle_processes:
+            child = _idle_processes.pop()
+            if child.process.is_alive():
+                return child
+            child.close()
+    return _IsolatedProcess()
+
+
+def _return_process(child):
+    with _idle_lock:
+        if len(_idle_processes) < MAX_IDLE_PROCESSES:
+            _idle_processes.append(child)
+            return
+    child.close()
+
+
+def run_isolated(target, args, timeout, cancelled=None):
+    """Run target(*args) in a child process under a time budget
+
+    The regex engine holds the GIL for the length of a single match, so a
+    catastrophically backtracking pattern can only be stopped by killing the
+    process running it. Children are kept alive between runs and only
+    killed when a run is cancelled or times out. Returns (status, result)
+    where status is DONE, CANCELLED, TIMEOUT or FAILED (with the error
+    message as result).
+    """
+    child = _take_process()
+    deadline = time.monotonic() + timeout
+    finished = False
+    try:
+        child.conn.send((target, args))
+        while not child.conn.poll(0.05):
+            if cancelled and cancelled():
+                return CANCELLED, None
+            if time.monotonic() > deadline:
+                return TIMEOUT, None
+            if not child.process.is_alive() and not child.conn.poll():
+                return FAILED, "search process exited"
+        outcome = child.conn.recv()
+        finished = True
+        return outcome
+    except (EOFError, OSError):
+        return FAILED, "search process exited"
+    finally:
+        if finished:
+            _return_process(child)
+        else:
+            child.close()
+
+
+def _scan_text(pattern, content):
+    """Child-process target: every line-local match of pattern in content"""
+    starts = []
+    ends = []
+    for match in line_matches(pattern, content):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
+
+def line_hits(content, starts, ends, limit=None, preview_chars=160):
+    """Describe matches as (line, column, start, end, preview) tuples
+
+    Lines and columns are 0-based; the preview is the match's line trimmed
+    to preview_chars around the match. At most limit hits are returned.
+    """
+    hits = []
+    line = 0
+    line_start = 0
+    scanned = 0
+    for start, end in zip(starts, ends):
+        if limit is not None and len(hits) >= limit:
+            break
+        newlines = content.count("\n", scanned, start)
+        if newlines:
+            line += newlines
+            line_start = content.rfind("\n", scanned, start) + 1
+        scanned = start
+        line_end = content.find("\n", start)
+        line_end = len(content) if line_end == -1 else line_end
+        column = start - line_start
+        lo = max(line_start, start - preview_chars // 4)
+        preview = content[lo : min(line_end, lo + preview_chars)].strip()
+        hits.append((line, column, start, end, preview))
+    return hits
+
+
+class SearchSession:
+    """Matches of one search term, kept sorted by start offset
+
+    Search terms never span a newline, so an edit can only create or destroy
+    matches on the lines it touches. apply_edit rescans just those lines and
+    shifts the offsets of everything after them.
+    """
+
+    CHUNK_SIZE = 1024 * 1024  # characters scanned between progress/cancel checks
+    REGEX_TIME_BUDGET = 3.0  # seconds, used when no budget is passed explicitly
+
+    def __init__(self, text, case_sensitive=False, whole_word=False, regex=False):
+        self.text = text
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        self.regex = regex
+        self.pattern = compile_search_pattern(text, case_sensitive, whole_word, regex)
+        self.starts = []
+        self.ends = []
+        self.stale = None  # (start, end) of edited text not rescanned yet, see drop_edit
+
+    @property
+    def key(self):
+        """Identity of the search, used to decide whether a session can be reused"""
+        return (self.text, self.case_sensitive, self.whole_word, self.regex)
+
+    def _finditer(self, content, pos=0, end=None):
+        if self.regex:
+            return line_matches(self.pattern, content, pos, end)
+        return self.pattern.finditer(content, pos, len(content) if end is None else end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def rebuild(self, content, progress=None, cancelled=None):
+        """Index every match in the document text
+
+        The text is scanned in line-aligned chunks; between chunks progress
+        receives the running match count and cancelled may abort the scan.
+        Returns False if the scan was cancelled.
+        """
+        if self.regex:
+            # Arbitrary patterns may backtrack without end, so they run in a child process
+            status, _ = self.rebuild_isolated(content, self.REGEX_TIME_BUDGET, cancelled)
+            return status == DONE
+        self.starts = []
+        self.ends = []
+        pos = 0
+        length = len(content)
+        while pos < length:
+            end = content.find("\n", min(length, pos + self.CHUNK_SIZE))
+            end = length if end == -1 else end
+            for match in self._finditer(content, pos, end):
+                self.starts.append(match.start())
+                self.ends.append(match.end())
+            pos = end + 1
+            if progress:
+                progress(len(self.starts))
+            if cancelled and cancelled():
+                return False
+        return True
+
+    def rebuild_isolated(self, content, timeout, cancelled=None):
+        """Index every match in a child process killed after timeout seconds
+
+        Returns the run_isolated status and, for FAILED, the error message.
+        The index is left empty unless the status is DONE.
+        """
+        self.starts = []
+        self.ends = []
+        status, result = run_isolated(_scan_text, (self.pattern, content), timeout, cancelled)
+        if status == DONE:
+            self.starts, self.ends = result
+            return status, None
+        return status, result
+
+    def can_narrow_from(self, previous):
+        """Whether every match of this search starts at an occurrence found by previous
+
+        Holds when previous is a literal, not whole-word search for a prefix
+        of this term that cannot overlap itself, so its finditer pass saw
+        every occurrence in the text.
+        """
+        if self.regex or previous.regex or previous.whole_word:
+            return False
+        if previous.case_sensitive != self.case_sensitive:
+            return False
+        prefix, term = previous.text, self.text
+        if not self.case_sensitive:
+            prefix, term = prefix.lower(), term.lower()
+        if len(prefix) >= len(term) or not term.startswith(prefix):
+            return False
+        return not any(prefix[i:] == prefix[: len(prefix) - i] for i in range(1, len(prefix)))
+
+    def narrow(self, previous, content):
+        """Index matches by verifying the positions previous found instead of rescanning"""
+        self.starts = []
+        self.ends = []
+        last_end = 0
+        match_at = self.pattern.match
+        for start in previous.starts:
+            if start < last_end:
+                continue
+            match = match_at(content, start)
+            if match:
+                self.starts.append(start)
+                self.ends.append(match.end())
+                last_end = match.end()
+
+    def apply_edit(self, region_start, old_region_end, region_text):
+        """Repair the index after an edit confined to whole lines
+
+        region_start is where the first touched line begins, old_region_end is
+        where the last touched line ended before the edit, and region_text is
+        the new text of the touched lines.
+        """
+        new_starts = []
+        new_ends = []
+        for match in self._finditer(region_text):
+            new_starts.append(region_start + match.start())
+            new_ends.append(region_start + match.end())
+        self._splice(region_start, old_region_end, len(region_text), new_starts, new_ends)
+
+    def _splice(self, region_start, old_region_end, new_length, new_starts, new_ends):
+        """Replace the matches of an edited region and shift the ones after it"""
+        delta = region_start + new_length - old_region_end
+        lo = bisect_left(self.starts, region_start)
+        hi = bisect_right(self.starts, old_region_end)
+
+        tail_starts = self.starts[hi:]
+        tail_ends = self.ends[hi:]
+        if delta:
+            tail_starts = [start + delta for start in tail_starts]
+            tail_ends = [end + delta for end in tail_ends]
+
+        self.starts[lo:] = new_starts + tail_starts
+        self.ends[lo:] = new_ends + tail_ends
+
+    def drop_edit(self, region_start, old_region_end, new_length):
+        """Repair the index after an edit without running the pattern
+
+        For patterns too risky to run on the UI thread: matches on the
+        touched lines are dropped, the ones after them are shifted, and the
+        touched lines join the stale range until fill_stale supplies their
+        matches. Arguments are as for apply_edit, with the new text's length.
+        """
+        self._splice(region_start, old_region_end, new_length, [], [])
+        delta = region_start + new_length - old_region_end
+        region_end = region_start + new_length
+        if self.stale is not None:
+            start, end = self.stale
+            if start > region_start:
+                start = start + delta if start >= old_region_end else region_start
+            if end > region_start:
+                end = end + delta if end >= old_region_end else region_end
+            region_start, region_end = min(start, region_start), max(end, region_end)
+        self.stale = (region_start, region_end)
+
+    def fill_stale(self, region_start, region_end, starts, ends):
+        """Index the matches found by rescanning whole lines covering the stale range"""
+        lo = bisect_left(self.starts, region_start)
+        hi = bisect_left(self.starts, region_end)
+        self.starts[lo:hi] = starts
+        self.ends[lo:hi] = ends
+        self.stale = None
+
+    def match_at(self, content, index):
+        """Run the pattern again at match index of content, or None if it no longer matches there
+
+        content is the whole text, so lookbehinds and word boundaries see what
+        they saw during the scan. A regex match clipped to its line is re-run
+        with the line end as the end of the string, as line_matches found it.
+        """
+        start, end = self.starts[index], self.ends[index]
+        if self.regex and "\n" in content[start:end]:
+            return None
+        match = self.pattern.match(content, start)
+        if self.regex and (match is None or match.end() != end):
+            line_end = content.find("\n", start)
+            match = self.pattern.match(content, start, len(content) if line_end == -1 else line_end)
+        if match is None or match.end() != end:
+            return None
+        return match
+
+    def next_index(self, position, inclusive=False, wrap=True):
+        """Index of the first match starting after (or at) position, or -1"""
+        if not self.starts:
+            return -1
+        if inclusive:
+            index = bisect_left(self.starts, position)
+        else:
+            index = bisect_right(self.starts, position)
+        if index >= len(self.starts):
+            return 0 if wrap else -1
+        return index
+
+    def previous_index(self, position, wrap=True):
+        """Index of the last match starting before position, or -1"""
+        if not self.starts:
+            return -1
+        index = bisect_left(self.starts, position) - 1
+        if index < 0:
+            return len(self.starts) - 1 if wrap else -1
+        return index
+
+    def index_at(self, start):
+        """Index of the match starting exactly at start, or -1"""
+        index = bisect_left(self.starts, start)
+        if index < len(self.starts) and self.starts[index] == start:
+            return index
+        return -1
+
+
+class SearchCache:
+    """Recent search sessions for one unchanged document revision
+
+    Retyping or backspacing to an earlier term reuses its session outright,
+    and extending a term only re-verifies the matches of its longest cached
+    prefix. Any edit invalidates every entry.
+    """
+
+    MAX_ENTRIES = 16
+    NARROW_LIMIT = 200000  # above this many candidates a fresh C-level scan is faster
+
+    def __init__(self):
+        self._sessions = OrderedDict()
+        self._revision = None
+
+    def invalidate(self):
+        """Drop every cached session"""
+        self._sessions.clear()
+        self._revision = None
+
+    def get(self, key, revision):
+        """Return the cached session for a search key, or None"""
+        if revision != self._revision:
+            self.invalidate()
+            return None
+        session = self._sessions.get(key)
+        if session is not None:
+            self._sessions.move_to_end(key)
+        return session
+
+    def narrowing_base(self, session, revision):
+        """Return the cached session with the longest term session can narrow from"""
+        if revision != self._revision:
+            return None
+        best = None
+        for cached in self._sessions.values():
+            if len(cached) > self.NARROW_LIMIT or not session.can_narrow_from(cached):
+                continue
+            if best is None or len(cached.text) > len(best.text):
+                best = cached
+        return best
+
+    def put(self, session, revision):
+        """Remember a completed session for the given document revision"""
+        if revision != self._revision:
+            self.invalidate()
+            self._revision = revision
+        self._sessions[session.key] = session
+        self._sessions.move_to_end(session.key)
+        while len(self._sessions) > self.MAX_ENTRIES:
+            self._sessions.popitem(last=False)
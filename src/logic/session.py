@@ -0,0 +1,97 @@
+"""
+Glassnotes Session Store
+Persists open tabs and unsaved tab backups separately from user settings
+"""
+
+import os
+import json
+from pathlib import Path
+
+from src.logic.config import Config, config
+
+
+class SessionStore:
+    """Session state manager with atomic, change-only writes"""
+
+    SESSION_FILE = Config.APP_DIR / "session.json"
+    BACKUP_DIR = Config.BACKUP_DIR
+
+    def __init__(self):
+        self._last_written = None
+        self.tabs = self._load()
+
+    def _load(self):
+        """Load session tabs, migrating the legacy list from config.json"""
+        if self.SESSION_FILE.exists():
+            try:
+                with open(self.SESSION_FILE, "r", encoding="utf-8") as f:
+                    tabs = json.load(f).get("tabs", [])
+                    self._last_written = tabs
+                    return tabs
+            except Exception as e:
+                print(f"Error loading session: {e}")
+                return []
+
+        # Older versions stored the session inside the user settings
+        legacy_tabs = config.settings.pop("session_tabs", None)
+        if legacy_tabs is not None:
+            config.save()
+        return legacy_tabs or []
+
+    @staticmethod
+    def _write_atomic(path, text):
+        """Write to a sibling temp file and swap it in, so a crash never truncates"""
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def backup_path(self, tab_id):
+        """Path of the backup file holding an unsaved tab's content"""
+        return self.BACKUP_DIR / f"tab_{tab_id}.txt"
+
+    def write_backup(self, tab_id, content):
+        """Write an unsaved tab's content, returning the backup path"""
+        path = self.backup_path(tab_id)
+        try:
+            self._write_atomic(path, content)
+            return str(path)
+        except Exception as e:
+            print(f"Error writing backup: {e}")
+            return None
+
+    def remove_backup(self, tab_id):
+        """Delete an unsaved tab's backup if it exists"""
+        try:
+            self.backup_path(tab_id).unlink(missing_ok=True)
+        except Exception as e:
+            print(f"Error removing backup: {e}")
+
+    def prune_backups(self, keep_ids):
+        """Delete backups that no longer belong to an open tab"""
+        keep = {self.backup_path(tab_id).name for tab_id in keep_ids}
+        try:
+            for entry in os.scandir(self.BACKUP_DIR):
+                if (
+                    entry.name.startswith("tab_")
+                    and entry.name.endswith(".txt")
+                    and entry.name not in keep
+                ):
+                    os.remove(entry.path)
+        except Exception as e:
+            print(f"Error pruning backups: {e}")
+
+    def save(self, tabs):
+        """Persist the tab list, skipping the write when nothing changed"""
+        self.tabs = tabs
+        if tabs == self._last_written:
+            return
+        try:
+            self._write_atomic(self.SESSION_FILE, json.dumps({"tabs": tabs}))
+            self._last_written = [dict(tab) for tab in tabs]
+        except Exception as e:
+            print(f"Error saving session: {e}")
+
+
+# Global session instance
+session_store = SessionStore()
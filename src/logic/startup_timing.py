@@ -0,0 +1,60 @@
+"""
+Glassnotes Startup Timing
+Measures how long the app takes to reach its first interactive frame
+"""
+
+import json
+import time
+from datetime import datetime
+
+from src.logic.config import Config
+
+
+class StartupTimer:
+    """Milestones from app start to the first interactive frame
+
+    The clock starts when this module is first imported, which main.py
+    does before any UI module. finish() appends the total, with the
+    milestones, to a log so regressions show up across runs.
+    """
+
+    LOG_FILE = Config.APP_DIR / "startup.log"
+    MAX_LOG_LINES = 200  # older runs are dropped from the log
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._marks = {}
+        self._finished = False
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self._started) * 1000
+
+    def mark(self, name):
+        """Record the time a startup milestone was reached; later marks of a name are ignored"""
+        if not self._finished:
+            self._marks.setdefault(name, round(self.elapsed_ms(), 1))
+
+    def finish(self):
+        """Record the first interactive frame; only the first call counts"""
+        if self._finished:
+            return
+        total = round(self.elapsed_ms(), 1)
+        self._finished = True
+        self._append_log({
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "first_interactive_ms": total,
+            "marks": self._marks,
+        })
+
+    def _append_log(self, record):
+        try:
+            lines = []
+            if self.LOG_FILE.exists():
+                lines = self.LOG_FILE.read_text(encoding="utf-8").splitlines()
+            lines.append(json.dumps(record))
+            self.LOG_FILE.write_text("\n".join(lines[-self.MAX_LOG_LINES:]) + "\n", encoding="utf-8")
+        except OSError as e:
+            print(f"[Startup] Could not write timing log: {e}")
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,290 @@
+"""
+Glassnotes Trigram Index
+On-disk trigram posting lists for substring search across all notes
+"""
+
+import os
+import json
+import mmap
+import struct
+import threading
+from array import array
+from pathlib import Path
+
+from src.logic.config import Config
+from src.logic.corpus import index_key, trigrams_of
+
+
+def match_snippet(text, start, length, width=120):
+    """The line around a match, trimmed to width characters"""
+    line_start = text.rfind("\n", 0, start) + 1
+    line_end = text.find("\n", start + length)
+    line_end = len(text) if line_end == -1 else line_end
+    lo = max(line_start, start - width // 4)
+    return text[lo : min(line_end, lo + width)].strip()
+
+
+def _unlowered_index(text, index):
+    """Map an index in text.lower() back to text
+
+    A few characters such as "\u0130" grow when lowercased, so positions in
+    the lowered copy can run ahead of the original.
+    """
+    pos = 0
+    for i, char in enumerate(text):
+        if pos >= index:
+            return i
+        pos += len(char.lower())
+    return len(text)
+
+
+class TrigramIndex:
+    """Substring search that only reads files containing every trigram of the query
+
+    Posting lists of file ids live in a memory-mapped file as one array of
+    unsigned ints. Files added since it was written go into in-memory delta
+    arrays; a changed file gets a fresh id and its old id is simply marked
+    dead, so postings stay sorted and append-only until flush() rewrites
+    the file without the dead ids.
+    """
+
+    INDEX_FILE = Config.APP_DIR / "trigrams.idx"
+    MAGIC = b"GNTRI01\n"
+    SEARCH_FILE_LIMIT = 500  # candidate files read per query
+    SEARCH_CHAR_BUDGET = 64 * 1024 * 1024  # characters read per query, across files
+    SEARCH_CHUNK_CHARS = 1024 * 1024  # characters read at a time while verifying
+
+    def __init__(self, index_file=None):
+        self._path = Path(index_file or self.INDEX_FILE)
+        self._lock = threading.RLock()
+        self._files = []  # id -> [path, mtime, size, truncated], or None once superseded
+        self._ids = {}  # index_key -> live id
+        self._table = {}  # trigram -> (offset, count) into the mapped postings
+        self._delta = {}  # trigram -> array of ids added since the file was written
+        self._file = None
+        self._mm = None
+        self._postings = memoryview(array("I"))
+        self._dirty = False
+        self._load()
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self):
+        if not self._path.exists():
+            return
+        try:
+            self._file = open(self._path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mm[: len(self.MAGIC)] != self.MAGIC:
+                raise ValueError("not a trigram index")
+            (header_offset,) = struct.unpack("<Q", self._mm[-8:])
+            header = json.loads(self._mm[header_offset:-8])
+            self._files = header["files"]
+            self._table = header["trigrams"]
+            self._ids = {index_key(entry[0]): i for i, entry in enumerate(self._files)}
+            self._postings = memoryview(self._mm)[len(self.MAGIC) : header_offset].cast("I")
+        except Exception as e:
+            # A damaged index is rebuilt by the next sync
+            print(f"Error loading trigram index: {e}")
+            self._close_mapping()
+            self._files, self._ids, self._table = [], {}, {}
+
+    def _close_mapping(self):
+        self._postings.release()
+        self._postings = memoryview(array("I"))
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def flush(self):
+        """Rewrite the index file, merging delta postings and dropping dead ids"""
+        with self._lock:
+            if not self._dirty:
+                return
+            renumber = {}
+            files = []
+            for old_id, entry in enumerate(self._files):
+                if entry is not None:
+                    renumber[old_id] = len(files)
+                    files.append(entry)
+
+            tmp_path = Path(f"{self._path}.tmp")
+            table = {}
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(self.MAGIC)
+                    offset = 0
+                    for trigram in self._table.keys() | self._delta.keys():
+                        ids = array(
+                            "I",
+                            (renumber[i] for i in self._postings_of(trigram) if i in renumber),
+                        )
+                        if ids:
+                            table[trigram] = (offset, len(ids))
+                            f.write(ids.tobytes())
+                            offset += len(ids)
+                    header_offset = f.tell()
+                    f.write(json.dumps({"files": files, "trigrams": table}).encode("utf-8"))
+                    f.write(struct.pack("<Q", header_offset))
+
+                # The mapping must be released before the file can be replaced on Windows
+                self._close_mapping()
+                os.replace(tmp_path, self._path)
+            except Exception as e:
+                print(f"Error writing trigram index: {e}")
+                return
+
+            self._delta = {}
+            self._dirty = False
+            self._load()
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def _postings_of(self, trigram):
+        """Ids of files containing trigram, ascending, including dead ids"""
+        ids = []
+        entry = self._table.get(trigram)
+        if entry is not None:
+            offset, count = entry
+            ids = self._postings[offset : offset + count]
+        delta = self._delta.get(trigram)
+        if delta is None:
+            return ids
+        return list(ids) + delta.tolist()
+
+    def _retire(self, key):
+        old_id = self._ids.pop(key, None)
+        if old_id is not None:
+            self._files[old_id] = None
+            self._dirty = True
+
+    def add_many(self, entries, partial):
+        """Merge a partial index built by tokenize_chunk
+
+        The entries get consecutive fresh ids, so each partial posting list
+        is appended to the delta as-is, offset by the first new id.
+        """
+        with self._lock:
+            base = len(self._files)
+            for path, _text, mtime, size, truncated in entries:
+                key = index_key(path)
+                self._retire(key)
+                self._ids[key] = len(self._files)
+                self._files.append([str(path), mtime, size, truncated])
+            for trigram, positions in partial.items():
+                postings = self._delta.get(trigram)
+                if postings is None:
+                    postings = self._delta[trigram] = array("I")
+                postings.extend(base + position for position in positions)
+            self._dirty = True
+
+    def remove_many(self, paths):
+        """Forget files"""
+        with self._lock:
+            for path in paths:
+                self._retire(index_key(path))
+
+    def is_current(self, path, stat):
+        """Whether path is indexed at its current mtime and size"""
+        with self._lock:
+            file_id = self._ids.get(index_key(path))
+            if file_id is None:
+                return False
+            entry = self._files[file_id]
+            return entry[1] == stat.st_mtime and entry[2] == stat.st_size
+
+    def indexed_keys(self):
+        """Normalized paths of every live file"""
+        with self._lock:
+            return set(self._ids)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def candidates(self, text):
+        """Paths of live files that may contain text, or None if text is too short
+
+        Files whose every trigram matched come first; files indexed by their
+        head alone, which may match past it, follow.
+        """
+        trigrams = trigrams_of(text)
+        if not trigrams:
+            return None
+        with self._lock:
+            postings = sorted((self._postings_of(t) for t in trigrams), key=len)
+            ids = set(postings[0])
+            for other in postings[1:]:
+                if not ids:
+                    break
+                ids.intersection_update(other)
+            truncated = [i for i, e in enumerate(self._files) if e is not None and e[3]]
+            ids.difference_update(truncated)
+            ordered = sorted(i for i in ids if self._files[i] is not None) + truncated
+            return [self._files[i][0] for i in ordered]
+
+    def search(self, text, case_sensitive=False, limit=50, cancelled=None):
+        """Return [(path, snippet)] for files containing text as a substring
+
+        Only candidate files are read, in chunks, stopping at the first match.
+        At most SEARCH_FILE_LIMIT files and SEARCH_CHAR_BUDGET characters are
+        read per query, so a query matching many large files stays bounded.
+        Stops early, keeping what was found, once cancelled() becomes true.
+        """
+        paths = self.candidates(text)
+        if not paths:
+            return []
+        needle = text if case_sensitive else text.lower()
+        budget = self.SEARCH_CHAR_BUDGET
+        results = []
+        for path in paths[: self.SEARCH_FILE_LIMIT]:
+            if budget <= 0 or (cancelled and cancelled()):
+                break
+            found = self._find_in_file(path, needle, case_sensitive, budget, cancelled)
+            if found is None:
+                continue
+            snippet, read = found
+            budget -= read
+            if snippet is not None:
+                results.append((path, snippet))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _find_in_file(self, path, needle, case_sensitive, budget, cancelled):
+        """(snippet or None, characters read) for needle in path, or None if unreadable"""
+        overlap = len(needle) - 1
+        read = 0
+        tail = ""
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                while read < budget:
+                    chunk = f.read(min(self.SEARCH_CHUNK_CHARS, budget - read))
+                    if not chunk:
+                        break
+                    read += len(chunk)
+                    window = tail + chunk
+                    haystack = window if case_sensitive else window.lower()
+                    start = haystack.find(needle)
+                    if start != -1:
+                        end = start + len(needle)
+                        if len(haystack) != len(window):
+                            start = _unlowered_index(window, start)
+                            end = _unlowered_index(window, end)
+                        return match_snippet(window, start, end - start), read
+                    tail = window[-overlap:] if overlap else ""
+                    if cancelled and cancelled():
+                        break
+        except OSError:
+            return None
+        return None, read
+
+
+trigram_index = TrigramIndex()
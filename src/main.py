@@ -1,5 +1,8 @@
 import sys
 import ctypes
+
+# Imported first so startup timing covers loading the UI modules
+from src.logic.startup_timing import startup_timer
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt
@@ -27,7 +30,9 @@ def main():
     app.setWindowIcon(QIcon(icon_path))
     
     window = MainWindow()
+    startup_timer.mark("window_created")
     window.show()
+    startup_timer.mark("window_shown")
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@ Glassnotes Premium Editor
 Professional text editor with line numbers, current line highlighting, and modern typography
 """
 
+import re
+import uuid
+from bisect import bisect_left
 from PyQt6.QtWidgets import (
     QWidget,
     QPlainTextEdit,
@@ -12,6 +15,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QFrame,
     QSizePolicy,
+    QPlainTextDocumentLayout,
 )
 from PyQt6.QtGui import (
     QFont,
@@ -23,11 +27,74 @@ from PyQt6.QtGui import (
     QFontDatabase,
     QPen,
     QTextCursor,
+    QTextDocument,
 )
-from PyQt6.QtCore import Qt, QRect, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QRect, QSize, QThread, QTimer, QObject, pyqtSignal
 
 from src.ui.styles import get_editor_style, GlassColors
 from src.logic.config import config
+from src.logic.search import DONE, TIMEOUT, SearchCache, SearchSession, jump_index
+
+
+def create_editor_font():
+    """Build the editor's monospace font from the preferred families and config size"""
+    # Try to use premium coding fonts
+    preferred_fonts = [
+        "JetBrains Mono",
+        "Cascadia Code",
+        "Fira Code",
+        "Source Code Pro",
+        "Consolas",
+    ]
+
+    # In PyQt6, QFontDatabase methods are static
+    available_fonts = QFontDatabase.families()
+
+    selected_font = "Consolas"  # Fallback
+    for font_name in preferred_fonts:
+        if font_name in available_fonts:
+            selected_font = font_name
+            break
+
+    # Use size from config
+    font_size = config.get("font_size", 13)
+    if font_size <= 0:
+        font_size = 13
+
+    font = QFont(selected_font, font_size)
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    font.setFixedPitch(True)
+    return font
+
+
+class _SearchWorker(QThread):
+    """Scans a text snapshot for a SearchSession off the UI thread"""
+
+    progress = pyqtSignal(int)  # matches found so far
+
+    def __init__(self, session, content, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.content = content
+        self.completed = False
+        self.status = None
+
+    def run(self):
+        if self.session.regex:
+            timeout = config.get("regex_search_timeout_ms", 3000) / 1000
+            self.status, error = self.session.rebuild_isolated(
+                self.content, timeout, cancelled=self.isInterruptionRequested
+            )
+            if error:
+                print(f"Regex search failed: {error}")
+            self.completed = self.status == DONE
+        else:
+            self.completed = self.session.rebuild(
+                self.content,
+                progress=self.progress.emit,
+                cancelled=self.isInterruptionRequested,
+            )
+        self.content = None
 
 
 class LineNumberArea(QWidget):
@@ -48,30 +115,161 @@ class LineNumberArea(QWidget):
         self.editor.line_number_area_paint_event(event)
 
 
-class Editor(QPlainTextEdit):
-    """Premium glassmorphism text editor with line numbers and enhancements"""
+class NoteDocument(QObject):
+    """Text and editing state of one tab, shown by the shared Editor
 
-    word_count_changed = pyqtSignal(int, int)  # words, characters
-    cursor_position_changed = pyqtSignal(int, int)  # line, column
-    search_highlight_changed = pyqtSignal(int, int)  # match_count, current_index
+    Owns a QTextDocument, which keeps its own undo stack, and remembers
+    where the cursor and scroll bars were left. Search results and word
+    tallies are kept here too, so switching tabs only changes which
+    NoteDocument the Editor points at.
+    """
 
-    def __init__(self, content="", parent=None):
+    def __init__(self, content="", file_path=None, drive_id=None, parent=None):
         super().__init__(parent)
+        self.document = QTextDocument(self)
+        self.document.setDocumentLayout(QPlainTextDocumentLayout(self.document))
+        self.document.setPlainText(content)
 
         # File tracking
-        self.file_path = None
+        self.file_path = file_path
         # =============================================================================
         # FUTURE: drive_id Attribute (Google Drive)
         # =============================================================================
         # Status: NOT YET IMPLEMENTED - UI is hidden
         # To enable: Set ENABLE_CLOUD = True in src/logic/config.py
         # =============================================================================
-        self.drive_id = None
+        self.drive_id = drive_id
+
+        # Session tracking: stable backup id and whether content changed since last flush
+        self.session_id = uuid.uuid4().hex
+        self.session_dirty = False
+
+        # View state saved while another note is shown; the cursor follows edits
+        self.cursor = None
+        self.scroll = (0, 0)
+        self.font_size = None  # zoomed point size, None for the configured size
 
         # Search state
-        self._search_matches = []
+        self._search_session = None
         self._current_match_index = -1
-        self._last_search_text = ""
+        self._search_worker = None
+        self._search_revision = -1
+        self._search_cache = SearchCache()
+
+        # Per-block word tallies, built when the note is first shown
+        self._block_word_counts = None
+        self._word_count = 0
+        self._char_count = self.document.characterCount()
+
+    def toPlainText(self):
+        return self.document.toPlainText()
+
+    def get_content(self):
+        return self.document.toPlainText()
+
+
+def _note_state(name):
+    """Attribute that reads and writes the state of the note being shown"""
+    return property(
+        lambda self: getattr(self._note, name),
+        lambda self, value: setattr(self._note, name, value),
+    )
+
+
+class EditorTab(QWidget):
+    """Tab page of a note; the shared Editor sits in whichever page is current
+
+    Only the NoteDocument belongs to the tab, so a tab costs its text and
+    undo history rather than a full editor with gutter and styling.
+    """
+
+    file_path = _note_state("file_path")
+    drive_id = _note_state("drive_id")
+    session_id = _note_state("session_id")
+    session_dirty = _note_state("session_dirty")
+
+    def __init__(self, note, parent=None):
+        super().__init__(parent)
+        self._note = note
+        note.setParent(self)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def note(self):
+        return self._note
+
+    def attach(self, editor):
+        """Move the shared editor into this page"""
+        if editor.parent() is not self:
+            self.layout().addWidget(editor)
+        editor.show()
+
+    def revision(self):
+        """Revision of the note's document; it changes with every edit"""
+        return self._note.document.revision()
+
+    def toPlainText(self):
+        return self._note.toPlainText()
+
+    def get_content(self):
+        return self._note.get_content()
+
+
+class Editor(QPlainTextEdit):
+    """Premium glassmorphism text editor with line numbers and enhancements
+
+    One Editor serves every note tab: set_note() points it at another
+    NoteDocument, and the per-note attributes below read and write the
+    state of the note currently shown.
+    """
+
+    word_count_changed = pyqtSignal(int, int)  # words, characters
+    cursor_position_changed = pyqtSignal(int, int)  # line, column
+    search_highlight_changed = pyqtSignal(int, int)  # match_count, current_index
+    search_progress = pyqtSignal(int)  # partial match count while a background search runs
+    search_failed = pyqtSignal(str)  # reason a search produced no result
+    replaced = pyqtSignal(int)  # matches changed by a replace-all, once it has run
+
+    HIGHLIGHT_MARGIN_BLOCKS = 50  # blocks highlighted beyond each edge of the viewport
+    REGEX_RESCAN_DELAY_MS = 400  # pause in typing before edited lines are searched again
+
+    # State of the note being shown (see NoteDocument)
+    file_path = _note_state("file_path")
+    drive_id = _note_state("drive_id")
+    session_id = _note_state("session_id")
+    session_dirty = _note_state("session_dirty")
+    _search_session = _note_state("_search_session")
+    _current_match_index = _note_state("_current_match_index")
+    _search_worker = _note_state("_search_worker")
+    _search_revision = _note_state("_search_revision")
+    _search_cache = _note_state("_search_cache")
+    _block_word_counts = _note_state("_block_word_counts")
+    _word_count = _note_state("_word_count")
+    _char_count = _note_state("_char_count")
+
+    def __init__(self, content="", parent=None):
+        super().__init__(parent)
+
+        # Shown when no tab's note is
+        self._blank_note = NoteDocument(content, parent=self)
+        self._note = self._blank_note
+        self.setDocument(self._note.document)
+        self._recount_all_blocks()
+
+        # Search highlights, rebuilt for whichever note is shown
+        self._search_selections = []  # highlights for matches near the viewport
+        self._highlight_window = None  # (start, end) positions covered by them
+        # A find waiting on the background search: (forward, wrap, anchor, inclusive)
+        self._pending_jump = None
+        self._jump_target = None  # match start a find landed on before the scan finished
+        self._pending_replace = None  # replace to run once the matches are known
+        # Regex matches on edited lines are found again once typing pauses
+        self._rescan_worker = None
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(self.REGEX_RESCAN_DELAY_MS)
+        self._rescan_timer.timeout.connect(self._rescan_stale_matches)
 
         # Setup
         self._setup_font()
@@ -79,38 +277,57 @@ class Editor(QPlainTextEdit):
         self._setup_line_numbers()
         self._setup_styling()
 
-        # Set initial content
-        self.setPlainText(content)
+    @property
+    def note(self):
+        return self._note
+
+    def set_note(self, note):
+        """Show another note; its cursor, scroll position and undo stack come with it"""
+        if note is self._note:
+            return
+        old = self._note
+        # A background search would deliver its results to the wrong note
+        self._cancel_search_worker()
+        old.cursor = self.textCursor()
+        old.scroll = (self.horizontalScrollBar().value(), self.verticalScrollBar().value())
+        old.document.contentsChange.disconnect(self._on_contents_change)
+
+        self._note = note
+        # Swapping documents is not an edit; listeners get the new state below
+        self.blockSignals(True)
+        try:
+            self.editor_font.setPointSize(note.font_size or self._default_font_size)
+            note.document.setDefaultFont(self.editor_font)
+            self.setDocument(note.document)
+            self.setFont(self.editor_font)
+            self.setTabStopDistance(self.fontMetrics().horizontalAdvance(" ") * 4)
+            if note.cursor is not None:
+                self.setTextCursor(note.cursor)
+        finally:
+            self.blockSignals(False)
+        note.document.contentsChange.connect(self._on_contents_change)
+        if note._block_word_counts is None:
+            self._recount_all_blocks()
+            note._char_count = note.document.characterCount()
+
+        self._update_line_number_area_width(0)
+        self.horizontalScrollBar().setValue(note.scroll[0])
+        self.verticalScrollBar().setValue(note.scroll[1])
+        self._apply_search_highlights()
+        if note._search_session is not None and note._search_session.stale is not None:
+            self._rescan_timer.start()
+        self._emit_cursor_position()
         self._update_counts()
 
+    def release_note(self, note):
+        """Stop showing note before it is deleted, switching to a blank one"""
+        if note is self._note:
+            self.set_note(self._blank_note)
+
     def _setup_font(self):
         """Setup modern monospace font with fallbacks"""
-        # Try to use premium coding fonts
-        preferred_fonts = [
-            "JetBrains Mono",
-            "Cascadia Code",
-            "Fira Code",
-            "Source Code Pro",
-            "Consolas",
-        ]
-
-        # In PyQt6, QFontDatabase methods are static
-        available_fonts = QFontDatabase.families()
-
-        selected_font = "Consolas"  # Fallback
-        for font_name in preferred_fonts:
-            if font_name in available_fonts:
-                selected_font = font_name
-                break
-
-        # Use size from config
-        font_size = config.get("font_size", 13)
-        if font_size <= 0:
-            font_size = 13
-
-        self.editor_font = QFont(selected_font, font_size)
-        self.editor_font.setStyleHint(QFont.StyleHint.Monospace)
-        self.editor_font.setFixedPitch(True)
+        self.editor_font = create_editor_font()
+        self._default_font_size = self.editor_font.pointSize()
         self.setFont(self.editor_font)
 
     def _setup_editor(self):
@@ -126,7 +343,7 @@ class Editor(QPlainTextEdit):
         # Connect signals
         self.cursorPositionChanged.connect(self._highlight_current_line)
         self.cursorPositionChanged.connect(self._emit_cursor_position)
-        self.textChanged.connect(self._update_counts)
+        self.document().contentsChange.connect(self._on_contents_change)
 
     def _setup_line_numbers(self):
         """Setup line number gutter"""
@@ -194,6 +411,9 @@ class Editor(QPlainTextEdit):
         if rect.contains(self.viewport().rect()):
             self._update_line_number_area_width(0)
 
+        if dy and self._search_session is not None:
+            self._refresh_highlights_if_scrolled()
+
     def resizeEvent(self, event):
         """Handle resize to update line number area"""
         super().resizeEvent(event)
@@ -203,6 +423,9 @@ class Editor(QPlainTextEdit):
             QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height())
         )
 
+        if self._search_session is not None:
+            self._refresh_highlights_if_scrolled()
+
     def line_number_area_paint_event(self, event):
         """Paint line numbers with dynamic accent color"""
         painter = QPainter(self.line_number_area)
@@ -299,9 +522,7 @@ class Editor(QPlainTextEdit):
             # Repaint line numbers to update highlight
             self.line_number_area.update()
 
-        self.setExtraSelections(extra_selections)
-
-        self.setExtraSelections(extra_selections)
+        self.setExtraSelections(self._search_selections + extra_selections)
 
     def _emit_cursor_position(self):
         """Emit current cursor position"""
@@ -310,12 +531,68 @@ class Editor(QPlainTextEdit):
         column = cursor.columnNumber() + 1
         self.cursor_position_changed.emit(line, column)
 
+    def _on_contents_change(self, position, removed, added):
+        """Update word tallies and search matches for the blocks touched by an edit"""
+        doc = self.document()
+        end = min(position + added, doc.characterCount() - 1)
+        first_block = doc.findBlock(position)
+        last_block = doc.findBlock(end)
+        first = first_block.blockNumber()
+        last = last_block.blockNumber()
+        delta = doc.characterCount() - self._char_count
+        self._char_count = doc.characterCount()
+        self._search_cache.invalidate()
+
+        # Blocks after the edit shift by the change in block count
+        old_last = last - (doc.blockCount() - len(self._block_word_counts))
+        if first < 0 or old_last < first or old_last >= len(self._block_word_counts):
+            self._recount_all_blocks()
+            if self._search_session is not None and self._search_session.regex:
+                length = doc.characterCount() - 1
+                self._drop_stale_matches(0, length - delta, length)
+            elif self._search_session is not None:
+                # Rescanned inline only below async_search_threshold
+                self._restart_search()
+        else:
+            if self._search_session is not None and self._search_session.regex:
+                # Even a line-local rescan could hang on a pathological pattern,
+                # so the touched lines are searched in the background later
+                region_start, old_region_end, region_text = self._edit_region(
+                    first_block, last_block, delta
+                )
+                self._drop_stale_matches(region_start, old_region_end, len(region_text))
+            elif self._search_session is not None:
+                self._repair_search_session(first_block, last_block, delta)
+
+            new_counts = []
+            block = first_block
+            for _ in range(last - first + 1):
+                new_counts.append(len(block.text().split()))
+                block = block.next()
+
+            old_counts = self._block_word_counts[first : old_last + 1]
+            self._word_count += sum(new_counts) - sum(old_counts)
+            self._block_word_counts[first : old_last + 1] = new_counts
+
+        self._update_counts()
+
+    def _recount_all_blocks(self):
+        """Rebuild the per-block word tallies from scratch"""
+        counts = []
+        block = self.document().firstBlock()
+        while block.isValid():
+            counts.append(len(block.text().split()))
+            block = block.next()
+        self._block_word_counts = counts
+        self._word_count = sum(counts)
+
+    def get_counts(self):
+        """Return the current (words, characters) tally"""
+        return self._word_count, self.document().characterCount() - 1
+
     def _update_counts(self):
-        """Update and emit word/character counts"""
-        text = self.toPlainText()
-        char_count = len(text)
-        word_count = len(text.split()) if text.strip() else 0
-        self.word_count_changed.emit(word_count, char_count)
+        """Emit word/character counts"""
+        self.word_count_changed.emit(*self.get_counts())
 
     def set_content(self, text):
         """Set editor content"""
@@ -325,20 +602,49 @@ class Editor(QPlainTextEdit):
         """Get editor content"""
         return self.toPlainText()
 
-    def set_font_size(self, size):
-        """Change font size"""
-        target_size = max(1, int(size))
-        self.editor_font.setPointSize(target_size)
-        self.setFont(self.editor_font)
+    def go_to_line(self, line):
+        """Move the cursor to a 1-based line number"""
+        block = self.document().findBlockByNumber(max(0, line - 1))
+        if block.isValid():
+            cursor = self.textCursor()
+            cursor.setPosition(block.position())
+            self.setTextCursor(cursor)
+            self.centerCursor()
 
-        # Update line number font
-        number_font = QFont(self.editor_font)
-        number_font.setPointSize(max(1, target_size - 1))
+    def select_range(self, start, end):
+        """Select a span of the document, clamped to its current length"""
+        limit = self.document().characterCount() - 1
+        cursor = self.textCursor()
+        cursor.setPosition(min(start, limit))
+        cursor.setPosition(min(end, limit), QTextCursor.MoveMode.KeepAnchor)
+        self.setTextCursor(cursor)
+        self.centerCursor()
+
+    def _apply_font_size(self, size):
+        self.editor_font.setPointSize(size)
+        self.setFont(self.editor_font)
+        self.setTabStopDistance(self.fontMetrics().horizontalAdvance(" ") * 4)
 
         # Trigger updates
         self._update_line_number_area_width(0)
         self.line_number_area.update()
 
+    def set_font_size(self, size):
+        """Change the font size of the note being shown; other notes keep theirs"""
+        self._note.font_size = max(1, int(size))
+        self._apply_font_size(self._note.font_size)
+
+    def set_default_font_size(self, size):
+        """Change the font size of every note that has not been zoomed"""
+        self._default_font_size = max(1, int(size))
+        if self._note.font_size is None:
+            self._apply_font_size(self._default_font_size)
+
+    def reset_zoom(self):
+        """Return the note being shown to the default font size"""
+        self._note.font_size = None
+        self._apply_font_size(self._default_font_size)
+
     def zoom_in(self):
         """Increase font size"""
         current_size = self.editor_font.pointSize()
@@ -351,185 +657,526 @@ class Editor(QPlainTextEdit):
         if current_size > 8:
             self.set_font_size(current_size - 1)
 
-    def _find_all_matches(self, text, case_sensitive=False, whole_word=False):
-        """Find all occurrences of text in the document"""
-        import re
+    @property
+    def _search_matches(self):
+        """Sorted start offsets of the active search's matches"""
+        if self._search_session is None:
+            return []
+        return self._search_session.starts
+
+    def _ensure_search_session(self, text, case_sensitive=False, whole_word=False, regex=False):
+        """Reuse the active search session, rebuilding only when the query changes
+
+        Regexes and documents above async_search_threshold are only scanned
+        on a worker, so for those this returns None until the background
+        search has finished; a pending scan is never redone inline.
+        """
+        key = (text, case_sensitive, whole_word, regex)
+        if self._search_session is None or self._search_session.key != key:
+            worker = self._search_worker
+            if worker is not None and worker.session.key == key:
+                return None
+            if self._start_background_search(text, case_sensitive, whole_word, regex):
+                return None
+        return self._search_session
+
+    def _cached_search_session(self, text, case_sensitive=False, whole_word=False, regex=False):
+        """Answer a search from the cache, narrowing a cached prefix if possible"""
+        revision = self.document().revision()
+        key = (text, case_sensitive, whole_word, regex)
+        session = self._search_cache.get(key, revision)
+        if session is not None or regex:
+            return session
+
+        session = SearchSession(text, case_sensitive, whole_word)
+        base = self._search_cache.narrowing_base(session, revision)
+        if base is None:
+            return None
+        session.narrow(base, self.toPlainText())
+        self._search_cache.put(session, revision)
+        return session
+
+    def _start_background_search(self, text, case_sensitive=False, whole_word=False, regex=False):
+        """Scan large documents and regexes on a worker, returning False if done synchronously"""
+        key = (text, case_sensitive, whole_word, regex)
+        if self._search_session is not None and self._search_session.key == key:
+            return False
+        session = self._cached_search_session(text, case_sensitive, whole_word, regex)
+        threshold = config.get("async_search_threshold", 1000000)
+        if session is None and not regex and self.document().characterCount() < threshold:
+            session = SearchSession(text, case_sensitive, whole_word)
+            session.rebuild(self.toPlainText())
+            self._search_cache.put(session, self.document().revision())
+        if session is not None:
+            self._cancel_search_worker()
+            self._search_session = session
+            self._current_match_index = -1
+            return False
+
+        self._cancel_search_worker()
+        self._search_session = None
+        self._current_match_index = -1
+        self._clear_search_highlights()
 
-        matches = []
-        if not text:
-            return matches
+        session = SearchSession(text, case_sensitive, whole_word, regex)
+        worker = _SearchWorker(session, self.toPlainText(), self)
+        worker.progress.connect(lambda count: self._on_search_progress(worker, count))
+        worker.finished.connect(lambda: self._on_search_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._search_worker = worker
+        self._search_revision = self.document().revision()
+        worker.start()
+        self.search_progress.emit(0)
+        return True
 
-        content = self.toPlainText()
+    def _queue_jump(self, forward, wrap):
+        """Select a match once the running search has found the one to land on"""
+        if self._search_worker is None:
+            return
+        cursor = self.textCursor()
+        if forward and not cursor.hasSelection():
+            self._pending_jump = (True, wrap, cursor.position(), True)
+        else:
+            self._pending_jump = (forward, wrap, cursor.selectionStart(), False)
+        self._jump_target = None
+
+    def _resolve_jump(self, starts, count, final):
+        """Match index the queued find lands on, or None while undecided"""
+        forward, wrap, anchor, inclusive = self._pending_jump
+        index = jump_index(starts, count, anchor, forward, wrap, final, inclusive)
+        if index is not None:
+            self._pending_jump = None
+        return index
+
+    def _on_search_progress(self, worker, count):
+        self.search_progress.emit(count)
+        if worker is not self._search_worker or self._pending_jump is None:
+            return
+        if self.document().revision() != self._search_revision:
+            return  # offsets in the snapshot no longer match the text
+        session = worker.session
+        starts, ends = session.starts, session.ends
+        # Starts are appended before ends, so every counted match is complete
+        index = self._resolve_jump(starts, len(ends), final=False)
+        if index is not None and index >= 0:
+            self._jump_target = starts[index]
+            cursor = self.textCursor()
+            cursor.setPosition(starts[index])
+            cursor.setPosition(ends[index], QTextCursor.MoveMode.KeepAnchor)
+            self.setTextCursor(cursor)
+            self.ensureCursorVisible()
+
+    def _cancel_search_worker(self):
+        """Abandon the running background search, if any"""
+        self._cancel_rescan()
+        self._pending_jump = None
+        self._jump_target = None
+        self._pending_replace = None
+        if self._search_worker is not None:
+            self._search_worker.requestInterruption()
+            self._search_worker = None
+
+    def _on_search_finished(self, worker):
+        """Adopt a finished background search unless it was superseded"""
+        if worker is not self._search_worker:
+            return
+        if not worker.completed:
+            if worker.status is not None:
+                # The regex ran out of time or could not run at all
+                self._search_worker = None
+                self._pending_replace = None
+                self.search_failed.emit(
+                    "search aborted" if worker.status == TIMEOUT else "search failed"
+                )
+            return
+        self._search_worker = None
+        session = worker.session
+        pending, target = self._pending_jump, self._jump_target
+        self._pending_jump = self._jump_target = None
+
+        if self.document().revision() != self._search_revision:
+            # The text changed under the snapshot: search the current text again
+            replace = self._pending_replace
+            self._highlight_search_matches(*session.key)
+            self._pending_replace = replace
+            self._run_pending_replace()
+            return
 
-        if whole_word:
-            pattern = r"\b" + re.escape(text) + r"\b"
+        self._search_session = session
+        self._search_cache.put(session, self._search_revision)
+        self._current_match_index = -1
+        self._apply_search_highlights()
+
+        # Finish a find that was waiting on this search
+        index = -1
+        if pending is not None:
+            self._pending_jump = pending
+            index = self._resolve_jump(session.starts, len(session), final=True)
+        elif target is not None:
+            index = session.index_at(target)
+        if index >= 0:
+            self._select_match(index)
         else:
-            pattern = re.escape(text)
+            self.search_highlight_changed.emit(len(session), -1)
+        self._run_pending_replace()
+
+    def is_search_pending(self):
+        """Whether a background search is still running"""
+        return self._search_worker is not None
+
+    def _restart_search(self):
+        """Drop the active session and search the edited text again on a worker"""
+        key = self._search_session.key
+        self._search_session = None
+        self._highlight_search_matches(*key)
+
+    @staticmethod
+    def _block_text(first_block, last_block):
+        """Text of a run of blocks, joined with newlines"""
+        texts = []
+        block = first_block
+        while True:
+            texts.append(block.text())
+            if block == last_block:
+                break
+            block = block.next()
+        return "\n".join(texts)
+
+    def _edit_region(self, first_block, last_block, delta):
+        """(start, end before the edit, new text) of the lines an edit touched"""
+        region_start = first_block.position()
+        region_text = self._block_text(first_block, last_block)
+        return region_start, region_start + len(region_text) - delta, region_text
 
-        flags = 0 if case_sensitive else re.IGNORECASE
-        for match in re.finditer(pattern, content, flags):
-            matches.append(match.start())
+    def _repair_search_session(self, first_block, last_block, delta):
+        """Rescan only the lines touched by an edit"""
+        self._search_session.apply_edit(*self._edit_region(first_block, last_block, delta))
+        self._current_match_index = -1
+        self._apply_search_highlights()
+        self.search_highlight_changed.emit(len(self._search_session), -1)
+
+    def _drop_stale_matches(self, region_start, old_region_end, new_length):
+        """Forget regex matches on edited lines and search them again once typing pauses"""
+        self._cancel_rescan()
+        self._search_session.drop_edit(region_start, old_region_end, new_length)
+        self._rescan_timer.start()
+        self._current_match_index = -1
+        self._apply_search_highlights()
+        self.search_highlight_changed.emit(len(self._search_session), -1)
+
+    def _cancel_rescan(self):
+        self._rescan_timer.stop()
+        if self._rescan_worker is not None:
+            self._rescan_worker.requestInterruption()
+            self._rescan_worker = None
+
+    def _rescan_stale_matches(self):
+        """Search the lines edited since the last regex scan in a child process"""
+        session = self._search_session
+        if session is None or session.stale is None:
+            return
+        doc = self.document()
+        first_block = doc.findBlock(session.stale[0])
+        last_block = doc.findBlock(session.stale[1])
+        region_start = first_block.position()
+        region_text = self._block_text(first_block, last_block)
+
+        probe = SearchSession(*session.key)
+        worker = _SearchWorker(probe, region_text, self)
+        revision = doc.revision()
+        worker.finished.connect(
+            lambda: self._on_rescan_finished(worker, region_start, len(region_text), revision)
+        )
+        worker.finished.connect(worker.deleteLater)
+        self._rescan_worker = worker
+        worker.start()
 
-        return matches
+    def _on_rescan_finished(self, worker, region_start, length, revision):
+        """Fill in the matches of the rescanned lines unless the text changed since"""
+        if worker is not self._rescan_worker:
+            return
+        self._rescan_worker = None
+        session = self._search_session
+        if session is None or self.document().revision() != revision:
+            return
+        if not worker.completed:
+            if worker.status is not None:
+                self._pending_replace = None
+                self.search_failed.emit(
+                    "search aborted" if worker.status == TIMEOUT else "search failed"
+                )
+            return
+        probe = worker.session
+        session.fill_stale(
+            region_start,
+            region_start + length,
+            [region_start + start for start in probe.starts],
+            [region_start + end for end in probe.ends],
+        )
+        self._current_match_index = -1
+        self._apply_search_highlights()
+        self.search_highlight_changed.emit(len(session), -1)
+        self._run_pending_replace()
 
-    def _highlight_search_matches(self, text, case_sensitive=False, whole_word=False):
+    def _highlight_search_matches(self, text, case_sensitive=False, whole_word=False, regex=False):
         """Highlight all search matches"""
-        self._clear_search_highlights()
-
         if not text:
-            self._search_matches = []
-            self._current_match_index = -1
+            self.clear_search_state()
             self.search_highlight_changed.emit(0, -1)
             return
 
-        self._search_matches = self._find_all_matches(text, case_sensitive, whole_word)
+        try:
+            if self._start_background_search(text, case_sensitive, whole_word, regex):
+                return
+        except re.error:
+            self.clear_search_state()
+            self.search_failed.emit("invalid pattern")
+            return
 
-        if not self._search_matches:
-            self._current_match_index = -1
-            self.search_highlight_changed.emit(0, -1)
+        self._current_match_index = -1
+        self._apply_search_highlights()
+        self.search_highlight_changed.emit(len(self._search_session), -1)
+
+    def _visible_range(self):
+        """Document positions of the first and last visible characters"""
+        first = self.firstVisibleBlock().position()
+        viewport = self.viewport().rect()
+        last = self.cursorForPosition(viewport.bottomRight()).position()
+        return first, last
+
+    def _refresh_highlights_if_scrolled(self):
+        """Rebuild highlights once the viewport leaves the highlighted window"""
+        first, last = self._visible_range()
+        window = self._highlight_window
+        if window is None or first < window[0] or last > window[1]:
+            self._apply_search_highlights()
+
+    def _apply_search_highlights(self):
+        """Show highlights for matches intersecting the viewport plus a margin"""
+        self._search_selections = []
+        self._highlight_window = None
+        if not self._search_session:
             self._highlight_current_line()
             return
 
-        self._current_match_index = -1
-        extra_selections = []
+        # Extend the visible range by whole blocks so small scrolls need no rebuild
+        first, last = self._visible_range()
+        doc = self.document()
+        first_block = doc.findBlock(first)
+        last_block = doc.findBlock(last)
+        for _ in range(self.HIGHLIGHT_MARGIN_BLOCKS):
+            if first_block.previous().isValid():
+                first_block = first_block.previous()
+            if last_block.next().isValid():
+                last_block = last_block.next()
+        window_start = first_block.position()
+        window_end = last_block.position() + last_block.length()
 
         accent = self._get_accent_color()
         highlight_color = QColor(accent)
         highlight_color.setAlpha(60)
 
-        for pos in self._search_matches:
+        session = self._search_session
+        lo = bisect_left(session.ends, window_start)
+        hi = bisect_left(session.starts, window_end)
+        for index in range(lo, hi):
             selection = QTextEdit.ExtraSelection()
             cursor = self.textCursor()
-            cursor.setPosition(pos)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Right,
-                QTextCursor.MoveMode.KeepAnchor,
-                len(text),
-            )
+            cursor.setPosition(session.starts[index])
+            cursor.setPosition(session.ends[index], QTextCursor.MoveMode.KeepAnchor)
             selection.cursor = cursor
             selection.format.setBackground(highlight_color)
             selection.format.setProperty(QTextFormat.Property.FullWidthSelection, False)
-            extra_selections.append(selection)
-
-        current_line_selections = self._get_current_line_selection()
-        extra_selections.extend(current_line_selections)
+            self._search_selections.append(selection)
 
-        self.setExtraSelections(extra_selections)
-        self.search_highlight_changed.emit(len(self._search_matches), -1)
+        self._highlight_window = (window_start, window_end)
+        self._highlight_current_line()
 
     def _clear_search_highlights(self):
         """Clear all search highlights"""
+        self._search_selections = []
+        self._highlight_window = None
         self._highlight_current_line()
 
-    def _get_current_line_selection(self):
-        """Get the current line highlight selection"""
-        selections = []
-        if not self.isReadOnly():
-            selection = QTextEdit.ExtraSelection()
-            accent = self._get_accent_color()
-            line_color = QColor(accent)
-            line_color.setAlpha(25)
-            selection.format.setBackground(line_color)
-            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
-            selection.cursor = self.textCursor()
-            selection.cursor.clearSelection()
-            selections.append(selection)
-        return selections
+    def _navigation_session(self, text, case_sensitive, whole_word, regex):
+        """Search session to navigate, or None while unavailable"""
+        try:
+            return self._ensure_search_session(text, case_sensitive, whole_word, regex)
+        except re.error:
+            self.search_failed.emit("invalid pattern")
+            return None
 
-    def find_next(self, text, case_sensitive=False, whole_word=False, wrap=True):
+    def find_next(self, text, case_sensitive=False, whole_word=False, wrap=True, regex=False):
         """Find next occurrence of text"""
         if not text:
             return False
 
-        if not self._search_matches or self._last_search_text != text:
-            self._search_matches = self._find_all_matches(
-                text, case_sensitive, whole_word
-            )
-            self._last_search_text = text
-            self._current_match_index = -1
-
-        if not self._search_matches:
+        session = self._navigation_session(text, case_sensitive, whole_word, regex)
+        if session is None:
+            self._queue_jump(True, wrap)
             return False
-
-        content = self.toPlainText()
-        cursor_pos = self.textCursor().position()
-
-        next_index = -1
-        for i, pos in enumerate(self._search_matches):
-            if pos > cursor_pos:
-                next_index = i
-                break
+        cursor = self.textCursor()
+        if cursor.hasSelection():
+            next_index = session.next_index(cursor.selectionStart(), wrap=wrap)
+        else:
+            next_index = session.next_index(cursor.position(), inclusive=True, wrap=wrap)
 
         if next_index == -1:
-            if wrap:
-                next_index = 0
-            else:
-                return False
+            return False
 
-        self._current_match_index = next_index
         self._select_match(next_index)
-        self._highlight_search_matches(text, case_sensitive, whole_word)
         return True
 
-    def find_previous(self, text, case_sensitive=False, whole_word=False, wrap=True):
+    def find_previous(self, text, case_sensitive=False, whole_word=False, wrap=True, regex=False):
         """Find previous occurrence of text"""
         if not text:
             return False
 
-        if not self._search_matches or self._last_search_text != text:
-            self._search_matches = self._find_all_matches(
-                text, case_sensitive, whole_word
-            )
-            self._last_search_text = text
-            self._current_match_index = -1
+        session = self._navigation_session(text, case_sensitive, whole_word, regex)
+        if session is None:
+            self._queue_jump(False, wrap)
+            return False
+        prev_index = session.previous_index(
+            self.textCursor().selectionStart(), wrap=wrap
+        )
 
-        if not self._search_matches:
+        if prev_index == -1:
             return False
 
-        cursor_pos = self.textCursor().position()
+        self._select_match(prev_index)
+        return True
 
-        prev_index = -1
-        for i in range(len(self._search_matches) - 1, -1, -1):
-            pos = self._search_matches[i]
-            if pos < cursor_pos:
-                prev_index = i
-                break
+    def _replace_session(self, action, text, case_sensitive, whole_word, regex):
+        """Session whose matches a replace can use, or None
+
+        While the matches are still being searched for, or regex matches on
+        edited lines wait for their rescan, action is queued to run again
+        once they are known instead of being dropped.
+        """
+        session = self._navigation_session(text, case_sensitive, whole_word, regex)
+        if session is None:
+            if self._search_worker is not None:
+                self._pending_replace = action
+            return None
+        if session.stale is not None:
+            self._pending_replace = action
+            if self._rescan_worker is None:
+                self._rescan_timer.stop()
+                self._rescan_stale_matches()
+            return None
+        return session
+
+    def _run_pending_replace(self):
+        """Carry out a queued replace once no scan it waits on is running"""
+        action = self._pending_replace
+        if action is None or self._search_worker is not None or self._rescan_worker is not None:
+            return
+        self._pending_replace = None
+        action()
+
+    def replace_current(self, text, replacement, case_sensitive=False, whole_word=False, regex=False):
+        """Replace the selected match and move to the next one"""
+        session = self._replace_session(
+            lambda: self.replace_current(text, replacement, case_sensitive, whole_word, regex),
+            text, case_sensitive, whole_word, regex,
+        )
+        if session is None:
+            return False
 
-        if prev_index == -1:
-            if wrap:
-                prev_index = len(self._search_matches) - 1
-            else:
+        cursor = self.textCursor()
+        index = session.index_at(cursor.selectionStart()) if cursor.hasSelection() else -1
+        if index == -1 or session.ends[index] != cursor.selectionEnd():
+            # Nothing selected yet: the first press only selects a match
+            return self.find_next(text, case_sensitive, whole_word, regex=regex)
+
+        new_text = replacement
+        if regex:
+            match = session.match_at(self.toPlainText(), index)
+            if match is None:
+                self.search_failed.emit("match changed")
                 return False
+            try:
+                new_text = match.expand(replacement)
+            except (re.error, IndexError):
+                self.search_failed.emit("invalid replacement")
+                return False
+        cursor.insertText(new_text)
+        self.setTextCursor(cursor)
+        return self.find_next(text, case_sensitive, whole_word, regex=regex)
+
+    def replace_all(self, text, replacement, case_sensitive=False, whole_word=False, regex=False):
+        """Replace every match as a single edit and undo step, returning the count
+
+        The replaced span is rebuilt in one pass over the document text and
+        swapped in with one insertText, so the document is laid out once
+        rather than once per match. While the search is still running the
+        replace is queued and None is returned; replaced reports the count
+        either way.
+        """
+        session = self._replace_session(
+            lambda: self.replace_all(text, replacement, case_sensitive, whole_word, regex),
+            text, case_sensitive, whole_word, regex,
+        )
+        if session is None:
+            return None if self._pending_replace is not None else 0
+        if not session:
+            self.replaced.emit(0)
+            return 0
+
+        starts = session.starts
+        ends = session.ends
+        content = self.toPlainText()
+        first = starts[0]
+        last = ends[-1]
+        parts = []
+        pos = first
+        try:
+            for index, (start, end) in enumerate(zip(starts, ends)):
+                parts.append(content[pos:start])
+                if regex:
+                    match = session.match_at(content, index)
+                    if match is None:
+                        self.search_failed.emit("match changed")
+                        return 0
+                    parts.append(match.expand(replacement))
+                else:
+                    parts.append(replacement)
+                pos = end
+        except (re.error, IndexError):
+            self.search_failed.emit("invalid replacement")
+            return 0
+        count = len(starts)
 
-        self._current_match_index = prev_index
-        self._select_match(prev_index)
-        self._highlight_search_matches(text, case_sensitive, whole_word)
-        return True
+        cursor = self.textCursor()
+        cursor.beginEditBlock()
+        cursor.setPosition(first)
+        cursor.setPosition(last, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText("".join(parts))
+        cursor.endEditBlock()
+        self.replaced.emit(count)
+        return count
 
     def _select_match(self, index):
         """Select the match at the given index"""
-        if index < 0 or index >= len(self._search_matches):
+        session = self._search_session
+        if session is None or index < 0 or index >= len(session):
             return
 
-        pos = self._search_matches[index]
-        text = self._last_search_text
-        length = len(text)
-
         cursor = self.textCursor()
-        cursor.setPosition(pos)
-        cursor.movePosition(
-            QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor, length
-        )
+        cursor.setPosition(session.starts[index])
+        cursor.setPosition(session.ends[index], QTextCursor.MoveMode.KeepAnchor)
         self.setTextCursor(cursor)
         self.ensureCursorVisible()
 
-        self.search_highlight_changed.emit(len(self._search_matches), index)
+        self._current_match_index = index
+        self._apply_search_highlights()
+        self.search_highlight_changed.emit(len(session), index)
 
     def clear_search_state(self):
         """Clear search state and highlights"""
-        self._search_matches = []
+        self._cancel_search_worker()
+        self._search_session = None
         self._current_match_index = -1
-        self._last_search_text = ""
         self._clear_search_highlights()
 
     def wheelEvent(self, event):
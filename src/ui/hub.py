@@ -13,11 +13,13 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
     QScrollArea,
+    QFileDialog,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, QFileSystemWatcher, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 from qfluentwidgets import (
     PrimaryPushButton,
+    TransparentToolButton,
     FluentIcon as FIF,
     LineEdit,
     ComboBox,
@@ -28,7 +30,13 @@ from qfluentwidgets import (
 from src.ui.styles import get_hub_style, GlassColors
 from src.logic.config import config, ENABLE_CLOUD
 from src.logic.file_manager import file_manager
+from src.logic.content_index import content_index
+from src.logic.trigram_index import trigram_index
+from src.logic.indexer import corpus_indexer
+from src.logic.catalog import note_catalog, root_catalogs
+from src.logic.corpus import index_key
 from src.ui.virtual_note_list import VirtualNoteList, _ActionButton
+from src.ui.workspace_section import WorkspaceSection
 
 
 # =============================================================================
@@ -39,6 +47,83 @@ from src.ui.virtual_note_list import VirtualNoteList, _ActionButton
 # =============================================================================
 
 
+class _CorpusIndexWorker(QThread):
+    """Brings the content indexes in line with the hub's notes off the UI thread"""
+
+    progress = pyqtSignal(int, int)  # files indexed, files to index
+
+    def __init__(self, paths, removed=None, root=None, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+        self.removed = removed  # None for a full sync of paths
+        self.root = root  # workspace root synced, None for the local notes
+        # A full sync only prunes files of its own root
+        self.outside = config.workspace_roots() if root is None else []
+        self.changed = 0
+
+    def run(self):
+        try:
+            self.changed = corpus_indexer.run(
+                self.paths,
+                progress=self.progress.emit,
+                cancelled=self.isInterruptionRequested,
+                removed=self.removed,
+                within=self.root,
+                outside=self.outside,
+            )
+        except Exception as e:
+            print(f"Error updating content index: {e}")
+            self.changed = None
+
+
+class _CatalogReconcileWorker(QThread):
+    """Stats the hub's notes and patches the note catalog off the UI thread"""
+
+    found = pyqtSignal(list)  # paths of notes new to the catalog, while the scan runs
+
+    def __init__(self, recent_files, notes_dir, touched=None, parent=None):
+        super().__init__(parent)
+        self.recent_files = recent_files
+        self.notes_dir = notes_dir
+        self.touched = touched  # None for a full reconcile
+        self.result = None  # (paths, changed) once reconciled
+
+    def run(self):
+        try:
+            self.result = note_catalog.reconcile(
+                self.recent_files,
+                self.notes_dir,
+                cancelled=self.isInterruptionRequested,
+                touched=self.touched,
+                found=self.found.emit,
+            )
+        except Exception as e:
+            print(f"Error reconciling note catalog: {e}")
+
+
+class _ContentSearchWorker(QThread):
+    """Looks a query up in the content indexes off the UI thread"""
+
+    def __init__(self, query, parent=None):
+        super().__init__(parent)
+        self.query = query
+        self.hits = None  # {index_key: snippet} once searched
+
+    def run(self):
+        try:
+            # Word matches from the full-text index come first, by rank; substring
+            # matches inside identifiers or log tokens follow from the trigram index
+            hits = {index_key(path): hit for path, hit in content_index.search(self.query)}
+            for path, snippet in trigram_index.search(
+                self.query, cancelled=self.isInterruptionRequested
+            ):
+                hits.setdefault(index_key(path), snippet)
+            if not self.isInterruptionRequested():
+                self.hits = hits
+        except Exception as e:
+            print(f"Error searching note contents: {e}")
+
+
 class HubView(QFrame):
     """Premium glassmorphism hub with virtualized note list and scrollable content"""
 
@@ -50,12 +135,51 @@ class HubView(QFrame):
     unlink_all_requested = pyqtSignal()
     delete_all_requested = pyqtSignal()
 
+    CHANGE_DELAY_MS = 300  # filesystem events within this window are handled together
+    SEARCH_DELAY_MS = 150  # typing pause before the list is re-ranked
+    FOUND_DELAY_MS = 250  # notes found by a running scan are added to the list this often
+
+    # (sort, label) in the order shown by the sort box
+    SORT_OPTIONS = [
+        ("recent", "Recent First"),
+        ("modified", "Last Modified"),
+        ("name_asc", "Name (A-Z)"),
+        ("name_desc", "Name (Z-A)"),
+        ("size", "Largest First"),
+        ("words", "Most Words"),
+    ]
+    WATCH_FILE_LIMIT = 2000  # notes watched individually; the rest only via their directory
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("HubView")
         self._local_notes = []
         self._current_sort = "recent"
+        self._sort_reversed = False
         self._search_query = ""
+        self._content_hits = {}
+        self._content_worker = None
+        self._index_worker = None
+        self._queued_syncs = {}  # root -> (paths, removed) waiting for the running sync
+        self._root_sections = {}  # root -> WorkspaceSection
+        self._catalog_worker = None
+        self._pending_changes = set()
+        self._found_notes = []  # streamed by the running reconcile, not yet listed
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.CHANGE_DELAY_MS)
+        self._change_timer.timeout.connect(self._apply_pending_changes)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        self._found_timer = QTimer(self)
+        self._found_timer.setSingleShot(True)
+        self._found_timer.setInterval(self.FOUND_DELAY_MS)
+        self._found_timer.timeout.connect(self._apply_found_notes)
         self.setup_ui()
 
     def setup_ui(self):
@@ -105,6 +229,13 @@ class HubView(QFrame):
         self.local_unlink_all_btn = local_container.findChild(QLabel, "unlink_all_btn")
         self.local_delete_all_btn = local_container.findChild(QLabel, "delete_all_btn")
 
+        # Workspace roots follow, collapsed ones costing only their header
+        self._roots_layout = QVBoxLayout()
+        self._roots_layout.setSpacing(24)
+        content_layout.addLayout(self._roots_layout)
+        for root in config.workspace_roots():
+            self._add_root_section(root)
+
         scroll_layout.addLayout(content_layout)
 
         scroll.setWidget(scroll_content)
@@ -139,16 +270,34 @@ class HubView(QFrame):
         refresh_btn.setToolTip("Refresh notes list")
         refresh_btn.clicked.connect(self.refresh_requested.emit)
 
+        # Content indexing progress, shown only while the indexer has work
+        self.index_status_label = QLabel("")
+        self.index_status_label.setObjectName("WelcomeSubtitle")
+        self.index_status_label.hide()
+
+        self.index_cancel_btn = TransparentToolButton(FIF.CLOSE)
+        self.index_cancel_btn.setToolTip("Stop indexing (resumes on next refresh)")
+        self.index_cancel_btn.clicked.connect(self._cancel_indexing)
+        self.index_cancel_btn.hide()
+
         new_btn = PrimaryPushButton(FIF.ADD, "New Note")
         new_btn.setFixedHeight(42)
         new_btn.clicked.connect(self.new_note.emit)
 
+        add_root_btn = PushButton(FIF.FOLDER_ADD, "Add Folder")
+        add_root_btn.setFixedHeight(42)
+        add_root_btn.setToolTip("Show another folder of notes in the hub")
+        add_root_btn.clicked.connect(self.add_workspace_root)
+
         open_btn = PushButton(FIF.FOLDER, "Open File")
         open_btn.setFixedHeight(42)
         open_btn.setToolTip("Open external file")
         open_btn.clicked.connect(self.open_file_requested.emit)
 
+        actions.addWidget(self.index_status_label)
+        actions.addWidget(self.index_cancel_btn)
         actions.addWidget(refresh_btn)
+        actions.addWidget(add_root_btn)
         actions.addWidget(open_btn)
         actions.addWidget(new_btn)
         header_layout.addLayout(actions)
@@ -169,13 +318,19 @@ class HubView(QFrame):
         self.search_input.textChanged.connect(self._on_search)
 
         self.sort_combo = ComboBox()
-        self.sort_combo.addItems(["Recent First", "Name (A-Z)", "Name (Z-A)"])
+        self.sort_combo.addItems([label for _, label in self.SORT_OPTIONS])
         self.sort_combo.setFixedWidth(150)
         self.sort_combo.setFixedHeight(38)
         self.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
 
+        self.sort_reverse_btn = TransparentToolButton(FIF.DOWN)
+        self.sort_reverse_btn.setFixedSize(38, 38)
+        self.sort_reverse_btn.setToolTip("Reverse order")
+        self.sort_reverse_btn.clicked.connect(self._on_sort_reversed)
+
         search_layout.addWidget(self.search_input, 1)
         search_layout.addWidget(self.sort_combo)
+        search_layout.addWidget(self.sort_reverse_btn)
 
         parent_layout.addWidget(search_container)
 
@@ -258,16 +413,287 @@ class HubView(QFrame):
         return container, card, count_badge
 
     def _on_search(self, text):
-        self._search_query = text.lower().strip()
+        # Typing restarts the delay; clearing the box applies at once
+        if text.strip():
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self._run_search()
+
+    def _run_search(self):
+        self._search_query = self.search_input.text().lower().strip()
+        if self._search_query:
+            # The list is re-ranked once the content matches arrive
+            self._search_contents(self._search_query)
+        else:
+            self._cancel_content_search()
+            self._content_hits = {}
+            self._refresh_display()
+
+    def _search_contents(self, query):
+        """Search note contents in the background, superseding any running search"""
+        self._cancel_content_search()
+        worker = _ContentSearchWorker(query, self)
+        worker.finished.connect(lambda: self._on_contents_searched(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._content_worker = worker
+        worker.start()
+
+    def _cancel_content_search(self):
+        if self._content_worker is not None:
+            self._content_worker.requestInterruption()
+            self._content_worker = None
+
+    def _on_contents_searched(self, worker):
+        if worker is not self._content_worker:
+            return
+        self._content_worker = None
+        if worker.hits is None or worker.query != self._search_query:
+            return
+        self._content_hits = worker.hits
         self._refresh_display()
 
+    def _root_notes(self, root):
+        if root is None:
+            return self._local_notes
+        section = self._root_sections.get(root)
+        return section.paths if section is not None else []
+
+    def _fold_sync(self, earlier, paths, removed, root):
+        """(paths, removed) of a sync that also covers an earlier one of the same root"""
+        earlier_paths, earlier_removed = earlier
+        if earlier_removed is None and removed is not None:
+            return list(self._root_notes(root)), None
+        if removed is not None:
+            paths = list(dict.fromkeys(earlier_paths + paths))
+            removed = list(dict.fromkeys(earlier_removed + list(removed)))
+        return paths, removed
+
+    def _sync_content_index(self, paths, removed=None, root=None):
+        """Re-index changed notes in the background, superseding any running sync
+
+        Without removed, the indexes are made to cover exactly paths among
+        the files of root, a workspace root or None for the local notes;
+        with it, only paths are refreshed and removed dropped. A superseded
+        sync's work is folded into the new one so nothing it was asked to do
+        is lost. Roots are synced one at a time: a sync for another root
+        than the running one waits its turn.
+        """
+        paths = list(paths)
+        running = self._index_worker
+        if running is not None and running.root != root:
+            queued = self._queued_syncs.get(root)
+            if queued is not None:
+                paths, removed = self._fold_sync(queued, paths, removed, root)
+            self._queued_syncs[root] = (paths, removed)
+            return
+        queued = self._queued_syncs.pop(root, None)
+        if queued is not None:
+            paths, removed = self._fold_sync(queued, paths, removed, root)
+        if running is not None:
+            running.requestInterruption()
+            paths, removed = self._fold_sync((running.paths, running.removed), paths, removed, root)
+        self._start_index_worker(paths, removed, root)
+
+    def _start_index_worker(self, paths, removed, root):
+        worker = _CorpusIndexWorker(paths, None if removed is None else list(removed), root, self)
+        worker.progress.connect(self._on_index_progress)
+        worker.finished.connect(lambda: self._on_index_synced(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._index_worker = worker
+        worker.start()
+
+    def reconcile_catalog(self, recent_files, notes_dir, touched=None):
+        """Show the cataloged notes now and patch them once the disk has been checked
+
+        touched limits the check to paths known to have changed (see
+        NoteCatalog.reconcile); without it every note is stat'ed.
+        """
+        if touched is None:
+            cached = note_catalog.paths()
+            if cached and cached != self._local_notes:
+                self.update_recent_list(cached, sync_index=False)
+            for section in self._root_sections.values():
+                section.refresh()
+        running = self._catalog_worker
+        if running is not None:
+            running.requestInterruption()
+            # A superseded reconcile still has to happen; widen this one to cover it
+            if running.touched is None:
+                touched = None
+            elif touched is not None:
+                touched = set(running.touched) | set(touched)
+        self._found_notes = []
+        self._found_timer.stop()
+        worker = _CatalogReconcileWorker(list(recent_files), notes_dir, touched, self)
+        worker.found.connect(lambda paths: self._on_notes_found(worker, paths))
+        worker.finished.connect(lambda: self._on_catalog_reconciled(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._catalog_worker = worker
+        worker.start()
+
+    def _on_notes_found(self, worker, paths):
+        if worker is not self._catalog_worker:
+            return
+        self._found_notes += paths
+        # Throttled rather than debounced, so a long scan keeps showing progress
+        if not self._found_timer.isActive():
+            self._found_timer.start()
+
+    def _apply_found_notes(self):
+        """List notes the running scan found, ahead of its final result"""
+        found, self._found_notes = self._found_notes, []
+        listed = set(self._local_notes)
+        fresh = [path for path in found if path not in listed]
+        if fresh:
+            self.update_recent_list(self._local_notes + fresh, sync_index=False)
+
+    def _on_catalog_reconciled(self, worker):
+        if worker is not self._catalog_worker:
+            return
+        self._catalog_worker = None
+        # The final list supersedes anything still streaming
+        self._found_notes = []
+        self._found_timer.stop()
+        if worker.result is None:
+            return
+        paths, changed = worker.result
+        listed = {index_key(path) for path in paths}
+        removed = [path for path in self._local_notes if index_key(path) not in listed]
+        if paths != self._local_notes:
+            # Applied to the list model as row inserts and removals, not a rebuild
+            self.update_recent_list(paths, sync_index=False)
+        self.local_list.refresh_notes(changed)
+        self._update_watches(paths)
+        if worker.touched is None:
+            self._sync_content_index(paths)
+        elif changed or removed:
+            self._sync_content_index(changed, removed)
+
+    def notes_changed(self, paths):
+        """Patch the list after the given notes were created, saved, moved or deleted"""
+        self.reconcile_catalog(
+            config.settings.get("recent_files", []), config.NOTES_DIR, touched=paths
+        )
+        for root, section in self._root_sections.items():
+            prefix = index_key(root).rstrip(os.sep) + os.sep
+            inside = [path for path in paths if index_key(path).startswith(prefix)]
+            if inside:
+                section.notes_changed(inside)
+
+    # -------------------------------------------------------------------------
+    # Workspace roots
+    # -------------------------------------------------------------------------
+
+    def _add_root_section(self, root):
+        section = WorkspaceSection(root)
+        section.noteClicked.connect(self.open_note.emit)
+        section.deleteRequested.connect(self.delete_note)
+        section.removeRequested.connect(self.remove_workspace_root)
+        section.indexRequested.connect(
+            lambda paths, removed: self._sync_content_index(paths, removed, root=root)
+        )
+        section.apply_view(
+            self._current_sort, self._search_query, self._content_hits, self._sort_reversed
+        )
+        self._root_sections[root] = section
+        self._roots_layout.addWidget(section)
+
+    def add_workspace_root(self):
+        folder = QFileDialog.getExistingDirectory(self, "Add Folder to Workspace")
+        if not folder:
+            return
+        folder = os.path.normpath(folder)
+        if not config.add_workspace_root(folder):
+            InfoBar.info("Already added", "This folder is already in the hub", duration=2000, parent=self)
+            return
+        self._add_root_section(folder)
+
+    def remove_workspace_root(self, root):
+        """Stop showing a root; its files stay on disk but leave the catalog and indexes"""
+        section = self._root_sections.pop(root, None)
+        if section is None:
+            return
+        section.shutdown()
+        section.deleteLater()
+        config.remove_workspace_root(root)
+        root_catalogs.discard(root)
+        # A full sync of nothing within the root drops its files from the indexes
+        self._sync_content_index([], root=root)
+
+    # -------------------------------------------------------------------------
+    # Filesystem watching
+    # -------------------------------------------------------------------------
+
+    def _update_watches(self, paths):
+        """Watch the notes dir, the directories of listed notes and the notes themselves"""
+        directories = {str(config.NOTES_DIR)} | {os.path.dirname(path) for path in paths}
+        files = set(paths[: self.WATCH_FILE_LIMIT])
+        for wanted, watched in (
+            (directories, set(self._watcher.directories())),
+            (files, set(self._watcher.files())),
+        ):
+            stale = watched - wanted
+            if stale:
+                self._watcher.removePaths(list(stale))
+            fresh = wanted - watched
+            if fresh:
+                self._watcher.addPaths(list(fresh))
+
+    def _on_path_changed(self, path):
+        self._pending_changes.add(path)
+        self._change_timer.start()
+
+    def _apply_pending_changes(self):
+        touched, self._pending_changes = self._pending_changes, set()
+        # Directory events carry no file name; the notes-dir listing picks up
+        # new and removed files, and recent files are always re-checked
+        self.notes_changed(touched)
+
+    def _on_index_progress(self, done, total):
+        if self.sender() is not self._index_worker:
+            return
+        busy = done < total
+        self.index_status_label.setText(f"Indexing {done:,} / {total:,}")
+        self.index_status_label.setVisible(busy)
+        self.index_cancel_btn.setVisible(busy)
+
+    def _cancel_indexing(self):
+        """Stop the running indexer; its committed chunks are kept"""
+        self._queued_syncs = {}
+        if self._index_worker is not None:
+            self._index_worker.requestInterruption()
+        self.index_cancel_btn.hide()
+        self.index_status_label.setText("Indexing paused")
+
+    def _on_index_synced(self, worker):
+        if worker is not self._index_worker:
+            return
+        self._index_worker = None
+        if worker.changed is not None:
+            self.index_status_label.hide()
+            self.index_cancel_btn.hide()
+            if self._queued_syncs:
+                root, (paths, removed) = self._queued_syncs.popitem()
+                self._start_index_worker(paths, removed, root)
+        if worker.changed and self._search_query:
+            self._search_contents(self._search_query)
+
     def _on_sort_changed(self, index):
-        sort_options = ["recent", "name_asc", "name_desc"]
-        self._current_sort = sort_options[index]
+        self._current_sort = self.SORT_OPTIONS[index][0]
+        self._refresh_display()
+
+    def _on_sort_reversed(self):
+        self._sort_reversed = not self._sort_reversed
+        self.sort_reverse_btn.setIcon(FIF.UP if self._sort_reversed else FIF.DOWN)
         self._refresh_display()
 
     def _refresh_display(self):
         self.update_recent_list(self._local_notes, skip_store=True)
+        for section in self._root_sections.values():
+            section.apply_view(
+                self._current_sort, self._search_query, self._content_hits, self._sort_reversed
+            )
 
     def delete_note(self, path):
         name = os.path.basename(path)
@@ -283,7 +709,7 @@ class HubView(QFrame):
             if file_manager.delete_file(path):
                 config.remove_recent_file(path)
                 self.file_deleted.emit(path)
-                self.refresh_requested.emit()
+                self.notes_changed([path])
                 InfoBar.success(
                     "Deleted", "Note deleted successfully", duration=2000, parent=self
                 )
@@ -304,7 +730,7 @@ class HubView(QFrame):
 
         if reply == QMessageBox.StandardButton.Yes:
             config.remove_recent_file(path)
-            self.refresh_requested.emit()
+            self.notes_changed([path])
             InfoBar.info(
                 "Removed", f"'{name}' removed from history", duration=2000, parent=self
             )
@@ -359,9 +785,11 @@ class HubView(QFrame):
                 parent=self,
             )
 
-    def update_recent_list(self, recent_files, skip_store=False):
+    def update_recent_list(self, recent_files, skip_store=False, sync_index=True):
         if not skip_store:
             self._local_notes = recent_files or []
+            if sync_index:
+                self._sync_content_index(self._local_notes)
 
         sort = self._current_sort
         search = self._search_query
@@ -370,7 +798,12 @@ class HubView(QFrame):
             self.local_count_badge.setText(str(len(self._local_notes)))
 
         self.local_list.set_notes(
-            self._local_notes, is_cloud=False, sort=sort, search=search
+            self._local_notes,
+            is_cloud=False,
+            sort=sort,
+            search=search,
+            content_hits=self._content_hits,
+            reverse=self._sort_reversed,
         )
 
         if self.local_unlink_all_btn:
@@ -0,0 +1,918 @@
+"""
+Glassnotes Large File Viewer
+Read-only paged viewer that renders only the visible lines of a memory-mapped file
+"""
+
+import os
+import re
+import uuid
+from array import array
+from bisect import bisect_left
+
+from PyQt6.QtWidgets import QAbstractScrollArea, QApplication
+from PyQt6.QtGui import QFont, QColor, QPainter, QFontMetrics
+from PyQt6.QtCore import Qt, QThread, QRect, pyqtSignal
+
+from src.ui.editor import create_editor_font
+from src.ui.styles import GlassColors
+from src.logic.config import config
+from src.logic.large_file import LargeFile, utf8_boundary, utf8_char_end, utf8_char_start
+from src.logic.piece_table import PieceTable
+from src.logic.search import DONE, FAILED, TIMEOUT, is_line_local, jump_index, run_isolated
+
+
+class _LineIndexWorker(QThread):
+    """Builds the newline index of a LargeFile off the UI thread"""
+
+    progress = pyqtSignal(int)  # lines indexed so far
+
+    def __init__(self, large_file, parent=None):
+        super().__init__(parent)
+        self.large_file = large_file
+
+    def run(self):
+        self.large_file.build_index(
+            progress=self.progress.emit, cancelled=self.isInterruptionRequested
+        )
+
+
+class _FindAllWorker(QThread):
+    """Collects every match of a bytes pattern off the UI thread"""
+
+    progress = pyqtSignal(int)  # matches found so far
+
+    def __init__(self, buffer, pattern, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.pattern = pattern
+        self.result = None
+        self.status = None
+        # Filled in place by literal scans, so matches can be used before the scan ends
+        self.partial = (array("q"), array("q"))
+        # Regexes run in a child process; its job is captured before any further edit
+        self.job = buffer.scan_job(pattern) if is_line_local(pattern) else None
+
+    def run(self):
+        if self.job is not None:
+            timeout = config.get("regex_search_timeout_ms", 3000) / 1000
+            target, args = self.job
+            self.status, result = run_isolated(
+                target, args, timeout, cancelled=self.isInterruptionRequested
+            )
+            if self.status == DONE:
+                self.result = result
+            elif self.status == FAILED:
+                print(f"Regex search failed: {result}")
+            return
+        try:
+            self.result = self.buffer.find_all(
+                self.pattern,
+                progress=self.progress.emit,
+                cancelled=self.isInterruptionRequested,
+                into=self.partial,
+            )
+        except Exception as e:
+            # The buffer may be edited under a scan that is about to be discarded
+            print(f"Search aborted: {e}")
+            self.result = None
+
+
+class LargeFileViewer(QAbstractScrollArea):
+    """Viewer with the Editor's look that paints only the lines in view"""
+
+    MAX_LINE_BYTES = 4096  # longer lines are truncated for display
+
+    cursor_position_changed = pyqtSignal(int, int)  # line, column
+    search_highlight_changed = pyqtSignal(int, int)  # match_count, current_index
+    search_progress = pyqtSignal(int)  # partial match count while a background search runs
+    search_failed = pyqtSignal(str)  # reason a search produced no result
+    index_progress = pyqtSignal(int, int)  # lines indexed, file size in bytes
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.setObjectName("LargeFileViewer")
+
+        # Same tab bookkeeping as Editor so session and tab code can treat both alike
+        self.file_path = path
+        self.drive_id = None
+        self.session_id = uuid.uuid4().hex
+        self.session_dirty = False
+
+        self._current_line = 0
+        self._max_line_width = 0
+
+        # Search state
+        self._search_pattern = None
+        self._search_worker = None
+        self._match_starts = []
+        self._match_ends = []
+        self._search_matches = self._match_starts
+        self._current_match_index = -1
+        self._pending_jump = None  # (forward, wrap, anchor, inclusive) of a find waiting on the worker
+        self._jump_target = None  # match offset a find landed on before its scan finished
+
+        self.editor_font = create_editor_font()
+        self.setFont(self.editor_font)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.viewport().setCursor(Qt.CursorShape.IBeamCursor)
+        self.setStyleSheet("#LargeFileViewer { background: rgb(25, 20, 40); border: none; }")
+
+        self._open(path)
+
+    def _open(self, path):
+        """Map the file and start indexing its lines in the background"""
+        self.large_file = LargeFile(path)
+        self._update_scrollbars()
+
+        self._index_worker = _LineIndexWorker(self.large_file, self)
+        self._index_worker.progress.connect(self._on_index_progress)
+        self._index_worker.finished.connect(self._on_index_finished)
+        self._index_worker.start()
+
+    @property
+    def buffer(self):
+        """Line source being rendered"""
+        return self.large_file
+
+    # -------------------------------------------------------------------------
+    # Geometry
+    # -------------------------------------------------------------------------
+
+    def _line_height(self):
+        return QFontMetrics(self.editor_font).height()
+
+    def _visible_line_count(self):
+        return max(1, self.viewport().height() // self._line_height())
+
+    def _gutter_width(self):
+        digits = max(3, len(str(self.buffer.line_count)))
+        return 24 + QFontMetrics(self.editor_font).horizontalAdvance("9") * digits
+
+    def _update_scrollbars(self):
+        visible = self._visible_line_count()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(0, self.buffer.line_count - visible))
+        vbar.setPageStep(visible)
+        vbar.setSingleStep(1)
+
+        hbar = self.horizontalScrollBar()
+        text_width = self.viewport().width() - self._gutter_width() - 8
+        hbar.setRange(0, max(0, self._max_line_width - text_width))
+        hbar.setPageStep(max(1, text_width))
+        hbar.setSingleStep(QFontMetrics(self.editor_font).horizontalAdvance("9") * 4)
+
+    def _on_index_progress(self, lines):
+        self._update_scrollbars()
+        self.viewport().update()
+        self.index_progress.emit(lines, self.buffer.size)
+
+    def _on_index_finished(self):
+        """Hook for subclasses once the line index is complete"""
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    # -------------------------------------------------------------------------
+    # Painting
+    # -------------------------------------------------------------------------
+
+    def _get_accent_color(self):
+        """Get current accent color from settings"""
+        return QColor(config.settings.get("accent_color", "#9D46FF"))
+
+    def paintEvent(self, event):
+        """Paint the gutter and the visible window of lines"""
+        painter = QPainter(self.viewport())
+        painter.setFont(self.editor_font)
+        metrics = QFontMetrics(self.editor_font)
+        rect = self.viewport().rect()
+        line_height = metrics.height()
+        gutter = self._gutter_width()
+        accent = self._get_accent_color()
+
+        painter.fillRect(rect, QColor(25, 20, 40))
+        painter.fillRect(QRect(0, 0, gutter, rect.height()), QColor(20, 16, 35))
+        border_color = QColor(accent)
+        border_color.setAlpha(60)
+        painter.setPen(border_color)
+        painter.drawLine(gutter - 1, 0, gutter - 1, rect.height())
+
+        line_color = QColor(accent)
+        line_color.setAlpha(25)
+        match_color = QColor(accent)
+        match_color.setAlpha(60)
+        current_match_color = QColor(accent)
+        current_match_color.setAlpha(140)
+        soft_accent = QColor(accent)
+        soft_accent.setAlpha(150)
+
+        number_font = QFont(self.editor_font)
+        number_font.setPointSize(max(1, self.editor_font.pointSize() - 2))
+
+        first = self.verticalScrollBar().value()
+        last = min(self.buffer.line_count, first + self._visible_line_count() + 1)
+        x_offset = self.horizontalScrollBar().value()
+        text_left = gutter + 8 - x_offset
+
+        painter.setClipRect(QRect(gutter, 0, rect.width() - gutter, rect.height()))
+        for line in range(first, last):
+            top = (line - first) * line_height
+            if line == self._current_line:
+                painter.fillRect(QRect(gutter, top, rect.width(), line_height), line_color)
+
+            start, raw = self._line_window(line)
+            text = raw.decode("utf-8", errors="replace")
+            self._max_line_width = max(self._max_line_width, metrics.horizontalAdvance(text))
+
+            for match_index, m_start, m_end in self._matches_in_range(start, start + len(raw)):
+                col_start = len(raw[: m_start - start].decode("utf-8", errors="replace"))
+                col_end = len(raw[: m_end - start].decode("utf-8", errors="replace"))
+                x1 = text_left + metrics.horizontalAdvance(text[:col_start])
+                x2 = text_left + metrics.horizontalAdvance(text[:col_end])
+                color = (
+                    current_match_color
+                    if match_index == self._current_match_index
+                    else match_color
+                )
+                painter.fillRect(QRect(x1, top, x2 - x1, line_height), color)
+
+            painter.setPen(QColor(GlassColors.TEXT_PRIMARY))
+            painter.drawText(
+                text_left, top, metrics.horizontalAdvance(text) + 1, line_height,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text,
+            )
+
+        painter.setClipping(False)
+        painter.setFont(number_font)
+        for line in range(first, last):
+            top = (line - first) * line_height
+            painter.setPen(accent if line == self._current_line else soft_accent)
+            painter.drawText(
+                0, top, gutter - 12, line_height,
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                str(line + 1),
+            )
+
+        painter.end()
+        self._update_scrollbars()
+
+    def _line_window(self, line):
+        """(document offset, bytes) of the part of a line that is painted"""
+        start, _ = self.buffer.line_span(line)
+        return start, self.buffer.line_bytes(line, self.MAX_LINE_BYTES)
+
+    def _matches_in_range(self, start, end):
+        """Yield (index, start, end) of matches that begin inside a byte range"""
+        lo = bisect_left(self._match_starts, start)
+        hi = bisect_left(self._match_starts, end)
+        for i in range(lo, hi):
+            yield i, self._match_starts[i], self._match_ends[i]
+
+    # -------------------------------------------------------------------------
+    # Navigation
+    # -------------------------------------------------------------------------
+
+    def _set_current_line(self, line):
+        line = max(0, min(line, self.buffer.line_count - 1))
+        self._current_line = line
+        self.cursor_position_changed.emit(line + 1, 1)
+        self.viewport().update()
+
+    def _ensure_line_visible(self, line):
+        vbar = self.verticalScrollBar()
+        visible = self._visible_line_count()
+        if line < vbar.value():
+            vbar.setValue(line)
+        elif line >= vbar.value() + visible:
+            vbar.setValue(line - visible + 1)
+
+    def go_to_line(self, line):
+        """Move to a 1-based line number"""
+        target = max(0, min(line - 1, self.buffer.line_count - 1))
+        self._set_current_line(target)
+        self.verticalScrollBar().setValue(target - self._visible_line_count() // 2)
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        visible = self._visible_line_count()
+        ctrl = event.modifiers() & Qt.KeyboardModifier.ControlModifier
+
+        # Copy the current line
+        if key == Qt.Key.Key_C and ctrl:
+            QApplication.clipboard().setText(self.buffer.line_text(self._current_line))
+            return
+
+        moves = {
+            Qt.Key.Key_Up: -1,
+            Qt.Key.Key_Down: 1,
+            Qt.Key.Key_PageUp: -visible,
+            Qt.Key.Key_PageDown: visible,
+        }
+        if key in moves:
+            self._set_current_line(self._current_line + moves[key])
+        elif key == Qt.Key.Key_Home and ctrl:
+            self._set_current_line(0)
+        elif key == Qt.Key.Key_End and ctrl:
+            self._set_current_line(self.buffer.line_count - 1)
+        else:
+            super().keyPressEvent(event)
+            return
+        self._ensure_line_visible(self._current_line)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            row = int(event.position().y()) // self._line_height()
+            self._set_current_line(self.verticalScrollBar().value() + row)
+        super().mousePressEvent(event)
+
+    def wheelEvent(self, event):
+        """Handle ctrl+wheel for zoom"""
+        if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+            if event.angleDelta().y() > 0:
+                self.zoom_in()
+            else:
+                self.zoom_out()
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    # -------------------------------------------------------------------------
+    # Zoom
+    # -------------------------------------------------------------------------
+
+    def set_font_size(self, size):
+        """Change font size"""
+        self.editor_font.setPointSize(max(1, int(size)))
+        self.setFont(self.editor_font)
+        self._max_line_width = 0
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def zoom_in(self):
+        """Increase font size"""
+        current_size = self.editor_font.pointSize()
+        if current_size < 32:
+            self.set_font_size(current_size + 1)
+
+    def zoom_out(self):
+        """Decrease font size"""
+        current_size = self.editor_font.pointSize()
+        if current_size > 8:
+            self.set_font_size(current_size - 1)
+
+    # -------------------------------------------------------------------------
+    # Search (same surface as Editor so MainWindow can drive both)
+    # -------------------------------------------------------------------------
+
+    def _set_matches(self, pattern, starts, ends):
+        self._search_pattern = pattern
+        self._match_starts = starts
+        self._match_ends = ends
+        self._search_matches = self._match_starts
+        self._current_match_index = -1
+
+    def _run_search(self, text, case_sensitive=False, whole_word=False, regex=False):
+        """Whether the matches of this search are ready
+
+        The mapping is never scanned on the UI thread: otherwise the scan
+        already running for this search is left to finish, or one is started.
+        """
+        try:
+            pattern = LargeFile.compile_pattern(text, case_sensitive, whole_word, regex)
+        except re.error:
+            self.search_failed.emit("invalid pattern")
+            return False
+        worker = self._search_worker
+        if pattern == self._search_pattern and worker is None:
+            return True
+        if worker is None or worker.pattern != pattern:
+            self._highlight_search_matches(text, case_sensitive, whole_word, regex)
+        return False
+
+    def _queue_jump(self, forward, wrap):
+        """Move to a match once the running search has found the one to land on"""
+        if self._search_worker is None:
+            return
+        if self._jump_target is not None:
+            # Pressed again after landing early: move on from that match
+            anchor, inclusive = self._jump_target, False
+        else:
+            anchor, inclusive = self._anchor_offset(), True
+        self._pending_jump = (forward, wrap, anchor, inclusive)
+        self._jump_target = None
+
+    def _resolve_jump(self, starts, count, final):
+        """Match index the queued find lands on, or None while undecided"""
+        forward, wrap, anchor, inclusive = self._pending_jump
+        index = jump_index(starts, count, anchor, forward, wrap, final, inclusive)
+        if index is not None:
+            self._pending_jump = None
+        return index
+
+    def _on_search_progress(self, worker, count):
+        self.search_progress.emit(count)
+        if worker is not self._search_worker or self._pending_jump is None:
+            return
+        starts, ends = worker.partial
+        # Starts are appended before ends, so every counted match is complete
+        index = self._resolve_jump(starts, len(ends), final=False)
+        if index is not None and index >= 0:
+            self._jump_target = starts[index]
+            line = self.buffer.line_at_offset(self._jump_target)
+            self._set_current_line(line)
+            self._ensure_line_visible(line)
+
+    def _cancel_search_worker(self):
+        """Abandon the running background search, if any"""
+        self._pending_jump = None
+        self._jump_target = None
+        if self._search_worker is not None:
+            self._search_worker.requestInterruption()
+            self._search_worker = None
+
+    def _on_search_finished(self, worker):
+        """Adopt a finished background search unless it was superseded"""
+        if worker is not self._search_worker:
+            return
+        if worker.result is None:
+            if worker.status in (TIMEOUT, FAILED):
+                self._search_worker = None
+                self.search_failed.emit(
+                    "search aborted" if worker.status == TIMEOUT else "search failed"
+                )
+            return
+        self._search_worker = None
+        pending, target = self._pending_jump, self._jump_target
+        self._pending_jump = self._jump_target = None
+        self._set_matches(worker.pattern, *worker.result)
+        self.viewport().update()
+
+        # Finish a find that was waiting on this search
+        index = -1
+        if pending is not None:
+            self._pending_jump = pending
+            index = self._resolve_jump(self._match_starts, len(self._match_starts), final=True)
+        elif target is not None:
+            index = bisect_left(self._match_starts, target)
+        if index >= 0:
+            self._select_match(index)
+        else:
+            self.search_highlight_changed.emit(len(self._match_starts), -1)
+
+    def is_search_pending(self):
+        """Whether a background search is still running"""
+        return self._search_worker is not None
+
+    def _highlight_search_matches(self, text, case_sensitive=False, whole_word=False, regex=False):
+        """Find and highlight all matches in the mapped file on a worker thread"""
+        if not text:
+            self.clear_search_state()
+            self.search_highlight_changed.emit(0, -1)
+            return
+
+        try:
+            pattern = LargeFile.compile_pattern(text, case_sensitive, whole_word, regex)
+        except re.error:
+            self.clear_search_state()
+            self.search_failed.emit("invalid pattern")
+            return
+        if pattern == self._search_pattern and self._search_worker is None:
+            self._current_match_index = -1
+            self.viewport().update()
+            self.search_highlight_changed.emit(len(self._match_starts), -1)
+            return
+
+        self._cancel_search_worker()
+        self._set_matches(None, [], [])
+        self.viewport().update()
+
+        worker = _FindAllWorker(self.buffer, pattern, self)
+        worker.progress.connect(lambda count: self._on_search_progress(worker, count))
+        worker.finished.connect(lambda: self._on_search_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._search_worker = worker
+        worker.start()
+        self.search_progress.emit(0)
+
+    def _anchor_offset(self):
+        if self._current_match_index >= 0:
+            return self._match_starts[self._current_match_index]
+        return self.buffer.line_start(self._current_line)
+
+    def find_next(self, text, case_sensitive=False, whole_word=False, wrap=True, regex=False):
+        """Find next occurrence of text"""
+        if not text:
+            return False
+        if not self._run_search(text, case_sensitive, whole_word, regex):
+            self._queue_jump(True, wrap)
+            return False
+        index = jump_index(
+            self._match_starts,
+            len(self._match_starts),
+            self._anchor_offset(),
+            wrap=wrap,
+            inclusive=self._current_match_index < 0,
+        )
+        if index < 0:
+            return False
+        self._select_match(index)
+        return True
+
+    def find_previous(self, text, case_sensitive=False, whole_word=False, wrap=True, regex=False):
+        """Find previous occurrence of text"""
+        if not text:
+            return False
+        if not self._run_search(text, case_sensitive, whole_word, regex):
+            self._queue_jump(False, wrap)
+            return False
+        index = jump_index(
+            self._match_starts, len(self._match_starts), self._anchor_offset(), False, wrap
+        )
+        if index < 0:
+            return False
+        self._select_match(index)
+        return True
+
+    def _select_match(self, index):
+        """Move to the match at the given index"""
+        self._current_match_index = index
+        line = self.buffer.line_at_offset(self._match_starts[index])
+        self._set_current_line(line)
+        self._ensure_line_visible(line)
+        self.search_highlight_changed.emit(len(self._match_starts), index)
+
+    def clear_search_state(self):
+        """Clear search state and highlights"""
+        self._cancel_search_worker()
+        self._set_matches(None, [], [])
+        self.viewport().update()
+
+    def close_file(self):
+        """Stop indexing and searching, then release the mapping"""
+        self._cancel_search_worker()
+        for worker in [self._index_worker, *self.findChildren(_FindAllWorker)]:
+            worker.requestInterruption()
+            worker.wait()
+        self.large_file.close()
+
+
+class LargeFileEditor(LargeFileViewer):
+    """Editable large-document mode backed by a piece table over the mapping
+
+    The tab stays read-only while the line index is being built; once it is
+    complete edits go into a PieceTable, so only the append buffer grows and
+    the original bytes are never loaded into a QTextDocument.
+    """
+
+    content_changed = pyqtSignal()
+    saved = pyqtSignal(str)  # path, once the written file has replaced it
+    save_failed = pyqtSignal(str)  # reason
+
+    def __init__(self, path, parent=None):
+        self.piece_table = None
+        self.is_modified = False
+        self._pending_save = None  # (index worker, written LargeFile, target path)
+        self._caret_byte = 0  # caret offset within the current line
+        self._window_start = 0  # first painted byte of the current line
+        self._newline = b"\n"
+        super().__init__(path, parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_InputMethodEnabled, True)
+
+    @property
+    def buffer(self):
+        """Line source being rendered"""
+        return self.piece_table if self.piece_table is not None else self.large_file
+
+    def _on_index_finished(self):
+        """Enable editing once every newline offset is known"""
+        if not self.large_file.indexed:
+            return
+        self.piece_table = PieceTable(self.large_file)
+        if self.large_file.line_count > 1:
+            _, end = self.large_file.line_span(0)
+            if self.large_file.data[end : end + 2] == b"\r\n":
+                self._newline = b"\r\n"
+        self.viewport().update()
+
+    # -------------------------------------------------------------------------
+    # Caret
+    # -------------------------------------------------------------------------
+
+    def _caret_offset(self):
+        """Byte offset of the caret in the document"""
+        return self.buffer.line_start(self._current_line) + self._caret_byte
+
+    def _move_caret_to_offset(self, offset):
+        line = self.buffer.line_at_offset(offset)
+        self._caret_byte = offset - self.buffer.line_start(line)
+        self._set_current_line(line)
+        self._ensure_line_visible(line)
+
+    def _char_boundary(self, line_start, pos):
+        """Move a line-relative byte offset back onto a character start"""
+        base = max(0, pos - 3)
+        around = self.buffer.read(line_start + base, pos + 1 - base)
+        return base + utf8_boundary(around, pos - base)
+
+    def _set_current_line(self, line):
+        previous = self._current_line
+        super()._set_current_line(line)
+        if self.piece_table is None:
+            return
+        if self._current_line != previous:
+            self._window_start = 0
+        start, end = self.buffer.line_span(self._current_line)
+        self._caret_byte = self._char_boundary(start, min(self._caret_byte, end - start))
+
+        # Slide the painted part of a long line so it holds the caret
+        window = self.MAX_LINE_BYTES
+        if not self._window_start <= self._caret_byte <= self._window_start + window:
+            first = max(0, min(self._caret_byte - window // 2, end - start - window))
+            self._window_start = self._char_boundary(start, first)
+        self.cursor_position_changed.emit(self._current_line + 1, self._caret_byte + 1)
+
+    def _line_window(self, line):
+        """The current line is painted from the window that holds the caret"""
+        if line != self._current_line or not self._window_start:
+            return super()._line_window(line)
+        start, end = self.buffer.line_span(line)
+        first = start + self._window_start
+        return first, self.buffer.read(first, min(end - first, self.MAX_LINE_BYTES))
+
+    def _prev_char_length(self):
+        """Byte length of the character before the caret, 0 at the line start"""
+        offset = self._caret_offset()
+        base = max(self.buffer.line_start(self._current_line), offset - 4)
+        before = self.buffer.read(base, offset - base)
+        return len(before) - utf8_char_start(before, len(before)) if before else 0
+
+    def _next_char_length(self):
+        """Byte length of the character after the caret, 0 at the line end"""
+        offset = self._caret_offset()
+        end = self.buffer.line_span(self._current_line)[1]
+        after = self.buffer.read(offset, min(4, end - offset))
+        return utf8_char_end(after, 0) if after else 0
+
+    def _char_width(self):
+        return QFontMetrics(self.editor_font).horizontalAdvance("9")
+
+    def _caret_x(self):
+        """Horizontal position of the caret relative to the text start"""
+        first, raw = self._line_window(self._current_line)
+        before = raw[: self._caret_offset() - first].decode("utf-8", errors="replace")
+        return QFontMetrics(self.editor_font).horizontalAdvance(before)
+
+    def _ensure_caret_visible(self):
+        """Scroll horizontally so the caret stays inside the viewport"""
+        x = self._caret_x()
+        self._max_line_width = max(self._max_line_width, x + self._char_width())
+        self._update_scrollbars()
+        hbar = self.horizontalScrollBar()
+        width = self.viewport().width() - self._gutter_width() - 8 - self._char_width()
+        if x < hbar.value():
+            hbar.setValue(x)
+        elif x > hbar.value() + width:
+            hbar.setValue(x - width)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.piece_table is None or not self.hasFocus():
+            return
+
+        row = self._current_line - self.verticalScrollBar().value()
+        if row < 0 or row > self._visible_line_count():
+            return
+        metrics = QFontMetrics(self.editor_font)
+        x = self._gutter_width() + 8 - self.horizontalScrollBar().value() + self._caret_x()
+        painter = QPainter(self.viewport())
+        painter.fillRect(
+            QRect(x, row * metrics.height(), 2, metrics.height()),
+            QColor(GlassColors.TEXT_PRIMARY),
+        )
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.piece_table is not None:
+            row = int(event.position().y()) // self._line_height()
+            line = min(self.verticalScrollBar().value() + row, self.buffer.line_count - 1)
+            first, raw = self._line_window(line)
+            text_left = self._gutter_width() + 8 - self.horizontalScrollBar().value()
+            col = round((event.position().x() - text_left) / self._char_width())
+            pos = 0
+            for _ in range(max(0, col)):
+                if pos >= len(raw):
+                    break
+                pos = utf8_char_end(raw, pos)
+            self._caret_byte = first + pos - self.buffer.line_start(line)
+        super().mousePressEvent(event)
+
+    # -------------------------------------------------------------------------
+    # Editing
+    # -------------------------------------------------------------------------
+
+    def _after_edit(self, caret_offset):
+        """Refresh view state after the piece table changed"""
+        self.is_modified = True
+        self.clear_search_state()
+        self._move_caret_to_offset(caret_offset)
+        self._update_scrollbars()
+        self.viewport().update()
+        self.content_changed.emit()
+
+    def insert_text(self, text):
+        """Insert text at the caret"""
+        if self.piece_table is None or not text:
+            return
+        offset = self._caret_offset()
+        data = text.encode("utf-8")
+        self.piece_table.insert(offset, data)
+        self._after_edit(offset + len(data))
+
+    def _delete_backward(self):
+        offset = self._caret_offset()
+        if offset == 0:
+            return
+        if self._caret_byte > 0:
+            length = self._prev_char_length()
+        else:
+            # Join with the previous line: remove its line ending
+            length = offset - self.buffer.line_span(self._current_line - 1)[1]
+        self.piece_table.delete(offset - length, length)
+        self._after_edit(offset - length)
+
+    def _delete_forward(self):
+        offset = self._caret_offset()
+        length = self._next_char_length()
+        if not length:
+            if self._current_line + 1 >= self.buffer.line_count:
+                return
+            length = self.buffer.line_start(self._current_line + 1) - offset
+        self.piece_table.delete(offset, length)
+        self._after_edit(offset)
+
+    def keyPressEvent(self, event):
+        if self.piece_table is None:
+            super().keyPressEvent(event)
+            return
+
+        key = event.key()
+        modifiers = event.modifiers()
+        ctrl = modifiers & Qt.KeyboardModifier.ControlModifier
+
+        if key == Qt.Key.Key_Backspace:
+            self._delete_backward()
+        elif key == Qt.Key.Key_Delete:
+            self._delete_forward()
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.insert_text(self._newline.decode("ascii"))
+        elif key == Qt.Key.Key_Left and not ctrl:
+            if self._caret_byte > 0:
+                self._caret_byte -= self._prev_char_length()
+                self._set_current_line(self._current_line)
+            elif self._current_line > 0:
+                start, end = self.buffer.line_span(self._current_line - 1)
+                self._caret_byte = end - start
+                self._set_current_line(self._current_line - 1)
+        elif key == Qt.Key.Key_Right and not ctrl:
+            length = self._next_char_length()
+            if length:
+                self._caret_byte += length
+                self._set_current_line(self._current_line)
+            elif self._current_line + 1 < self.buffer.line_count:
+                self._caret_byte = 0
+                self._set_current_line(self._current_line + 1)
+        elif key == Qt.Key.Key_Home and not ctrl:
+            self._caret_byte = 0
+            self._set_current_line(self._current_line)
+        elif key == Qt.Key.Key_End and not ctrl:
+            start, end = self.buffer.line_span(self._current_line)
+            self._caret_byte = end - start
+            self._set_current_line(self._current_line)
+        elif event.text() and event.text().isprintable() and not ctrl:
+            self.insert_text(event.text())
+        elif key == Qt.Key.Key_Tab:
+            self.insert_text("\t")
+        else:
+            super().keyPressEvent(event)
+            return
+        self._ensure_line_visible(self._current_line)
+        self._ensure_caret_visible()
+        self.viewport().update()
+
+    def undo(self):
+        """Undo the last edit"""
+        if self.piece_table is not None:
+            offset = self.piece_table.undo()
+            if offset is not None:
+                self._after_edit(offset)
+
+    def redo(self):
+        """Redo the last undone edit"""
+        if self.piece_table is not None:
+            offset = self.piece_table.redo()
+            if offset is not None:
+                self._after_edit(offset)
+
+    def save_to(self, path):
+        """Stream the pieces to a temp file that replaces path once it is indexed
+
+        The piece table, its history and any further edits stay live while the
+        written copy's line index is built, so the tab never turns read-only;
+        saved or save_failed is emitted when the swap is done. Returns False
+        if the file could not be written.
+        """
+        if self.piece_table is None or self._pending_save is not None:
+            return False
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                self.piece_table.write_to(f)
+            written = LargeFile(tmp_path)
+        except Exception as e:
+            print(f"Error saving: {e}")
+            self._remove_temp(tmp_path)
+            return False
+
+        self.piece_table.start_journal()
+        self.is_modified = False
+        worker = _LineIndexWorker(written, self)
+        worker.finished.connect(lambda: self._finish_save(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._pending_save = (worker, written, path)
+        worker.start()
+        return True
+
+    def is_save_pending(self):
+        """Whether a written file is still waiting to replace its target"""
+        return self._pending_save is not None
+
+    @staticmethod
+    def _remove_temp(tmp_path):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def _release_mapping(self):
+        """Stop every reader of the current mapping and close it"""
+        self._cancel_search_worker()
+        for worker in self.findChildren(_FindAllWorker):
+            worker.requestInterruption()
+            worker.wait()
+        self.large_file.close()
+
+    def _finish_save(self, worker):
+        """Swap the indexed copy over the target, carrying the piece table's history across"""
+        if self._pending_save is None or self._pending_save[0] is not worker:
+            return
+        _, written, path = self._pending_save
+        self._pending_save = None
+        written.close()
+        if not written.indexed:
+            self.piece_table.stop_journal()
+            self._remove_temp(written.path)
+            return
+
+        # The target's mapping must be released before the file can be replaced
+        same_file = os.path.normcase(os.path.abspath(path)) == os.path.normcase(
+            os.path.abspath(self.large_file.path)
+        )
+        if same_file:
+            self._release_mapping()
+        try:
+            os.replace(written.path, path)
+            large_file = LargeFile(path, written.line_offsets)
+        except Exception as e:
+            print(f"Error saving: {e}")
+            if same_file:
+                self.large_file.reopen()
+            self.piece_table.stop_journal()
+            self._remove_temp(written.path)
+            # The tab goes on showing the file it was last saved to
+            self.file_path = self.large_file.path
+            self.is_modified = True
+            self.save_failed.emit(str(e))
+            return
+
+        if not same_file:
+            self._release_mapping()
+        self.large_file = large_file
+        self.piece_table = self.piece_table.rebased(large_file)
+        self.viewport().update()
+        self.saved.emit(path)
+
+    def close_file(self):
+        """Abandon a save still being indexed, then release the mapping"""
+        if self._pending_save is not None:
+            worker, written, _ = self._pending_save
+            self._pending_save = None
+            worker.requestInterruption()
+            worker.wait()
+            written.close()
+            self._remove_temp(written.path)
+        super().close_file()
@@ -5,7 +5,7 @@ Premium glassmorphism window with status bar, settings integration, and polished
 
 import sys
 import os
-from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QSize, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QKeySequence, QShortcut, QFont
 from PyQt6.QtWidgets import (
     QApplication,
@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QFrame,
     QStatusBar,
+    QInputDialog,
 )
 
 from qfluentwidgets import (
@@ -32,13 +33,20 @@ from qfluentwidgets import (
     TransparentToolButton,
 )
 
-from src.ui.editor import Editor
+from src.ui.editor import Editor, EditorTab, NoteDocument
+from src.ui.large_file_viewer import LargeFileViewer, LargeFileEditor
 from src.ui.hub import HubView
 from src.ui.settings import SettingsView
 from src.ui.search_bar import SearchBar
+from src.ui.search_results import SearchResultsPanel
+from src.ui.placeholder_tab import PlaceholderTab, TabPrefetcher
 from src.ui.styles import get_main_window_style, get_search_bar_style, GlassColors
 from src.logic.config import config, ENABLE_CLOUD
 from src.logic.file_manager import file_manager
+from src.logic.session import session_store
+from src.logic.trigram_index import trigram_index
+from src.logic.catalog import note_catalog
+from src.logic.startup_timing import startup_timer
 from src.logic.drive_service import drive_service
 
 
@@ -49,6 +57,12 @@ from src.logic.drive_service import drive_service
 # To enable: Set ENABLE_CLOUD = True in src/logic/config.py
 # =============================================================================
 
+# Views of the current tab (search, zoom and session apply to both); note tabs
+# are EditorTab pages shown through the one shared Editor
+TAB_VIEWS = (Editor, LargeFileViewer)
+# Widgets whose content can be edited, undone and saved
+EDITABLE_VIEWS = (Editor, LargeFileEditor)
+
 
 class StatusBarWidget(QWidget):
     """Custom status bar with editor statistics"""
@@ -192,6 +206,11 @@ class StatusBarWidget(QWidget):
         """Update word and character counts"""
         self.stats_label.setText(f"{words:,} words  •  {characters:,} characters")
 
+    def update_file_info(self, lines, size_bytes):
+        """Show line count and size for a read-only large file"""
+        size_mb = size_bytes / (1024 * 1024)
+        self.stats_label.setText(f"{lines:,} lines  •  {size_mb:,.1f} MB  •  read-only")
+
     def update_cursor(self, line, column):
         """Update cursor position display"""
         self.cursor_label.setText(f"line {line}, column {column}")
@@ -241,10 +260,13 @@ class MainWindow(MSFluentWindow):
         self._init_shortcuts()
         self._init_status_bar()
         self._connect_settings_signals()
+        self._init_session_timer()
 
-        # Initial data and session restoration
-        self.update_hub_data()
-        self._restore_session()
+        # Initial data and session restoration wait for the event loop, so
+        # the window paints its skeleton hub before any note is loaded
+        self._startup_view = None  # viewport whose first paint ends startup timing
+        self.hub.local_list.firstFramePainted.connect(startup_timer.finish)
+        QTimer.singleShot(0, self._load_initial_data)
 
     def _center_window(self):
         """Center the window on the primary screen"""
@@ -269,27 +291,26 @@ class MainWindow(MSFluentWindow):
 
     def _update_all_editors_font(self, size):
         """Update font size for all open tabs"""
-        target_size = max(1, int(size))
-
-        for i in range(self.tabs.count()):
-            editor = self.tabs.widget(i)
-            if isinstance(editor, Editor):
-                font = editor.font()
-                font.setPointSize(target_size)
-                editor.setFont(font)
+        # Note tabs all share one editor; notes zoomed by hand keep their own size
+        self.editor.set_default_font_size(size)
 
     def _update_application_accent(self, color):
         """Update application-wide accent color"""
         setThemeColor(color)
         # Update theme color (handled by qfluentwidgets)
         # But we also need to trigger editor updates for custom painting
+        self.editor._highlight_current_line()
         for i in range(self.tabs.count()):
             editor = self.tabs.widget(i)
-            if isinstance(editor, Editor):
-                editor._highlight_current_line()
+            if isinstance(editor, LargeFileViewer):
+                editor.viewport().update()
 
     def _init_components(self):
         """Initialize all UI components"""
+        self._active_view = None
+        self._tab_prefetcher = TabPrefetcher(self)
+        self._restoring = False  # placeholders are being added; nothing loads yet
+        self._materializing = False  # a placeholder is being swapped for its editor
 
         # Search bar
         self.search_bar = SearchBar()
@@ -298,7 +319,15 @@ class MainWindow(MSFluentWindow):
         self.search_bar.search_next.connect(self._on_search_next)
         self.search_bar.search_previous.connect(self._on_search_previous)
         self.search_bar.search_changed.connect(self._on_search_changed)
+        self.search_bar.replace_next.connect(self._on_replace_next)
+        self.search_bar.replace_all.connect(self._on_replace_all)
         self.search_bar.close_requested.connect(self._on_search_close)
+        self.search_bar.scope_changed.connect(self._on_search_scope_changed)
+
+        # Cross-tab search results
+        self.search_results = SearchResultsPanel()
+        self.search_results.hide()
+        self.search_results.result_activated.connect(self._on_search_result_activated)
 
         # Tab widget for editors
         self.tabs = TabWidget()
@@ -309,6 +338,12 @@ class MainWindow(MSFluentWindow):
         self.tabs.tabAddRequested.connect(lambda: self.add_new_tab())
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
+        # One editor view shared by every note tab; each tab keeps its own
+        # document and the editor is moved into whichever tab is current
+        self.editor = Editor()
+        self.editor.hide()
+        self.editor.textChanged.connect(lambda: self._on_editor_text_changed(self.editor))
+
         # Container for tabs to accommodate search bar and status bar
         self.tabs_container = QWidget()
         self.tabs_container.setObjectName("EditorTabsContainer")
@@ -316,6 +351,7 @@ class MainWindow(MSFluentWindow):
         container_layout.setContentsMargins(0, 0, 0, 48)
         container_layout.setSpacing(0)
         container_layout.addWidget(self.search_bar)
+        container_layout.addWidget(self.search_results)
         container_layout.addWidget(self.tabs)
 
         # Hub view
@@ -415,6 +451,26 @@ class MainWindow(MSFluentWindow):
         self.find_prev_shortcut = QShortcut(QKeySequence("Shift+F3"), self)
         self.find_prev_shortcut.activated.connect(self._find_previous)
 
+        # Go to Line: Ctrl+G
+        self.go_to_line_shortcut = QShortcut(QKeySequence("Ctrl+G"), self)
+        self.go_to_line_shortcut.activated.connect(self._go_to_line)
+
+    def _go_to_line(self):
+        """Prompt for a line number and jump to it in the current tab"""
+        editor = self._current_view()
+        if not isinstance(editor, TAB_VIEWS):
+            return
+
+        if isinstance(editor, Editor):
+            max_line = editor.blockCount()
+        else:
+            max_line = editor.buffer.line_count
+        line, ok = QInputDialog.getInt(
+            self, "Go to Line", f"Line number (1-{max_line:,}):", 1, 1, max_line
+        )
+        if ok:
+            editor.go_to_line(line)
+
     def _toggle_search(self):
         """Toggle search bar visibility"""
         if self.tabs.count() == 0:
@@ -422,19 +478,23 @@ class MainWindow(MSFluentWindow):
 
         if self.search_bar.isVisible():
             self.search_bar.hide()
+            self.search_results.hide()
         else:
             self.search_bar.show()
+            if self.search_bar.is_all_tabs() and self.search_bar.get_search_text():
+                self.search_results.show()
             self.search_bar.focus_search_input()
 
     def _on_search_next(self, text):
         """Handle find next request"""
         if not text or self.tabs.count() == 0:
             return
-        editor = self.tabs.widget(self.tabs.currentIndex())
-        if isinstance(editor, Editor):
+        editor = self._current_view()
+        if isinstance(editor, TAB_VIEWS):
             case_sensitive = self.search_bar.is_case_sensitive()
             whole_word = self.search_bar.is_whole_word()
-            found = editor.find_next(text, case_sensitive, whole_word)
+            regex = self.search_bar.is_regex()
+            found = editor.find_next(text, case_sensitive, whole_word, regex=regex)
             if found:
                 match_count = len(editor._search_matches)
                 current_index = editor._current_match_index
@@ -444,11 +504,12 @@ class MainWindow(MSFluentWindow):
         """Handle find previous request"""
         if not text or self.tabs.count() == 0:
             return
-        editor = self.tabs.widget(self.tabs.currentIndex())
-        if isinstance(editor, Editor):
+        editor = self._current_view()
+        if isinstance(editor, TAB_VIEWS):
             case_sensitive = self.search_bar.is_case_sensitive()
             whole_word = self.search_bar.is_whole_word()
-            found = editor.find_previous(text, case_sensitive, whole_word)
+            regex = self.search_bar.is_regex()
+            found = editor.find_previous(text, case_sensitive, whole_word, regex=regex)
             if found:
                 match_count = len(editor._search_matches)
                 current_index = editor._current_match_index
@@ -458,20 +519,97 @@ class MainWindow(MSFluentWindow):
         """Handle search text change for live highlighting"""
         if not text or self.tabs.count() == 0:
             return
-        editor = self.tabs.widget(self.tabs.currentIndex())
-        if isinstance(editor, Editor):
+        editor = self._current_view()
+        if isinstance(editor, TAB_VIEWS):
             case_sensitive = self.search_bar.is_case_sensitive()
             whole_word = self.search_bar.is_whole_word()
-            editor._highlight_search_matches(text, case_sensitive, whole_word)
-            match_count = len(editor._search_matches)
-            self.search_bar.set_match_count(match_count, -1)
+            # Counts arrive through search_highlight_changed / search_progress,
+            # since large documents and regexes finish searching on a worker thread
+            editor._highlight_search_matches(
+                text, case_sensitive, whole_word, self.search_bar.is_regex()
+            )
+        if self.search_bar.is_all_tabs():
+            self._search_all_tabs(text)
+
+    def _search_all_tabs(self, text):
+        """List matches of text in every open editor tab, loaded or not"""
+        tabs = []
+        for i in range(self.tabs.count()):
+            page = self.tabs.widget(i)
+            if isinstance(page, EditorTab):
+                tabs.append((page, self.tabs.tabText(i), None))
+            elif isinstance(page, PlaceholderTab) and page.source_path:
+                tabs.append((page, self.tabs.tabText(i), page.source_path))
+        self.search_results.show()
+        self.search_results.search(
+            tabs,
+            text,
+            self.search_bar.is_case_sensitive(),
+            self.search_bar.is_whole_word(),
+            self.search_bar.is_regex(),
+        )
+
+    def _on_search_scope_changed(self, all_tabs):
+        """Show or hide cross-tab results when the search scope changes"""
+        if not all_tabs:
+            self.search_results.reset()
+            self.search_results.hide()
+
+    def _on_search_result_activated(self, page, start, end):
+        """Jump to a match listed in the cross-tab results"""
+        try:
+            index = self.tabs.indexOf(page)
+        except RuntimeError:
+            return  # the tab was closed after the search
+        if index < 0:
+            return
+        # A placeholder is swapped for its editor here, at the same index
+        count = self.tabs.count()
+        self.tabs.setCurrentIndex(index)
+        if self.tabs.count() != count:
+            return  # the tab could not be loaded and was closed
+        editor = self._tab_view(index)
+        if isinstance(editor, Editor):
+            editor.select_range(start, end)
+            editor.setFocus()
+
+    def _on_replace_next(self, text, replacement):
+        """Handle replace request for the selected match"""
+        if not text or self.tabs.count() == 0:
+            return
+        editor = self._current_view()
+        if isinstance(editor, Editor):
+            editor.replace_current(
+                text,
+                replacement,
+                self.search_bar.is_case_sensitive(),
+                self.search_bar.is_whole_word(),
+                self.search_bar.is_regex(),
+            )
+
+    def _on_replace_all(self, text, replacement):
+        """Handle replace-all request"""
+        if not text or self.tabs.count() == 0:
+            return
+        editor = self._current_view()
+        if isinstance(editor, Editor):
+            # The count arrives through editor.replaced, after the search if one is running
+            editor.replace_all(
+                text,
+                replacement,
+                self.search_bar.is_case_sensitive(),
+                self.search_bar.is_whole_word(),
+                self.search_bar.is_regex(),
+            )
 
     def _on_search_close(self):
         """Handle search bar close"""
         self.search_bar.hide()
+        self.search_results.reset()
+        self.search_results.hide()
         if self.tabs.count() > 0:
-            editor = self.tabs.widget(self.tabs.currentIndex())
-            if isinstance(editor, Editor):
+            editor = self._current_view()
+            if isinstance(editor, TAB_VIEWS):
                 editor.clear_search_state()
         self.setFocus()
 
@@ -481,6 +619,7 @@ class MainWindow(MSFluentWindow):
             return
         text = self.search_bar.get_search_text()
         if text:
+            self.search_bar.flush_search()
             self._on_search_next(text)
 
     def _find_previous(self):
@@ -489,6 +628,7 @@ class MainWindow(MSFluentWindow):
             return
         text = self.search_bar.get_search_text()
         if text:
+            self.search_bar.flush_search()
             self._on_search_previous(text)
 
     def _init_status_bar(self):
@@ -502,6 +642,7 @@ class MainWindow(MSFluentWindow):
         self.status_widget.zoom_out_requested.connect(self._zoom_out)
         self.status_widget.zoom_reset_requested.connect(self._reset_zoom)
         self.status_widget.search_toggled.connect(self._toggle_search)
+        self.editor.textChanged.connect(lambda: self.status_widget.set_modified(True))
 
         # Create status bar container at window level
         # Create status bar container at window level
@@ -570,18 +711,22 @@ class MainWindow(MSFluentWindow):
             self.status_bar_frame.show()
         else:
             self.status_bar_frame.hide()
-        self._save_session()
+        self._schedule_session_save()
 
     def _disconnect_editor_signals(self, editor):
         """Safely disconnect all signals from an editor"""
         if editor is None:
             return
         signals = [
-            editor.word_count_changed,
+            getattr(editor, "word_count_changed", None),
+            getattr(editor, "replaced", None),
+            getattr(editor, "index_progress", None),
             editor.cursor_position_changed,
             editor.search_highlight_changed,
+            editor.search_progress,
+            editor.search_failed,
         ]
-        for sig in signals:
+        for sig in filter(None, signals):
             try:
                 sig.disconnect()
             except (TypeError, RuntimeError):
@@ -589,26 +734,44 @@ class MainWindow(MSFluentWindow):
 
     def _on_tab_changed(self, index):
         """Handle tab selection change"""
+        if self._restoring or self._materializing:
+            return
+        if index >= 0 and isinstance(self.tabs.widget(index), PlaceholderTab):
+            if not self._materialize_tab(index):
+                return
         if index >= 0:
-            editor = self.tabs.widget(index)
-            if editor and isinstance(editor, Editor):
+            self._prefetch_adjacent_tabs(index)
+            editor = self._tab_view(index)
+            if editor and isinstance(editor, TAB_VIEWS):
+                # Background searches in the previous tab must not update the bar
+                if self._active_view is not None and self._active_view is not editor:
+                    self._disconnect_editor_signals(self._active_view)
+                self._active_view = editor
                 self._disconnect_editor_signals(editor)
 
-                editor.word_count_changed.connect(self.status_widget.update_counts)
                 editor.cursor_position_changed.connect(self.status_widget.update_cursor)
                 editor.search_highlight_changed.connect(
                     lambda count, idx: self.search_bar.set_match_count(count, idx)
                 )
-
-                content = editor.get_content()
-                words = len(content.split()) if content.strip() else 0
-                chars = len(content)
-                self.status_widget.update_counts(words, chars)
-
-                cursor = editor.textCursor()
-                self.status_widget.update_cursor(
-                    cursor.blockNumber() + 1, cursor.columnNumber() + 1
-                )
+                editor.search_progress.connect(self.search_bar.set_partial_match_count)
+                editor.search_failed.connect(self.search_bar.set_search_failed)
+                self.search_bar.set_replace_enabled(isinstance(editor, Editor))
+
+                if isinstance(editor, Editor):
+                    editor.word_count_changed.connect(self.status_widget.update_counts)
+                    editor.replaced.connect(self.search_bar.set_replaced_count)
+                    self.status_widget.update_counts(*editor.get_counts())
+
+                    cursor = editor.textCursor()
+                    self.status_widget.update_cursor(
+                        cursor.blockNumber() + 1, cursor.columnNumber() + 1
+                    )
+                else:
+                    editor.index_progress.connect(self.status_widget.update_file_info)
+                    self.status_widget.update_file_info(
+                        editor.buffer.line_count, editor.buffer.size
+                    )
+                    self.status_widget.update_cursor(editor._current_line + 1, 1)
 
                 if self.search_bar.isVisible():
                     search_text = self.search_bar.get_search_text()
@@ -616,19 +779,17 @@ class MainWindow(MSFluentWindow):
                         case_sensitive = self.search_bar.is_case_sensitive()
                         whole_word = self.search_bar.is_whole_word()
                         editor._highlight_search_matches(
-                            search_text, case_sensitive, whole_word
-                        )
-                        self.search_bar.set_match_count(
-                            len(editor._search_matches), editor._current_match_index
+                            search_text, case_sensitive, whole_word,
+                            self.search_bar.is_regex(),
                         )
 
-                self._save_session()
+                self._schedule_session_save()
 
     def _on_font_size_changed(self, size):
-        """Apply font size change to all editors"""
+        """Apply font size change to the large file viewers"""
         for i in range(self.tabs.count()):
             editor = self.tabs.widget(i)
-            if isinstance(editor, Editor):
+            if isinstance(editor, LargeFileViewer):
                 editor.set_font_size(size)
 
     def _on_logout(self):
@@ -648,32 +809,32 @@ class MainWindow(MSFluentWindow):
         """Zoom in current editor"""
         index = self.tabs.currentIndex()
         if index >= 0:
-            editor = self.tabs.widget(index)
-            if isinstance(editor, Editor):
+            editor = self._tab_view(index)
+            if isinstance(editor, TAB_VIEWS):
                 editor.zoom_in()
 
     def _zoom_out(self):
         """Zoom out current editor"""
         index = self.tabs.currentIndex()
         if index >= 0:
-            editor = self.tabs.widget(index)
-            if isinstance(editor, Editor):
+            editor = self._tab_view(index)
+            if isinstance(editor, TAB_VIEWS):
                 editor.zoom_out()
 
     def _undo(self):
         """Undo last action in current editor"""
         index = self.tabs.currentIndex()
         if index >= 0:
-            editor = self.tabs.widget(index)
-            if isinstance(editor, Editor):
+            editor = self._tab_view(index)
+            if isinstance(editor, EDITABLE_VIEWS):
                 editor.undo()
 
     def _redo(self):
         """Redo last action in current editor"""
         index = self.tabs.currentIndex()
         if index >= 0:
-            editor = self.tabs.widget(index)
-            if isinstance(editor, Editor):
+            editor = self._tab_view(index)
+            if isinstance(editor, EDITABLE_VIEWS):
                 editor.redo()
 
     def _reset_zoom(self):
@@ -681,8 +842,10 @@ class MainWindow(MSFluentWindow):
         default_size = config.settings.get("font_size", 13)
         index = self.tabs.currentIndex()
         if index >= 0:
-            editor = self.tabs.widget(index)
+            editor = self._tab_view(index)
             if isinstance(editor, Editor):
+                editor.reset_zoom()
+            elif isinstance(editor, LargeFileViewer):
                 editor.set_font_size(default_size)
 
     def _close_current_tab(self):
@@ -691,31 +854,63 @@ class MainWindow(MSFluentWindow):
         if index >= 0:
             self.close_tab(index)
 
+    def _init_session_timer(self):
+        """Setup the idle timer that coalesces session writes"""
+        self._session_timer = QTimer(self)
+        self._session_timer.setSingleShot(True)
+        self._session_timer.setInterval(config.get("session_save_delay", 1000))
+        self._session_timer.timeout.connect(self._save_session)
+
+    def _schedule_session_save(self):
+        """Restart the idle timer so bursts of changes produce a single flush"""
+        self._session_timer.start()
+
+    def _on_editor_text_changed(self, editor):
+        """Mark an editor's backup stale and schedule a session flush"""
+        editor.session_dirty = True
+        self._schedule_session_save()
+
     def _save_session(self):
         """Save current open tabs to session"""
+        self._session_timer.stop()
+
         session_tabs = []
+        backup_ids = []
         for i in range(self.tabs.count()):
             editor = self.tabs.widget(i)
-            if not isinstance(editor, Editor):
+            if isinstance(editor, PlaceholderTab):
+                # Never shown this run, so its record and backup are unchanged
+                session_tabs.append(dict(editor.session_tab, name=self.tabs.tabText(i)))
+                if editor.session_tab.get("is_backup"):
+                    backup_ids.append(editor.session_id)
+                continue
+            if not isinstance(editor, TAB_VIEWS + (EditorTab,)):
                 continue
 
             name = self.tabs.tabText(i)
             path = editor.file_path
             drive_id = editor.drive_id
 
-            # If unsaved, create a backup
+            # If unsaved, keep a backup - rewritten only when the content changed
             is_backup = False
             if not path and not drive_id:
-                backup_path = config.BACKUP_DIR / f"tab_{i}.txt"
-                content = editor.get_content()
-                if content.strip():
-                    with open(backup_path, "w", encoding="utf-8") as f:
-                        f.write(content)
+                backup_path = session_store.backup_path(editor.session_id)
+                if editor.session_dirty or not backup_path.exists():
+                    content = editor.get_content()
+                    if content.strip():
+                        session_store.write_backup(editor.session_id, content)
+                    else:
+                        session_store.remove_backup(editor.session_id)
+                    editor.session_dirty = False
+
+                if backup_path.exists():
                     path = str(backup_path)
                     is_backup = True
+                    backup_ids.append(editor.session_id)
 
             session_tabs.append(
                 {
+                    "id": editor.session_id,
                     "name": name,
                     "path": str(path) if path else None,
                     "drive_id": drive_id,
@@ -723,68 +918,142 @@ class MainWindow(MSFluentWindow):
                 }
             )
 
-        config.set("session_tabs", session_tabs)
+        session_store.save(session_tabs)
+        session_store.prune_backups(backup_ids)
+
+    def closeEvent(self, event):
+        """Flush any pending session and index changes before the window closes"""
+        self._save_session()
+        trigram_index.flush()
+        super().closeEvent(event)
+
+    def _load_initial_data(self):
+        startup_timer.mark("event_loop_started")
+        self.update_hub_data()
+        self._restore_session()
+        startup_timer.mark("session_restored")
+        # A restored session opens on its tabs, so the hub list may not paint for a while
+        view = self._current_view() if self.stackedWidget.currentWidget() is not self.hub else None
+        if isinstance(view, TAB_VIEWS):
+            self._startup_view = view.viewport()
+            self._startup_view.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._startup_view and event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            self._startup_view = None
+            # Counted once the paint event itself has been handled
+            QTimer.singleShot(0, startup_timer.finish)
+        return super().eventFilter(obj, event)
 
     def _restore_session(self):
-        """Restore tabs from previous session"""
-        session_tabs = config.get("session_tabs", [])
+        """Restore tabs from previous session as placeholders
+
+        Only the current tab is loaded; the others read their file and
+        build their editor when they are first shown.
+        """
+        session_tabs = session_store.tabs
         if not session_tabs:
             return
 
-        for tab in session_tabs:
-            path = tab.get("path")
-            drive_id = tab.get("drive_id")
-            name = tab.get("name", "Untitled")
-            is_backup = tab.get("is_backup", False)
-
-            if is_backup and path and os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.add_new_tab(name, content)
-                # After restoring backup, delete it so it doesn't linger
-                # if not closed properly next time (it will be recreated on next save_session)
-                try:
-                    os.remove(path)
-                except:
-                    pass
-            elif path and os.path.exists(path):
-                self.open_file_path(path)
-            elif drive_id:
-                self.add_new_tab(name, "", drive_id=drive_id)
-                # Note: Content will be fetchable via Drive if needed,
-                # but for now we just restore the tab reference
+        self._restoring = True
+        try:
+            for tab in session_tabs:
+                path = tab.get("path")
+                drive_id = tab.get("drive_id")
+                name = tab.get("name", "Untitled")
+                is_backup = tab.get("is_backup", False)
+
+                if is_backup and path and os.path.exists(path) and not tab.get("id"):
+                    # Legacy index-named backup: loaded now to migrate on the next flush
+                    with open(path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                    self.add_new_tab(name, content)
+                    self.tabs.widget(self.tabs.currentIndex()).session_dirty = True
+                elif (path and os.path.exists(path)) or drive_id:
+                    self.tabs.addTab(PlaceholderTab(tab), name)
+        finally:
+            self._restoring = False
 
         # Reset selection to first tab if any exist
         if self.tabs.count() > 0:
-            self.tabs.setCurrentIndex(0)
-            self.switchTo(self.tabs_container)
-
-    def update_hub_data(self):
-        """Refresh hub with current data"""
-        # Get all local files from notes dir
-        local_files = file_manager.list_files(config.NOTES_DIR)
-
-        # Merge with recent files (preserving order but avoiding duplicates)
-        recent_files = config.settings.get("recent_files", [])
-
-        # Valid recent files
-        valid_recents = []
-        seen_paths = set()
-
-        # First add valid recent files (preserving user order)
-        for f in recent_files:
-            if os.path.exists(f):
-                norm_path = os.path.normpath(f)
-                valid_recents.append(f)
-                seen_paths.add(norm_path)
-
-        # Then add any missing files from notes directory
-        for f in local_files:
-            norm_path = os.path.normpath(f)
-            if norm_path not in seen_paths:
-                valid_recents.append(f)
+            if self.tabs.currentIndex() == 0:
+                self._on_tab_changed(0)
+            else:
+                self.tabs.setCurrentIndex(0)
+            # Loading the first tab closes it if its file became unreadable
+            if self.tabs.count() > 0:
+                self.switchTo(self.tabs_container)
+
+    def _materialize_tab(self, index):
+        """Replace the placeholder at index with its editor; False if it could not be loaded"""
+        placeholder = self.tabs.widget(index)
+        tab = placeholder.session_tab
+        path = placeholder.source_path
+        name = self.tabs.tabText(index)
 
-        self.hub.update_recent_list(valid_recents)
+        view = None
+        if path and os.path.exists(path):
+            if not tab.get("is_backup") and file_manager.is_large_file(path):
+                view = self._create_viewer(path)
+            else:
+                content = self._tab_prefetcher.take(path)
+                if content is None:
+                    content = file_manager.read_file(path)
+                if content is not None and tab.get("is_backup"):
+                    view = self._create_editor(content)
+                    # Keep the existing backup file instead of rewriting it
+                    view.session_id = tab["id"]
+                elif content is not None:
+                    view = self._create_editor(content, path=path)
+        elif tab.get("drive_id"):
+            # Note: Content will be fetchable via Drive if needed,
+            # but for now we just restore the tab reference
+            view = self._create_editor("", drive_id=tab["drive_id"])
+
+        self._materializing = True
+        try:
+            self.tabs.removeTab(index)
+            if view is not None:
+                self.tabs.insertTab(index, view, name)
+                self.tabs.setCurrentIndex(index)
+        finally:
+            self._materializing = False
+        if view is not None:
+            self.search_results.retarget(placeholder, view)
+        placeholder.deleteLater()
+
+        if view is None:
+            InfoBar.warning("Tab Closed", f"'{name}' could not be opened", duration=3000, parent=self)
+            self._schedule_session_save()
+            if self.tabs.count() == 0:
+                self.switchTo(self.hub)
+            else:
+                self._on_tab_changed(self.tabs.currentIndex())
+            return False
+        self.status_widget.set_modified(False)
+        return True
+
+    def _prefetch_adjacent_tabs(self, index):
+        """Read the text of unloaded tabs next to index in the background"""
+        for i in (index + 1, index - 1):
+            if 0 <= i < self.tabs.count():
+                widget = self.tabs.widget(i)
+                if isinstance(widget, PlaceholderTab):
+                    self._tab_prefetcher.prefetch(widget.source_path)
+
+    def update_hub_data(self, touched=None):
+        """Refresh hub from the note catalog, then reconcile it with the disk
+
+        touched lists the paths an action just changed; only those are
+        re-checked and only their rows are updated.
+        """
+        # Recent files first (preserving user order), then the rest of the notes dir.
+        # Reconciling also queues the touched notes for background re-indexing.
+        if touched is None:
+            self.hub.reconcile_catalog(config.settings.get("recent_files", []), config.NOTES_DIR)
+        else:
+            self.hub.notes_changed(touched)
 
         if ENABLE_CLOUD and config.settings.get("google_logged_in"):
             self.refresh_cloud_list()
@@ -827,27 +1096,43 @@ class MainWindow(MSFluentWindow):
         except Exception as e:
             InfoBar.error("Connection Failed", str(e), duration=5000, parent=self)
 
+    def _create_editor(self, content="", path=None, drive_id=None):
+        """Tab page for a note; it is shown through the shared editor"""
+        return EditorTab(NoteDocument(content, file_path=path, drive_id=drive_id))
+
+    def _tab_view(self, index):
+        """The widget showing tab index: the shared editor for note tabs"""
+        page = self.tabs.widget(index)
+        if isinstance(page, EditorTab):
+            if self.editor.note is not page.note:
+                page.attach(self.editor)
+                self.editor.set_note(page.note)
+            return self.editor
+        return page
+
+    def _current_view(self):
+        index = self.tabs.currentIndex()
+        return self._tab_view(index) if index >= 0 else None
+
+    def _release_tab(self, page):
+        """Take the shared editor off a note tab that is about to be removed"""
+        if page is self._active_view:
+            self._active_view = None
+        if isinstance(page, EditorTab):
+            self.editor.release_note(page.note)
+            if self.editor.parent() is page:
+                self.editor.hide()
+                self.editor.setParent(self.tabs_container)
+
     def add_new_tab(self, name="Untitled", content="", path=None, drive_id=None):
         """Create a new editor tab"""
-        editor = Editor(content)
-        editor.file_path = path
-        editor.drive_id = drive_id
-
-        # Connect editor signals for status bar updates
-        editor.textChanged.connect(lambda: self.status_widget.set_modified(True))
-        editor.textChanged.connect(self._save_session)  # Auto-save session on changes
-        editor.word_count_changed.connect(self.status_widget.update_counts)
-        editor.cursor_position_changed.connect(self.status_widget.update_cursor)
-
-        index = self.tabs.addTab(editor, name)
+        index = self.tabs.addTab(self._create_editor(content, path, drive_id), name)
         self.tabs.setCurrentIndex(index)
         self.switchTo(self.tabs_container)
+        editor = self._tab_view(index)
 
         # Initial status - trigger count update
-        text = editor.get_content()
-        words = len(text.split()) if text.strip() else 0
-        chars = len(text)
-        self.status_widget.update_counts(words, chars)
+        self.status_widget.update_counts(*editor.get_counts())
 
         cursor = editor.textCursor()
         self.status_widget.update_cursor(
@@ -855,6 +1140,51 @@ class MainWindow(MSFluentWindow):
         )
         self.status_widget.set_modified(False)
 
+    def _create_viewer(self, path):
+        """Paged view of a large file, editable unless disabled in config; None on failure"""
+        try:
+            if config.get("large_file_editable", True):
+                viewer = LargeFileEditor(path)
+                viewer.content_changed.connect(
+                    lambda: self.status_widget.set_modified(True)
+                )
+                viewer.saved.connect(self._on_large_file_saved)
+                viewer.save_failed.connect(
+                    lambda reason: self._on_large_file_save_failed(viewer, reason)
+                )
+            else:
+                viewer = LargeFileViewer(path)
+        except Exception as e:
+            InfoBar.error("Error", f"Failed to open file: {e}", parent=self)
+            return None
+        return viewer
+
+    def _on_large_file_saved(self, path):
+        """A large file's written copy has replaced the file on disk"""
+        config.add_recent_file(path)
+        self.update_hub_data([path])
+        InfoBar.success("Saved", "Note saved successfully", duration=2000, parent=self)
+
+    def _on_large_file_save_failed(self, viewer, reason):
+        """The written copy could not replace the file; the edits are still in the tab"""
+        index = self.tabs.indexOf(viewer)
+        if index >= 0:
+            self.tabs.setTabText(index, os.path.basename(viewer.file_path))
+            if index == self.tabs.currentIndex():
+                self.status_widget.set_modified(True)
+        InfoBar.error("Save Failed", reason, parent=self)
+
+    def add_viewer_tab(self, path):
+        """Open a large file in a paged viewer tab"""
+        viewer = self._create_viewer(path)
+        if viewer is None:
+            return
+
+        index = self.tabs.addTab(viewer, os.path.basename(path))
+        self.tabs.setCurrentIndex(index)
+        self.switchTo(self.tabs_container)
+        self.status_widget.set_modified(False)
+
     def open_file_dialog(self):
         """Open file picker dialog"""
         formats_str = " ".join(f"*{ext}" for ext in config.SUPPORTED_TEXT_FORMATS)
@@ -870,14 +1200,21 @@ class MainWindow(MSFluentWindow):
 
     def open_file_path(self, path_or_id):
         """Open a note by path or Drive ID"""
-        if os.path.exists(path_or_id):
+        if os.path.exists(path_or_id) and file_manager.is_large_file(path_or_id):
+            # Large local file: memory-mapped read-only viewer
+            self.add_viewer_tab(path_or_id)
+            config.add_recent_file(path_or_id)
+            note_catalog.mark_opened(path_or_id)
+            self.update_hub_data([path_or_id])
+        elif os.path.exists(path_or_id):
             # Local file
             content = file_manager.read_file(path_or_id)
             if content is not None:
                 name = os.path.basename(path_or_id)
                 self.add_new_tab(name, content, path=path_or_id)
                 config.add_recent_file(path_or_id)
-                self.update_hub_data()
+                note_catalog.mark_opened(path_or_id)
+                self.update_hub_data([path_or_id])
         else:
             # Assume Drive ID
             try:
@@ -903,15 +1240,15 @@ class MainWindow(MSFluentWindow):
         if index == -1:
             return
 
-        editor = self.tabs.widget(index)
-        if not editor or not isinstance(editor, Editor):
+        editor = self._tab_view(index)
+        if not editor or not isinstance(editor, EDITABLE_VIEWS):
             return
 
-        content = editor.get_content()
         name = self.tabs.tabText(index)
 
         # Cloud save
         if hasattr(editor, "drive_id") and editor.drive_id:
+            content = editor.get_content()
             try:
                 drive_service.upload_note(name, content, editor.drive_id)
                 InfoBar.success(
@@ -926,7 +1263,8 @@ class MainWindow(MSFluentWindow):
                 InfoBar.error("Cloud Save Failed", str(e), parent=self)
 
         # Local save
-        if not hasattr(editor, "file_path") or editor.file_path is None:
+        previous_path = getattr(editor, "file_path", None)
+        if previous_path is None:
             formats_str = " ".join(f"*{ext}" for ext in config.SUPPORTED_TEXT_FORMATS)
             filter_str = f"Text Files ({formats_str});;All Files (*)"
             path, _ = QFileDialog.getSaveFileName(
@@ -941,10 +1279,24 @@ class MainWindow(MSFluentWindow):
             else:
                 return
 
-        if file_manager.save_file(editor.file_path, content):
+        if isinstance(editor, LargeFileEditor):
+            # Finished by _on_large_file_saved once the written copy is swapped in
+            saved = editor.save_to(editor.file_path)
+        else:
+            saved = file_manager.save_file(editor.file_path, editor.get_content())
+
+        if not saved:
+            # Keep the tab on the file it was showing
+            if editor.file_path != previous_path:
+                editor.file_path = previous_path
+                if previous_path:
+                    self.tabs.setTabText(index, os.path.basename(previous_path))
+            return
+
+        self.status_widget.set_modified(False)
+        if not isinstance(editor, LargeFileEditor):
             config.add_recent_file(editor.file_path)
-            self.update_hub_data()
-            self.status_widget.set_modified(False)
+            self.update_hub_data([editor.file_path])
             InfoBar.success(
                 "Saved", "Note saved successfully", duration=2000, parent=self
             )
@@ -955,8 +1307,8 @@ class MainWindow(MSFluentWindow):
         if index == -1:
             return
 
-        editor = self.tabs.widget(index)
-        if not editor or not isinstance(editor, Editor):
+        editor = self._tab_view(index)
+        if not editor or not isinstance(editor, EDITABLE_VIEWS):
             return
 
         # Store old path
@@ -978,29 +1330,48 @@ class MainWindow(MSFluentWindow):
         if (new_path or new_drive_id) and (
             new_path != old_path or new_drive_id != old_drive_id
         ):
-            # Delete old local file if it existed
-            if old_path and os.path.exists(old_path):
-                from src.logic.file_manager import file_manager
-
-                file_manager.delete_file(old_path)
-                config.remove_recent_file(old_path)
-
-            # Update hub
-            self.update_hub_data()
+            if isinstance(editor, LargeFileEditor) and editor.is_save_pending():
+                # The old file backs the tab until the written copy is swapped in
+                def finish(path):
+                    editor.saved.disconnect(finish)
+                    editor.save_failed.disconnect(abandon)
+                    self._remove_moved_note(old_path, path)
+
+                def abandon(reason):
+                    editor.saved.disconnect(finish)
+                    editor.save_failed.disconnect(abandon)
+
+                editor.saved.connect(finish)
+                editor.save_failed.connect(abandon)
+            else:
+                self._remove_moved_note(old_path, new_path)
 
         # If save was cancelled (still no path), restore old path
         elif editor.file_path is None and editor.drive_id is None:
             editor.file_path = old_path
             editor.drive_id = old_drive_id
 
+    def _remove_moved_note(self, old_path, new_path):
+        """Delete the file a note was saved away from and refresh the hub"""
+        if old_path and old_path != new_path and os.path.exists(old_path):
+            from src.logic.file_manager import file_manager
+
+            file_manager.delete_file(old_path)
+            config.remove_recent_file(old_path)
+
+        self.update_hub_data([path for path in (old_path, new_path) if path])
+
     def close_tab(self, index):
         """Close a tab by index"""
         editor = self.tabs.widget(index)
-        if isinstance(editor, Editor) and editor.file_path:
-            pass
+        if isinstance(editor, LargeFileViewer):
+            editor.close_file()
+        self._release_tab(editor)
 
         self.tabs.removeTab(index)
-        self._save_session()
+        # removeTab does not delete the page; its document and undo history go with it
+        editor.deleteLater()
+        self._schedule_session_save()
 
         if self.tabs.count() == 0:
             self.switchTo(self.hub)
@@ -1010,7 +1381,11 @@ class MainWindow(MSFluentWindow):
         """Close all tabs that have the given file path open"""
         for i in range(self.tabs.count()):
             editor = self.tabs.widget(i)
-            if isinstance(editor, Editor) and editor.file_path == path:
+            if isinstance(editor, TAB_VIEWS + (EditorTab, PlaceholderTab)) and editor.file_path == path:
+                if isinstance(editor, LargeFileViewer):
+                    editor.close_file()
+                self._release_tab(editor)
                 self.tabs.removeTab(i)
+                editor.deleteLater()
                 break
-        self._save_session()
+        self._schedule_session_save()
@@ -0,0 +1,100 @@
+"""
+Glassnotes Placeholder Tabs
+Stand-ins for restored session tabs until they are first shown, with content prefetch
+"""
+
+import os
+import threading
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool
+
+from src.logic.file_manager import file_manager
+
+
+class PlaceholderTab(QWidget):
+    """A restored tab that has not been shown yet
+
+    Holds only the tab's session record; the main window replaces it with
+    a real editor when the tab first becomes current. file_path, drive_id
+    and session_id mirror the editor attributes the window looks up.
+    """
+
+    def __init__(self, session_tab, parent=None):
+        super().__init__(parent)
+        self.session_tab = dict(session_tab)
+        is_backup = self.session_tab.get("is_backup", False)
+        self.file_path = None if is_backup else self.session_tab.get("path")
+        self.drive_id = self.session_tab.get("drive_id")
+        self.session_id = self.session_tab.get("id")
+
+        layout = QVBoxLayout(self)
+        label = QLabel("Loading…")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("color: rgba(255, 255, 255, 0.35); font-size: 13px; background: transparent;")
+        layout.addWidget(label)
+
+    @property
+    def source_path(self):
+        """The file whose text the tab shows: the note, or the unsaved tab's backup"""
+        return self.session_tab.get("path")
+
+
+class _PrefetchTask(QRunnable):
+    def __init__(self, prefetcher, path):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.path = path
+
+    def run(self):
+        self.prefetcher._load(self.path)
+
+
+class TabPrefetcher(QObject):
+    """Reads the text of tabs likely to be shown next on a background thread
+
+    Text is kept with the file's mtime and size and handed out once by
+    take(), which returns None when the file changed since it was read.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._texts = {}  # path -> (mtime, size, text)
+        self._pending = set()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def prefetch(self, path):
+        if not path:
+            return
+        with self._lock:
+            if path in self._texts or path in self._pending:
+                return
+            self._pending.add(path)
+        self._pool.start(_PrefetchTask(self, path))
+
+    def _load(self, path):
+        try:
+            stat = os.stat(path)
+            # Large files open in the paged viewer, which reads them itself
+            text = None if file_manager.is_large_file(path) else file_manager.read_file(path)
+        except OSError:
+            text = None
+        with self._lock:
+            self._pending.discard(path)
+            if text is not None:
+                self._texts[path] = (stat.st_mtime, stat.st_size, text)
+
+    def take(self, path):
+        """Prefetched text of path if it is still current, else None"""
+        with self._lock:
+            cached = self._texts.pop(path, None)
+        if cached is None:
+            return None
+        mtime, size, text = cached
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return text if (stat.st_mtime, stat.st_size) == (mtime, size) else None
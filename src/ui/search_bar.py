@@ -13,8 +13,8 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 from PyQt6.QtGui import QIcon, QAction
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from qfluentwidgets import TransparentToolButton, FluentIcon as FIF
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from qfluentwidgets import TransparentToolButton, TransparentPushButton, FluentIcon as FIF
 
 from src.ui.styles import GlassColors, GlassEffects
 
@@ -25,10 +25,20 @@ class SearchBar(QWidget):
     search_next = pyqtSignal(str)  # Search text
     search_previous = pyqtSignal(str)
     search_changed = pyqtSignal(str)  # For live highlighting
+    replace_next = pyqtSignal(str, str)  # Search text, replacement
+    replace_all = pyqtSignal(str, str)
+    scope_changed = pyqtSignal(bool)  # True when searching all open tabs
     close_requested = pyqtSignal()
 
+    TYPING_DELAY_MS = 150  # typing pause before a regex search starts
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Regexes are scanned in a child process, so they wait for a pause in typing
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.TYPING_DELAY_MS)
+        self._search_timer.timeout.connect(self._emit_search_changed)
         self._setup_ui()
         self._setup_connections()
 
@@ -81,6 +91,22 @@ class SearchBar(QWidget):
 
         layout.addSpacing(8)
 
+        # Replace input and actions
+        self.replace_input = QLineEdit()
+        self.replace_input.setPlaceholderText("Replace...")
+        self.replace_input.setFixedWidth(180)
+        layout.addWidget(self.replace_input)
+
+        self.replace_btn = TransparentPushButton("Replace")
+        self.replace_btn.setToolTip("Replace and find next")
+        layout.addWidget(self.replace_btn)
+
+        self.replace_all_btn = TransparentPushButton("All")
+        self.replace_all_btn.setToolTip("Replace all matches")
+        layout.addWidget(self.replace_all_btn)
+
+        layout.addSpacing(8)
+
         # Options divider
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.VLine)
@@ -122,6 +148,18 @@ class SearchBar(QWidget):
         self.whole_word_checkbox.setStyleSheet(self.case_checkbox.styleSheet())
         layout.addWidget(self.whole_word_checkbox)
 
+        # Regex checkbox
+        self.regex_checkbox = QCheckBox("Regex")
+        self.regex_checkbox.setStyleSheet(self.case_checkbox.styleSheet())
+        self.regex_checkbox.setToolTip("Treat the search text as a regular expression")
+        layout.addWidget(self.regex_checkbox)
+
+        # Scope checkbox
+        self.all_tabs_checkbox = QCheckBox("All tabs")
+        self.all_tabs_checkbox.setStyleSheet(self.case_checkbox.styleSheet())
+        self.all_tabs_checkbox.setToolTip("List matches in every open note")
+        layout.addWidget(self.all_tabs_checkbox)
+
         layout.addStretch()
 
         # Close button
@@ -148,34 +186,75 @@ class SearchBar(QWidget):
         self.search_input.returnPressed.connect(self._on_return_pressed)
         self.prev_btn.clicked.connect(self._on_prev_clicked)
         self.next_btn.clicked.connect(self._on_next_clicked)
+        self.replace_input.returnPressed.connect(self._on_replace_clicked)
+        self.replace_btn.clicked.connect(self._on_replace_clicked)
+        self.replace_all_btn.clicked.connect(self._on_replace_all_clicked)
         self.case_checkbox.toggled.connect(self._on_options_changed)
         self.whole_word_checkbox.toggled.connect(self._on_options_changed)
+        self.regex_checkbox.toggled.connect(self._on_options_changed)
+        self.all_tabs_checkbox.toggled.connect(self.scope_changed.emit)
+        self.all_tabs_checkbox.toggled.connect(self._on_options_changed)
         self.close_btn.clicked.connect(self.close_requested.emit)
 
     def _on_text_changed(self, text):
         if text:
-            self.search_changed.emit(text)
+            if self._typing_delayed():
+                self._search_timer.start()
+            else:
+                self.search_changed.emit(text)
         else:
+            self._search_timer.stop()
             self.match_label.setText("0 matches")
             self._current_matches = []
             self._current_match_index = -1
 
+    def _typing_delayed(self):
+        """Whether live searches wait for a pause in typing"""
+        return self.regex_checkbox.isChecked()
+
+    def _emit_search_changed(self):
+        text = self.search_input.text()
+        if text:
+            self.search_changed.emit(text)
+
+    def flush_search(self):
+        """Start a search still waiting on the typing delay, before acting on its results"""
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self._emit_search_changed()
+
     def _on_return_pressed(self):
         text = self.search_input.text()
         if text:
+            self.flush_search()
             self.search_next.emit(text)
 
     def _on_prev_clicked(self):
         text = self.search_input.text()
         if text:
+            self.flush_search()
             self.search_previous.emit(text)
 
     def _on_next_clicked(self):
         text = self.search_input.text()
         if text:
+            self.flush_search()
             self.search_next.emit(text)
 
+    def _on_replace_clicked(self):
+        text = self.search_input.text()
+        if text:
+            self.flush_search()
+            self.replace_next.emit(text, self.replace_input.text())
+
+    def _on_replace_all_clicked(self):
+        text = self.search_input.text()
+        if text:
+            self.flush_search()
+            self.replace_all.emit(text, self.replace_input.text())
+
     def _on_options_changed(self):
+        self._search_timer.stop()
         text = self.search_input.text()
         if text:
             self.search_changed.emit(text)
@@ -207,6 +286,48 @@ class SearchBar(QWidget):
                 min-width: 70px;
             """)
 
+    def set_partial_match_count(self, count):
+        """Show a running match count while a background search is in progress"""
+        self._current_matches = list(range(count))
+        self._current_match_index = -1
+
+        self.match_label.setText(f"{count:,}+ matches…")
+        self.match_label.setStyleSheet(f"""
+            color: {GlassColors.TEXT_TERTIARY};
+            font-size: 11px;
+            min-width: 70px;
+        """)
+
+    def set_search_failed(self, reason):
+        """Show why the last search produced no result, such as a timeout"""
+        self._current_matches = []
+        self._current_match_index = -1
+
+        self.match_label.setText(reason)
+        self.match_label.setStyleSheet(f"""
+            color: {GlassColors.ERROR};
+            font-size: 11px;
+            min-width: 70px;
+        """)
+
+    def set_replaced_count(self, count):
+        """Report how many matches a replace-all changed"""
+        self._current_matches = []
+        self._current_match_index = -1
+
+        self.match_label.setText(f"Replaced {count:,}")
+        self.match_label.setStyleSheet(f"""
+            color: {GlassColors.SUCCESS};
+            font-size: 11px;
+            min-width: 70px;
+        """)
+
+    def set_replace_enabled(self, enabled):
+        """Enable replace controls only for views that can be edited in place"""
+        self.replace_input.setEnabled(enabled)
+        self.replace_btn.setEnabled(enabled)
+        self.replace_all_btn.setEnabled(enabled)
+
     def focus_search_input(self):
         """Focus the search input field"""
         self.search_input.setFocus()
@@ -216,6 +337,10 @@ class SearchBar(QWidget):
         """Get current search text"""
         return self.search_input.text()
 
+    def get_replace_text(self):
+        """Get current replacement text"""
+        return self.replace_input.text()
+
     def is_case_sensitive(self):
         """Check if case sensitive is enabled"""
         return self.case_checkbox.isChecked()
@@ -224,6 +349,14 @@ class SearchBar(QWidget):
         """Check if whole word is enabled"""
         return self.whole_word_checkbox.isChecked()
 
+    def is_regex(self):
+        """Check if regex mode is enabled"""
+        return self.regex_checkbox.isChecked()
+
+    def is_all_tabs(self):
+        """Check if the search covers every open tab"""
+        return self.all_tabs_checkbox.isChecked()
+
     def close_search(self):
         """Clear search and close"""
         self.search_input.clear()
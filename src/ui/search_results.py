@@ -0,0 +1,233 @@
+"""
+Glassnotes Cross-Tab Search Results
+Searches every open editor on a thread pool and lists matches grouped by tab
+"""
+
+import re
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from src.ui.styles import GlassColors, GlassEffects
+from src.logic.file_manager import file_manager
+from src.logic.search import SearchSession, compile_search_pattern, line_hits
+
+
+class _TabSearchSignals(QObject):
+    """Carries a task's result back to the UI thread"""
+
+    # generation, editor, title, total (-1 if the tab could not be searched), hits
+    finished = pyqtSignal(int, object, str, int, list)
+
+
+class _TabSearchTask(QRunnable):
+    """Searches text snapshots of one or more editors, one after another"""
+
+    def __init__(self, generation, tabs, key, cancelled, signals):
+        super().__init__()
+        self.generation = generation
+        self.tabs = tabs  # [(editor, title, content, path to read instead or None)]
+        self.key = key
+        self.cancelled = cancelled
+        self.signals = signals
+
+    def run(self):
+        tabs, self.tabs = self.tabs, None
+        for editor, title, content, path in tabs:
+            if self.cancelled():
+                return
+            total, hits = 0, []
+            try:
+                if path is not None:
+                    # Tabs not shown since the session was restored are read from disk;
+                    # large files only ever open in the paged viewer
+                    if not file_manager.is_large_file(path):
+                        content = file_manager.read_file(path)
+                    if content is None:
+                        self.signals.finished.emit(self.generation, editor, title, -1, [])
+                        continue
+                session = SearchSession(*self.key)
+                # A regex that timed out in one tab still lets the others be searched
+                if session.rebuild(content, cancelled=self.cancelled):
+                    total = len(session)
+                    hits = line_hits(
+                        content, session.starts, session.ends, SearchResultsPanel.MAX_HITS_PER_TAB
+                    )
+                elif self.cancelled():
+                    return
+            except Exception as e:
+                print(f"Error searching tab '{title}': {e}")
+            self.signals.finished.emit(self.generation, editor, title, total, hits)
+
+
+class SearchResultsPanel(QWidget):
+    """Matches across all open tabs, streamed in as each tab finishes"""
+
+    MAX_HITS_PER_TAB = 1000  # listed per tab; the header still shows the full count
+    SEARCH_DELAY_MS = 150  # typing pause before the open tabs are searched again
+
+    result_activated = pyqtSignal(object, int, int)  # editor, start, end
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._generation = 0
+        self._pending = 0
+        self._total = 0
+        self._tab_count = 0
+        self._unloaded = 0  # tabs that could not be read for searching
+        self._request = None  # (tabs, key) waiting for the typing delay
+        self._snapshots = {}  # editor -> (revision, text) copied by an earlier search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._start_search)
+        self._pool = QThreadPool(self)
+        self._signals = _TabSearchSignals()
+        self._signals.finished.connect(self._on_tab_finished)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 4, 12, 6)
+        layout.setSpacing(4)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet(f"""
+            color: {GlassColors.TEXT_TERTIARY};
+            font-size: 11px;
+        """)
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.itemActivated.connect(self._on_item_activated)
+        self.tree.itemClicked.connect(self._on_item_activated)
+        self.tree.setStyleSheet(f"""
+            QTreeWidget {{
+                background: rgba(255, 255, 255, 0.03);
+                border: 1px solid {GlassColors.GLASS_BORDER};
+                border-radius: {GlassEffects.BORDER_RADIUS_SM};
+                color: {GlassColors.TEXT_SECONDARY};
+                font-size: 12px;
+            }}
+            QTreeWidget::item:selected {{
+                background: {GlassColors.GLASS_BG_HOVER};
+                color: {GlassColors.TEXT_PRIMARY};
+            }}
+        """)
+        layout.addWidget(self.tree)
+        self.setMaximumHeight(240)
+
+    def search(self, tabs, text, case_sensitive=False, whole_word=False, regex=False):
+        """Search the given (editor, title, path) tabs once typing pauses
+
+        Any previous results are replaced at once. Tabs with a path are not
+        loaded yet and are searched by reading the file on the pool; the
+        others are searched through the editor's text.
+        """
+        self.clear()
+        if not text:
+            return
+        try:
+            compile_search_pattern(text, case_sensitive, whole_word, regex)
+        except re.error:
+            self.summary_label.setText("Invalid pattern")
+            return
+        self._request = (tabs, (text, case_sensitive, whole_word, regex))
+        self._search_timer.start()
+
+    def _start_search(self):
+        tabs, key = self._request
+        self._request = None
+        # Only tabs edited since the last search are copied again
+        previous, self._snapshots = self._snapshots, {}
+        contents = []
+        for editor, title, path in tabs:
+            if path is not None:
+                contents.append((editor, title, None, path))
+                continue
+            try:
+                revision = editor.revision()
+                snapshot = previous.get(editor)
+                if snapshot is None or snapshot[0] != revision:
+                    snapshot = (revision, editor.toPlainText())
+            except RuntimeError:
+                continue  # the tab was closed during the typing delay
+            self._snapshots[editor] = snapshot
+            contents.append((editor, title, snapshot[1], None))
+
+        generation = self._generation
+        cancelled = lambda: self._generation != generation
+        self._pending = len(contents)
+        self._tab_count = 0
+        if key[3]:
+            # Regexes run in a child process; one task reuses it for every tab in turn
+            self._pool.start(_TabSearchTask(generation, contents, key, cancelled, self._signals))
+        else:
+            for tab in contents:
+                self._pool.start(_TabSearchTask(generation, [tab], key, cancelled, self._signals))
+        self._update_summary()
+
+    def reset(self):
+        """Clear the results and forget the text copied from the tabs"""
+        self.clear()
+        self._snapshots = {}
+
+    def clear(self):
+        """Drop results and abandon running searches"""
+        self._search_timer.stop()
+        self._request = None
+        self._generation += 1
+        self._pending = 0
+        self._total = 0
+        self._tab_count = 0
+        self._unloaded = 0
+        self.tree.clear()
+        self.summary_label.setText("")
+
+    def _on_tab_finished(self, generation, editor, title, total, hits):
+        if generation != self._generation:
+            return
+        self._pending -= 1
+        if total < 0:
+            self._unloaded += 1
+            group = QTreeWidgetItem([f"{title}  (not loaded)"])
+            group.setDisabled(True)
+            self.tree.addTopLevelItem(group)
+        elif total:
+            self._total += total
+            self._tab_count += 1
+            group = QTreeWidgetItem([f"{title}  ({total:,})"])
+            for line, column, start, end, preview in hits:
+                item = QTreeWidgetItem([f"{line + 1}:{column + 1}  {preview}"])
+                item.setData(0, Qt.ItemDataRole.UserRole, (editor, start, end))
+                group.addChild(item)
+            if total > len(hits):
+                group.addChild(QTreeWidgetItem([f"… {total - len(hits):,} more"]))
+            self.tree.addTopLevelItem(group)
+            group.setExpanded(True)
+        self._update_summary()
+
+    def _update_summary(self):
+        text = f"{self._total:,} matches in {self._tab_count} tabs"
+        if self._unloaded:
+            text += f", {self._unloaded} not searched"
+        if self._pending:
+            text += f" (searching {self._pending} more…)"
+        self.summary_label.setText(text)
+
+    def retarget(self, old, new):
+        """Point results listed for a tab page at the page that replaced it"""
+        for i in range(self.tree.topLevelItemCount()):
+            group = self.tree.topLevelItem(i)
+            for j in range(group.childCount()):
+                item = group.child(j)
+                target = item.data(0, Qt.ItemDataRole.UserRole)
+                if target and target[0] is old:
+                    item.setData(0, Qt.ItemDataRole.UserRole, (new,) + tuple(target[1:]))
+
+    def _on_item_activated(self, item, _column=0):
+        target = item.data(0, Qt.ItemDataRole.UserRole)
+        if target:
+            self.result_activated.emit(*target)
@@ -1,19 +1,19 @@
 """
 Glassnotes Virtualized Note List
-Memory-efficient note list using QListWidget with custom items
+Model/view note list that paints its rows, so only visible notes cost anything
 """
 
 import os
+import time
 from datetime import datetime
+from difflib import SequenceMatcher
 from PyQt6.QtWidgets import (
-    QListWidget,
-    QListWidgetItem,
-    QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
+    QListView,
     QLabel,
-    QFrame,
     QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QToolTip,
 )
 from PyQt6.QtCore import (
     Qt,
@@ -23,11 +23,22 @@ from PyQt6.QtCore import (
     QEasingCurve,
     pyqtProperty,
     QRectF,
+    QRect,
+    QEvent,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
 )
-from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QBrush, QPen
+from PyQt6.QtGui import QFont, QColor, QPainter, QBrush, QFontMetrics
 
 from src.ui.styles import GlassColors
 from src.logic.file_manager import file_manager
+from src.logic.catalog import note_catalog
+from src.logic.corpus import index_key
+from src.logic.fuzzy import FuzzyMatcher, match_key
 
 
 # =============================================================================
@@ -90,349 +101,809 @@ class _ActionButton(QLabel):
         self._anim.start()
 
 
-class NoteListItem(QFrame):
-    """Lightweight note item widget with hover animation"""
+def format_note_time(timestamp):
+    """Human-friendly relative time for a note's modification time"""
+    if isinstance(timestamp, str):
+        try:
+            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except:
+            return timestamp
+    elif isinstance(timestamp, (int, float)):
+        dt = datetime.fromtimestamp(timestamp)
+    else:
+        dt = timestamp
+
+    now = datetime.now()
+    if hasattr(dt, "tzinfo") and dt.tzinfo:
+        now = datetime.now(dt.tzinfo)
+
+    diff = now - dt
+
+    if diff.days == 0:
+        hours = diff.seconds // 3600
+        if hours == 0:
+            minutes = diff.seconds // 60
+            if minutes < 2:
+                return "Just now"
+            return f"{minutes} min ago"
+        elif hours == 1:
+            return "1 hour ago"
+        return f"{hours} hours ago"
+    elif diff.days == 1:
+        return "Yesterday"
+    elif diff.days < 7:
+        return f"{diff.days} days ago"
+    else:
+        return dt.strftime("%b %d, %Y")
 
-    noteClicked = pyqtSignal(str)
-    deleteRequested = pyqtSignal(str)
-    unlinkRequested = pyqtSignal(str)
 
-    _hover_color = QColor(0, 0, 0, 0)
+# =============================================================================
+# Model
+# =============================================================================
+
 
-    _hover_opacity = 0
+class _PreviewSignals(QObject):
+    """Carries a fetched preview back to the UI thread"""
 
-    def __init__(
-        self, title, path, preview="", modified_time=None, is_cloud=False, parent=None
-    ):
-        super().__init__(parent)
-        self.path = path
-        self.is_cloud = is_cloud
-        self._setup_ui(title, preview, modified_time)
-        self._setup_animations()
-        self.setFixedHeight(110)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    loaded = pyqtSignal(int, str, str)  # generation, path, preview
 
-    def _setup_animations(self):
-        self._hover_animation = QPropertyAnimation(self, b"hoverOpacity")
-        self._hover_animation.setDuration(180)
-        self._hover_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
 
-    def _get_hover_opacity(self) -> int:
-        return self._hover_opacity
+class _PreviewTask(QRunnable):
+    """Reads one note preview through the shared preview cache"""
 
-    def _set_hover_opacity(self, value: int):
-        self._hover_opacity = value
-        self.update()  # Trigger repaint for smooth animation without CSS overhead
+    def __init__(self, generation, path, signals):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.signals = signals
 
-    hoverOpacity = pyqtProperty(int, fget=_get_hover_opacity, fset=_set_hover_opacity)
+    def run(self):
+        preview = file_manager.get_file_preview(self.path)
+        self.signals.loaded.emit(self.generation, self.path, preview)
 
-    def paintEvent(self, event):
-        """Custom paint event for silky smooth flicker-free hover animation"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Draw background highlight
-        bg_alpha = int(self._hover_opacity * 0.08)
-        if bg_alpha > 0:
-            painter.setBrush(QBrush(QColor(157, 70, 255, bg_alpha)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            # Draw rounded rect for background
-            painter.drawRoundedRect(
-                QRectF(self.rect()).adjusted(2, 2, -2, -2), 6, 6
-            )
+class NoteListModel(QAbstractListModel):
+    """Notes shown in the hub list
 
-        # Draw left accent strip
-        if self._hover_opacity > 0:
-            # Center the 60px strip vertically
-            y_pos = (self.height() - 60) / 2
-            accent_rect = QRectF(2, y_pos, 4, 60)
-            painter.setBrush(QBrush(QColor(157, 70, 255, self._hover_opacity)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(accent_rect, 2, 2)
+    Rows hold only the raw note (a path, or a cloud file dict). Title,
+    preview and time are derived when the delegate asks for them, from the
+    note catalog when it knows the file. Other previews are read on a thread
+    pool; until one arrives the row has no preview and the delegate paints
+    a placeholder.
+    """
 
-    def enterEvent(self, event):
-        super().enterEvent(event)
-        self._animate_hover(True)
+    PathRole = Qt.ItemDataRole.UserRole + 1
+    PreviewRole = Qt.ItemDataRole.UserRole + 2
+    TimeRole = Qt.ItemDataRole.UserRole + 3
+    CloudRole = Qt.ItemDataRole.UserRole + 4
+    WordsRole = Qt.ItemDataRole.UserRole + 5
 
-    def leaveEvent(self, event):
-        super().leaveEvent(event)
-        self._animate_hover(False)
-
-    def _animate_hover(self, hover):
-        target = 255 if hover else 0
-        self._hover_animation.stop()
-        self._hover_animation.setStartValue(self._hover_opacity)
-        self._hover_animation.setEndValue(target)
-        self._hover_animation.start()
-
-    def _setup_ui(self, title, preview, modified_time):
-        self.setObjectName("NoteListItem")
-        # Base style: transparent so we can draw the hover effect ourselves
-        self.setStyleSheet("#NoteListItem { background: transparent; border: none; }")
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 0, 16, 0) # Clear space for the painted accent strip
-        layout.setSpacing(0)
-
-        content_container = QWidget()
-        content_container.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        content_layout = QVBoxLayout(content_container)
-        content_layout.setContentsMargins(16, 14, 16, 14)
-        content_layout.setSpacing(8)
-
-        header = QHBoxLayout()
-        header.setSpacing(10)
-
-        icon_label = QLabel()
-        if self.is_cloud:
-            icon_label.setText("☁️")
-            icon_label.setToolTip("Cloud Note (Google Drive)")
+    MAX_ROW_EDITS = 200  # rows inserted or removed before update_notes resets instead
+
+    def __init__(self, parent=None, catalog=None):
+        super().__init__(parent)
+        self._catalog = catalog or note_catalog
+        self._notes = []
+        self._is_cloud = False
+        self._content_hits = {}
+        self._times = {}  # path -> formatted modification time, filled on demand
+        self._rows = {}  # path -> row
+        self._previews = {}  # path -> last preview received, kept across resets
+        self._requested = set()  # paths fetched or being fetched since the last reset
+        self._generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._signals = _PreviewSignals()
+        self._signals.loaded.connect(self._on_preview_loaded)
+
+    def set_notes(self, notes, is_cloud=False, content_hits=None):
+        """Replace the rows; previews already shown stay until they are re-validated"""
+        self.beginResetModel()
+        self._notes = list(notes)
+        self._is_cloud = is_cloud
+        self._content_hits = content_hits or {}
+        self._times = {}
+        self._rows = {self._path(note): row for row, note in enumerate(self._notes)}
+        self._previews = {path: text for path, text in self._previews.items() if path in self._rows}
+        self._requested = set()
+        self._generation += 1
+        self._pool.clear()  # queued fetches for the old rows are no longer needed
+        self.endResetModel()
+
+    def update_notes(self, notes):
+        """Change the rows to notes through row inserts and removals
+
+        Rows that stay keep their cached data and views keep their scroll
+        position; a note that moved is removed and re-inserted. Large
+        changes fall back to a reset, which is cheaper than many row moves.
+        """
+        old = [self._path(note) for note in self._notes]
+        new = [self._path(note) for note in notes]
+        if old == new:
+            self._notes = list(notes)
+            return
+        if len(set(old).symmetric_difference(new)) > self.MAX_ROW_EDITS:
+            # Cheap early out before diffing long lists
+            self.set_notes(notes, self._is_cloud, self._content_hits)
+            return
+        opcodes = SequenceMatcher(None, old, new, autojunk=False).get_opcodes()
+        edits = sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+        if edits > self.MAX_ROW_EDITS:
+            self.set_notes(notes, self._is_cloud, self._content_hits)
+            return
+        # Back to front, so earlier row numbers stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._notes[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self._notes[i1:i1] = notes[j1:j2]
+                self.endInsertRows()
+        self._rows = {path: row for row, path in enumerate(new)}
+
+    def append_notes(self, notes):
+        """Add rows after the last one, for filling the list in batches"""
+        if not notes:
+            return
+        first = len(self._notes)
+        self.beginInsertRows(QModelIndex(), first, first + len(notes) - 1)
+        self._notes.extend(notes)
+        for row, note in enumerate(notes, first):
+            self._rows[self._path(note)] = row
+        self.endInsertRows()
+
+    def refresh_paths(self, paths):
+        """Repaint the rows of paths after their catalog entries changed"""
+        for path in paths:
+            self._times.pop(path, None)
+            self._previews.pop(path, None)
+            self._requested.discard(path)
+            row = self._rows.get(path)
+            if row is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def prefetch(self, first, last):
+        """Start fetching previews for rows first..last, e.g. those about to scroll into view"""
+        if self._is_cloud:
+            return
+        for row in range(max(0, first), min(last, len(self._notes) - 1) + 1):
+            note = self._notes[row]
+            if self._catalog_entry(note) is None:
+                self._request(str(note))
+
+    def _request(self, path):
+        if path in self._requested:
+            return
+        self._requested.add(path)
+        self._pool.start(_PreviewTask(self._generation, path, self._signals))
+
+    def _on_preview_loaded(self, generation, path, preview):
+        if generation != self._generation:
+            return
+        if self._previews.get(path) == preview:
+            return
+        self._previews[path] = preview
+        row = self._rows.get(path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [self.PreviewRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._notes)
+
+    def _path(self, note):
+        return note.get("id", "") if self._is_cloud else str(note)
+
+    def _catalog_entry(self, note):
+        if self._is_cloud:
+            return None
+        entry = self._catalog.entry(str(note))
+        # Entries that were only marked opened have not been read yet
+        return entry if entry is not None and entry["size"] >= 0 else None
+
+    def _time_text(self, note):
+        path = self._path(note)
+        text = self._times.get(path)
+        if text is None:
+            entry = self._catalog_entry(note)
+            if self._is_cloud:
+                modified_time = note.get("modifiedTime")
+            elif entry is not None:
+                modified_time = entry["mtime"]
+            else:
+                try:
+                    modified_time = os.path.getmtime(path)
+                except OSError:
+                    modified_time = None
+            text = format_note_time(modified_time) if modified_time else "Unknown"
+            self._times[path] = text
+        return text
+
+    def _preview_text(self, note):
+        if self._is_cloud:
+            preview = ""
         else:
-            icon_label.setText("📄")
-            icon_label.setToolTip("Local Note")
-        icon_label.setStyleSheet("font-size: 16px; background: transparent;")
-
-        self.title_label = QLabel(title)
-        self.title_label.setFont(QFont("Segoe UI", 13, QFont.Weight.DemiBold))
-        self.title_label.setStyleSheet(
-            f"color: {GlassColors.TEXT_PRIMARY}; background: transparent;"
-        )
+            path = str(note)
+            preview = self._content_hits.get(index_key(path))
+            entry = self._catalog_entry(note)
+            if not preview and entry is not None:
+                preview = entry["preview"]
+            elif not preview:
+                self._request(path)
+                preview = self._previews.get(path)
+                if preview is None:
+                    return None
+        if not preview:
+            return "Empty note"
+        preview_text = preview[:100].replace("\n", " ").strip()
+        if len(preview) > 100:
+            preview_text += "..."
+        return preview_text
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._notes):
+            return None
+        note = self._notes[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._is_cloud:
+                return note.get("name", "Untitled")
+            return str(note).replace("\\", "/").split("/")[-1]
+        if role == self.PathRole:
+            return self._path(note)
+        if role == self.PreviewRole:
+            return self._preview_text(note)
+        if role == self.TimeRole:
+            return self._time_text(note)
+        if role == self.CloudRole:
+            return self._is_cloud
+        if role == self.WordsRole:
+            entry = self._catalog_entry(note)
+            return entry["words"] if entry is not None else None
+        return None
 
-        self.delete_btn = _ActionButton("🗑️", hover_color=QColor(239, 68, 68))
-        self.delete_btn.setFixedSize(24, 24)
-        self.delete_btn.setStyleSheet("font-size: 14px; padding: 2px;")
-        self.delete_btn.setToolTip("Delete note")
-        self.delete_btn.mousePressEvent = (
-            lambda e: self.deleteRequested.emit(self.path)
-            if e.button() == Qt.MouseButton.LeftButton
-            else None
-        )
 
-        self.unlink_btn = _ActionButton("−", hover_color=QColor(156, 163, 175))
-        self.unlink_btn.setFixedSize(24, 24)
-        self.unlink_btn.setStyleSheet("font-size: 16px; padding: 2px;")
-        self.unlink_btn.setToolTip("Remove from history")
-        self.unlink_btn.mousePressEvent = (
-            lambda e: self.unlinkRequested.emit(self.path)
-            if e.button() == Qt.MouseButton.LeftButton
-            else None
-        )
+# =============================================================================
+# Delegate
+# =============================================================================
 
-        header.addWidget(icon_label)
-        header.addWidget(self.title_label, 1)
-        header.addWidget(self.unlink_btn)
-        header.addWidget(self.delete_btn)
-        content_layout.addLayout(header)
 
-        if preview:
-            preview_text = preview[:100].replace("\n", " ").strip()
-            if len(preview) > 100:
-                preview_text += "..."
-        else:
-            preview_text = "Empty note"
+class NoteItemDelegate(QStyledItemDelegate):
+    """Paints a note row: title, preview, time, hover highlight and action buttons"""
 
-        self.preview_label = QLabel(preview_text)
-        self.preview_label.setFont(QFont("Segoe UI", 11))
-        self.preview_label.setStyleSheet(
-            f"color: {GlassColors.TEXT_TERTIARY}; background: transparent;"
-        )
-        self.preview_label.setWordWrap(True)
-        self.preview_label.setMaximumHeight(40)
-        content_layout.addWidget(self.preview_label)
+    ROW_HEIGHT = 110
+    ROW_MARGIN = 6
+    BUTTON_SIZE = 24
 
-        footer = QHBoxLayout()
+    # action -> (glyph, hover color, tooltip), laid out right to left
+    ACTIONS = {
+        "delete": ("🗑️", QColor(239, 68, 68), "Delete note"),
+        "unlink": ("−", QColor(156, 163, 175), "Remove from history"),
+    }
 
-        if modified_time:
-            time_text = self._format_time(modified_time)
-        else:
-            time_text = "Unknown"
+    def __init__(self, parent=None, actions=None):
+        super().__init__(parent)
+        self.hovered_action = None  # (row, action) under the mouse
+        self.actions = list(actions or self.ACTIONS)  # buttons shown, a subset of ACTIONS
+        self._title_font = QFont("Segoe UI", 13, QFont.Weight.DemiBold)
+        self._preview_font = QFont("Segoe UI", 11)
+        self._time_font = QFont("Segoe UI", 10)
+        self._icon_font = QFont("Segoe UI", 12)
+        self._button_fonts = {"delete": QFont("Segoe UI", 10), "unlink": QFont("Segoe UI", 12)}
+        self._text_primary = QColor(GlassColors.TEXT_PRIMARY)
+        self._text_tertiary = QColor(255, 255, 255, 128)
+        self._text_muted = QColor(255, 255, 255, 89)
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT + 2 * self.ROW_MARGIN)
+
+    def _card_rect(self, rect):
+        return rect.adjusted(0, self.ROW_MARGIN, 0, -self.ROW_MARGIN)
+
+    def action_rects(self, rect):
+        """Map of action -> hit rect of its button within a row rect"""
+        card = self._card_rect(rect)
+        right = card.right() - 16 - 16
+        top = card.top() + 14
+        rects = {}
+        for action in self.actions:
+            rects[action] = QRect(right - self.BUTTON_SIZE + 1, top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+            right -= self.BUTTON_SIZE
+        return rects
+
+    def action_at(self, rect, pos):
+        """The action whose button is under pos in a row, or None"""
+        for action, button in self.action_rects(rect).items():
+            if button.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card = self._card_rect(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        if hovered:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(QColor(157, 70, 255, 20)))
+            painter.drawRoundedRect(QRectF(card).adjusted(2, 2, -2, -2), 6, 6)
+            # Left accent strip, 60px centered vertically
+            painter.setBrush(QBrush(QColor(157, 70, 255)))
+            y_pos = card.top() + (card.height() - 60) / 2
+            painter.drawRoundedRect(QRectF(card.left() + 2, y_pos, 4, 60), 2, 2)
+
+        left = card.left() + 8 + 16
+        right = card.right() - 16 - 16
+        top = card.top() + 14
+
+        # Header: icon, title, action buttons
+        is_cloud = index.data(NoteListModel.CloudRole)
+        painter.setFont(self._icon_font)
+        painter.setPen(self._text_primary)
+        icon_rect = QRect(left, top, 24, self.BUTTON_SIZE)
+        painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, "☁️" if is_cloud else "📄")
+
+        buttons = self.action_rects(option.rect)
+        title_left = icon_rect.right() + 10
+        title_right = min(r.left() for r in buttons.values()) - 10
+        painter.setFont(self._title_font)
+        title = QFontMetrics(self._title_font).elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole) or "",
+            Qt.TextElideMode.ElideRight,
+            max(0, title_right - title_left),
+        )
+        painter.drawText(
+            QRect(title_left, top, max(0, title_right - title_left), self.BUTTON_SIZE),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            title,
+        )
 
-        self.time_label = QLabel(f"📅 {time_text}")
-        self.time_label.setFont(QFont("Segoe UI", 10))
-        self.time_label.setStyleSheet(
-            f"color: {GlassColors.TEXT_MUTED}; background: transparent;"
+        for action, button in buttons.items():
+            glyph, color, _ = self.ACTIONS[action]
+            if self.hovered_action == (index.row(), action):
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QBrush(QColor(color.red(), color.green(), color.blue(), 40)))
+                painter.drawRoundedRect(QRectF(button), 4, 4)
+            painter.setPen(self._text_primary)
+            painter.setFont(self._button_fonts[action])
+            painter.drawText(button, Qt.AlignmentFlag.AlignCenter, glyph)
+
+        # Preview: at most two lines
+        preview_top = top + self.BUTTON_SIZE + 8
+        preview = index.data(NoteListModel.PreviewRole)
+        painter.setFont(self._preview_font)
+        painter.setPen(self._text_tertiary if preview is not None else self._text_muted)
+        painter.drawText(
+            QRect(left, preview_top, right - left, 40),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            preview if preview is not None else "Loading preview…",
         )
 
-        footer.addWidget(self.time_label)
-        footer.addStretch()
-        content_layout.addLayout(footer)
-        layout.addWidget(content_container, 1)
-
-    def _format_time(self, timestamp):
-        if isinstance(timestamp, str):
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            except:
-                return timestamp
-        elif isinstance(timestamp, (int, float)):
-            dt = datetime.fromtimestamp(timestamp)
-        else:
-            dt = timestamp
-
-        now = datetime.now()
-        if hasattr(dt, "tzinfo") and dt.tzinfo:
-            now = datetime.now(dt.tzinfo)
-
-        diff = now - dt
-
-        if diff.days == 0:
-            hours = diff.seconds // 3600
-            if hours == 0:
-                minutes = diff.seconds // 60
-                if minutes < 2:
-                    return "Just now"
-                return f"{minutes} min ago"
-            elif hours == 1:
-                return "1 hour ago"
-            return f"{hours} hours ago"
-        elif diff.days == 1:
-            return "Yesterday"
-        elif diff.days < 7:
-            return f"{diff.days} days ago"
-        else:
-            return dt.strftime("%b %d, %Y")
+        # Footer: modification time and word count
+        footer = f"📅 {index.data(NoteListModel.TimeRole)}"
+        words = index.data(NoteListModel.WordsRole)
+        if words is not None:
+            footer += f"  ·  {words:,} words"
+        painter.setFont(self._time_font)
+        painter.setPen(self._text_muted)
+        painter.drawText(
+            QRect(left, card.bottom() - 14 - 16, right - left, 16),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            footer,
+        )
+        painter.restore()
+
+
+# =============================================================================
+# View
+# =============================================================================
 
-    def mouseReleaseEvent(self, e):
-        super().mouseReleaseEvent(e)
-        if e.button() == Qt.MouseButton.LeftButton:
-            self.noteClicked.emit(self.path)
 
+class VirtualNoteList(QListView):
+    """Virtualized note list; rows are painted by NoteItemDelegate, no widget per note
 
-class VirtualNoteList(QListWidget):
-    """Virtualized note list using QListWidget for memory efficiency"""
+    Row details come from catalog, the hub's note catalog by default;
+    actions limits the row buttons to some of NoteItemDelegate.ACTIONS.
+    """
 
     noteClicked = pyqtSignal(str)
     deleteRequested = pyqtSignal(str)
     unlinkRequested = pyqtSignal(str)
     refreshRequested = pyqtSignal()
-
-    def __init__(self, parent=None):
+    firstFramePainted = pyqtSignal()  # once, when the first notes (or the empty state) are painted
+
+    PREFETCH_PAGES = 1  # pages of previews fetched beyond each edge of the viewport
+    RANK_BUDGET_MS = 12  # fuzzy ranking work per event-loop turn, to stay within a frame
+    POPULATE_BUDGET_MS = 8  # list filling work per event-loop turn, leaving time to paint
+    POPULATE_BATCH = 500  # rows appended per step while filling the list
+    KEY_CHUNK = 5000  # sort keys computed per step while filling the list
+
+    # sort -> whether its natural order is descending
+    SORT_DESCENDING = {
+        "recent": True,
+        "modified": True,
+        "name_asc": False,
+        "name_desc": True,
+        "size": True,
+        "words": True,
+    }
+
+    def __init__(self, parent=None, catalog=None, actions=None):
         super().__init__(parent)
         self.setObjectName("VirtualNoteList")
+        self._catalog = catalog or note_catalog
         self._notes_data = []
         self._is_cloud = False
         self._current_sort = "recent"
+        self._reverse = False
         self._search_query = ""
+        self._content_hits = {}  # index_key -> snippet, best match first
+        self._sort_keys = {}  # sort -> key per entry of _notes_data, until the catalog changes
+        self._match_keys = {}  # path -> match_key, kept across list updates
+        self._matcher = None  # FuzzyMatcher over _notes_data, built on first search
+        self._index_by_key = None  # index_key -> index into _notes_data, built on first content hit
+        self._ranking = None  # rank_chunks generator of the search in progress
+        self._rank_timer = QTimer(self)
+        self._rank_timer.setSingleShot(True)
+        self._rank_timer.timeout.connect(self._continue_ranking)
+        self._loading = True  # no notes set yet; skeleton rows are painted meanwhile
+        self._first_frame_painted = False
+        self._populating = None  # _populate_steps generator filling an empty list
+        self._queued_rows = 0  # rows _populating has yet to append
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.timeout.connect(self._continue_populating)
+
+        self._model = NoteListModel(self, self._catalog)
+        self._delegate = NoteItemDelegate(self, actions)
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+        self.verticalScrollBar().valueChanged.connect(self._prefetch_ahead)
 
         self._setup_ui()
 
     def _setup_ui(self):
-        self.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
         self.setStyleSheet(
-            f"""
-            QListWidget {{
+            """
+            QListView {
                 background: transparent;
                 border: none;
                 outline: none;
-            }}
-            QListWidget::item {{
-                background: transparent;
-                border: none;
-                padding: 0px;
-                margin: 6px 0px;
-            }}
-            QListWidget::item:selected {{
-                background: transparent;
-            }}
+            }
         """
         )
 
-    def _create_item(self, note_data):
-        if self._is_cloud:
-            title = note_data.get("name", "Untitled")
-            path = note_data.get("id", "")
-            preview = ""
-            modified_time = note_data.get("modifiedTime")
-            is_cloud = True
+    # -------------------------------------------------------------------------
+    # Mouse handling
+    # -------------------------------------------------------------------------
+
+    def _hit(self, pos):
+        """(index, action) under a viewport position; action is None off the buttons"""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return index, None
+        return index, self._delegate.action_at(self.visualRect(index), pos)
+
+    def mouseMoveEvent(self, e):
+        super().mouseMoveEvent(e)
+        index, action = self._hit(e.position().toPoint())
+        hovered = (index.row(), action) if action else None
+        if hovered != self._delegate.hovered_action:
+            self._delegate.hovered_action = hovered
+            self.viewport().update()
+
+    def leaveEvent(self, e):
+        super().leaveEvent(e)
+        if self._delegate.hovered_action is not None:
+            self._delegate.hovered_action = None
+            self.viewport().update()
+
+    def mouseReleaseEvent(self, e):
+        super().mouseReleaseEvent(e)
+        if e.button() != Qt.MouseButton.LeftButton:
+            return
+        index, action = self._hit(e.position().toPoint())
+        if not index.isValid():
+            return
+        path = index.data(NoteListModel.PathRole)
+        if action == "delete":
+            self.deleteRequested.emit(path)
+        elif action == "unlink":
+            self.unlinkRequested.emit(path)
         else:
-            path = str(note_data)
-            title = path.replace("\\", "/").split("/")[-1]
-            preview = file_manager.get_file_preview(path)
-            modified_time = self._get_file_modified_time(path)
-            is_cloud = False
-
-        item = QListWidgetItem()
-        widget = NoteListItem(title, path, preview, modified_time, is_cloud)
-        widget.noteClicked.connect(self.noteClicked.emit)
-        widget.deleteRequested.connect(self.deleteRequested.emit)
-        widget.unlinkRequested.connect(self.unlinkRequested.emit)
-
-        item.setSizeHint(QSize(0, 122)) # 110 + 12 (6*2 margin)
-        self.addItem(item)
-        self.setItemWidget(item, widget)
-
-    def _get_file_modified_time(self, path):
-        try:
-            return os.path.getmtime(path)
-        except:
-            return None
+            self.noteClicked.emit(path)
+
+    def viewportEvent(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            index, action = self._hit(event.pos())
+            if action:
+                QToolTip.showText(event.globalPos(), self._delegate.ACTIONS[action][2], self)
+            elif index.isValid():
+                tip = "Cloud Note (Google Drive)" if self._is_cloud else "Local Note"
+                QToolTip.showText(event.globalPos(), tip, self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().viewportEvent(event)
+
+    # -------------------------------------------------------------------------
+    # Preview prefetch
+    # -------------------------------------------------------------------------
+
+    def _row_height(self):
+        return self._delegate.ROW_HEIGHT + 2 * self._delegate.ROW_MARGIN
+
+    def _page_rows(self):
+        """Rows that fit in the viewport, counting a partly visible one"""
+        return self.viewport().height() // self._row_height() + 1
+
+    def _prefetch_ahead(self):
+        """Fetch previews for the visible rows and a page on either side"""
+        page = self._page_rows()
+        first = self.verticalScrollBar().value() // self._row_height()
+        ahead = page * self.PREFETCH_PAGES
+        # Visible rows are queued first, then the rows beyond each edge
+        self._model.prefetch(first, first + page)
+        self._model.prefetch(first + page + 1, first + page + ahead)
+        self._model.prefetch(first - ahead, first - 1)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._prefetch_ahead()
+
+    def paintEvent(self, e):
+        super().paintEvent(e)
+        if self._model.rowCount() == 0 and self._loading:
+            self._paint_skeleton()
+        elif self._model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setFont(QFont("Segoe UI", 11))
+            painter.setPen(QColor(255, 255, 255, 89))
+            painter.drawText(
+                QRect(0, 0, self.viewport().width(), 80),
+                Qt.AlignmentFlag.AlignCenter,
+                "No notes found" if self._search_query else "No notes yet",
+            )
+        if not self._loading and not self._first_frame_painted:
+            self._first_frame_painted = True
+            self.firstFramePainted.emit()
 
-    def _filter_and_sort(self, notes):
-        if self._search_query:
-            filtered = []
-            for note in notes:
+    def _paint_skeleton(self):
+        """Placeholder cards shaped like note rows, shown until the first notes arrive"""
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        card_brush = QBrush(QColor(255, 255, 255, 8))
+        bar_brush = QBrush(QColor(255, 255, 255, 18))
+        row_height = self._row_height()
+        margin = self._delegate.ROW_MARGIN
+        width = self.viewport().width()
+        for row in range(self._page_rows()):
+            card = QRectF(margin, row * row_height + margin, width - 2 * margin, self._delegate.ROW_HEIGHT)
+            painter.setBrush(card_brush)
+            painter.drawRoundedRect(card.adjusted(2, 2, -2, -2), 6, 6)
+            left = card.left() + 24
+            inner = max(0.0, card.width() - 56)
+            painter.setBrush(bar_brush)
+            # Title, two preview lines and the footer
+            for top, height, fraction in ((16, 16, 0.4), (48, 10, 0.9), (64, 10, 0.6), (86, 8, 0.25)):
+                painter.drawRoundedRect(QRectF(left, card.top() + top, inner * fraction, height), 4, 4)
+        painter.end()
+
+    # -------------------------------------------------------------------------
+    # Data
+    # -------------------------------------------------------------------------
+
+    def _note_path(self, note):
+        return note.get("id", "") if self._is_cloud else str(note)
+
+    def _build_matcher(self):
+        """Fuzzy matcher over the current notes, reusing keys of notes seen before"""
+        paths = list(map(self._note_path, self._notes_data))
+        keys = list(map(self._match_keys.get, paths))
+        for i, key in enumerate(keys):
+            if key is None:
+                note = self._notes_data[i]
                 if self._is_cloud:
-                    name = note.get("name", "").lower()
+                    name = note.get("name", "")
                 else:
-                    name = str(note).replace("\\", "/").split("/")[-1].lower()
-                if self._search_query in name:
-                    filtered.append(note)
-            notes = filtered
+                    name = paths[i].replace("\\", "/").split("/")[-1]
+                keys[i] = self._match_keys[paths[i]] = match_key(name, paths[i])
+        return FuzzyMatcher(keys)
 
-        if self._current_sort == "name_asc":
+    def _sort_key(self, sort, note):
+        """Sort key of one note, from the catalog so no file is stat'ed"""
+        if sort in ("name_asc", "name_desc"):
             if self._is_cloud:
-                notes = sorted(notes, key=lambda x: x.get("name", "").lower())
-            else:
-                notes = sorted(notes, key=lambda x: str(x).lower())
-        elif self._current_sort == "name_desc":
-            if self._is_cloud:
-                notes = sorted(
-                    notes, key=lambda x: x.get("name", "").lower(), reverse=True
-                )
-            else:
-                notes = sorted(notes, key=lambda x: str(x).lower(), reverse=True)
-
-        return notes
-
-    def set_notes(self, notes, is_cloud=False, sort="recent", search=""):
-        """Set notes data and rebuild list"""
+                return note.get("name", "").lower()
+            return str(note).replace("\\", "/").split("/")[-1].lower()
+        if self._is_cloud:
+            return note.get("modifiedTime", "") if sort == "modified" else 0
+        entry = self._catalog.entry(str(note))
+        if entry is None or entry["size"] < 0:
+            return (0.0, 0.0) if sort == "recent" else 0
+        if sort == "recent":
+            # Opened notes by open time, then the rest by modification time
+            return (entry["last_opened"] or 0.0, entry["mtime"])
+        return entry[{"modified": "mtime", "size": "size", "words": "words"}[sort]]
+
+    def _order(self, indices, ranked=False):
+        """indices into _notes_data in the current sort order
+
+        Ranked search results keep their relevance order under "recent";
+        every other sort orders them like the full list. Keys are computed
+        once per sort and list, so re-sorting and reversing are just sorts.
+        """
+        sort = self._current_sort
+        if ranked and sort == "recent":
+            ordered = list(indices)
+        else:
+            keys = self._sort_keys.get(sort)
+            if keys is None:
+                keys = self._sort_keys[sort] = [self._sort_key(sort, note) for note in self._notes_data]
+            ordered = sorted(indices, key=keys.__getitem__, reverse=self.SORT_DESCENDING[sort])
+        if self._reverse:
+            ordered.reverse()
+        return ordered
+
+    def _start_ranking(self):
+        """Rank the notes against the search a slice at a time, then show them"""
+        if self._matcher is None:
+            self._matcher = self._build_matcher()
+        self._ranking = self._matcher.rank_chunks(self._search_query)
+        self._continue_ranking()
+
+    def _continue_ranking(self):
+        if self._ranking is None:
+            return
+        deadline = time.perf_counter() + self.RANK_BUDGET_MS / 1000
+        while True:
+            ranked = next(self._ranking)
+            if ranked is not None:
+                self._ranking = None
+                self._show_matches(ranked)
+                return
+            if time.perf_counter() >= deadline:
+                self._rank_timer.start(0)
+                return
+
+    def _show_matches(self, ranked):
+        """Show fuzzy name matches, best first, followed by content matches"""
+        # Notes whose contents match follow the name matches, in rank order
+        if self._content_hits and not self._is_cloud:
+            if self._index_by_key is None:
+                self._index_by_key = {
+                    index_key(note): i for i, note in enumerate(self._notes_data)
+                }
+            listed = set(ranked)
+            for key in self._content_hits:
+                i = self._index_by_key.get(key)
+                if i is not None and i not in listed:
+                    ranked.append(i)
+
+        notes = list(map(self._notes_data.__getitem__, self._order(ranked, ranked=True)))
+        self._model.set_notes(notes, self._is_cloud, self._content_hits)
+        self._loading = False
+        self._prefetch_ahead()
+
+    def set_notes(
+        self, notes, is_cloud=False, sort="recent", search="", content_hits=None, reverse=False
+    ):
+        """Set notes data and update the list
+
+        content_hits maps index_key(path) to a snippet for notes whose
+        contents match the search; they are listed with the snippet as preview.
+        With a search, names are ranked fuzzily over several event-loop
+        turns and the list is replaced once ranking finishes. Otherwise,
+        unless the source changed, only the rows that differ are inserted
+        or removed. reverse flips the order of the chosen sort.
+        """
+        content_hits = content_hits or {}
+        same_source = is_cloud == self._is_cloud and content_hits == self._content_hits
+        if notes is not self._notes_data or is_cloud != self._is_cloud:
+            self._matcher = None
+            self._index_by_key = None
+            self._sort_keys = {}
         self._notes_data = notes
         self._is_cloud = is_cloud
         self._current_sort = sort
+        self._reverse = reverse
         self._search_query = search.lower().strip() if search else ""
+        self._content_hits = content_hits
+        self._apply(same_source)
+
+    def _apply(self, same_source=True):
+        """Fill the model from _notes_data with the current search and sort"""
+        self._delegate.hovered_action = None
+        self._ranking = None
+        self._rank_timer.stop()
+        self._populating = None
+        self._queued_rows = 0
+        self._populate_timer.stop()
+        if self._search_query:
+            self._start_ranking()
+            return
+        if self._model.rowCount() == 0 and len(self._notes_data) > self._page_rows():
+            # First fill: visible rows first, the rest over the following turns
+            self._populating = self._populate_steps()
+            self._continue_populating()
+            return
+
+        order = self._order(range(len(self._notes_data)))
+        notes = list(map(self._notes_data.__getitem__, order))
+        if same_source:
+            self._model.update_notes(notes)
+        else:
+            self._model.set_notes(notes, self._is_cloud, self._content_hits)
+        self._loading = False
+        self._prefetch_ahead()
 
-        self.clear()
-
-        filtered = self._filter_and_sort(self._notes_data)
-
-        for note in filtered:
-            self._create_item(note)
-
-        if not filtered:
-            self._show_empty_state()
+    def _populate_steps(self):
+        """Generator filling the empty list a step at a time, yielding after each step
 
-    def _show_empty_state(self):
-        item = QListWidgetItem()
-        empty_widget = QLabel(
-            "No notes found" if self._search_query else "No notes yet"
-        )
-        empty_widget.setObjectName("EmptyState")
-        empty_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_widget.setStyleSheet(
-            f"color: {GlassColors.TEXT_MUTED}; font-size: 14px; padding: 20px;"
-        )
-        empty_widget.setFixedHeight(80)
-        item.setSizeHint(QSize(0, 80))
-        self.addItem(item)
-        self.setItemWidget(item, empty_widget)
+        Sort keys are computed in chunks first, since the visible rows
+        depend on all of them; the first page or so of rows then goes in
+        at once, and the remaining rows are appended in batches.
+        """
+        sort = self._current_sort
+        if sort not in self._sort_keys:
+            keys = []
+            for start in range(0, len(self._notes_data), self.KEY_CHUNK):
+                chunk = self._notes_data[start : start + self.KEY_CHUNK]
+                keys += [self._sort_key(sort, note) for note in chunk]
+                yield
+            self._sort_keys[sort] = keys
+
+        order = self._order(range(len(self._notes_data)))
+        notes = list(map(self._notes_data.__getitem__, order))
+        first = self._page_rows() * (1 + self.PREFETCH_PAGES)
+        self._model.set_notes(notes[:first], self._is_cloud, self._content_hits)
+        self._queued_rows = max(0, len(notes) - first)
+        self._loading = False
+        self._prefetch_ahead()
+        yield
+
+        for start in range(first, len(notes), self.POPULATE_BATCH):
+            batch = notes[start : start + self.POPULATE_BATCH]
+            self._model.append_notes(batch)
+            self._queued_rows -= len(batch)
+            yield
+
+    def _continue_populating(self):
+        if self._populating is None:
+            return
+        deadline = time.perf_counter() + self.POPULATE_BUDGET_MS / 1000
+        while next(self._populating, False) is not False:
+            if time.perf_counter() >= deadline:
+                self._populate_timer.start(0)
+                return
+        self._populating = None
+
+    def refresh_notes(self, paths):
+        """Repaint the given notes after their catalog entries changed
+
+        Sorts other than by name depend on the catalog, so the list is
+        re-ordered too; rows that keep their place are only repainted.
+        """
+        if not paths:
+            return
+        self._model.refresh_paths(paths)
+        if self._current_sort not in ("name_asc", "name_desc"):
+            self._sort_keys = {}
+            self._apply()
 
     def count_notes(self):
-        return len(
-            [
-                i
-                for i in range(self.count())
-                if self.itemWidget(self.item(i)) is not None
-            ]
-        )
+        return self._model.rowCount() + self._queued_rows
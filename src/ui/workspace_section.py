@@ -0,0 +1,301 @@
+"""
+Glassnotes Workspace Root Section
+Hub section for one registered root folder, built only once it is expanded
+"""
+
+import os
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy
+from PyQt6.QtCore import Qt, QThread, QTimer, QFileSystemWatcher, pyqtSignal
+from PyQt6.QtGui import QFont, QColor
+
+from src.logic.config import config
+from src.logic.catalog import root_catalogs
+from src.logic.corpus import index_key
+from src.ui.virtual_note_list import VirtualNoteList, _ActionButton
+
+
+class _RootScanWorker(QThread):
+    """Opens a root's catalog and reconciles it with the disk off the UI thread"""
+
+    cached = pyqtSignal(list)  # cataloged paths, before the disk is checked
+    found = pyqtSignal(list)  # paths of notes new to the catalog, while the scan runs
+
+    def __init__(self, root, touched=None, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.touched = touched  # None for a full reconcile
+        self.catalog = None  # set before cached is emitted
+        self.result = None  # (paths, changed) once reconciled
+
+    def run(self):
+        try:
+            # Opening loads every row, so it happens here rather than on the UI thread
+            self.catalog = root_catalogs.get(self.root)
+            if self.touched is None:
+                self.cached.emit(self.catalog.paths())
+            self.result = self.catalog.reconcile(
+                [],
+                self.root,
+                cancelled=self.isInterruptionRequested,
+                touched=self.touched,
+                found=self.found.emit,
+            )
+        except Exception as e:
+            print(f"Error scanning workspace root {self.root}: {e}")
+
+
+class WorkspaceSection(QWidget):
+    """Collapsible hub section listing the notes under one workspace root
+
+    Until it is first expanded the section is only a header: the root's
+    catalog is not opened, nothing is scanned and nothing is watched. Once
+    materialized it keeps its own catalog, file watcher and note list, and
+    asks the hub to index its notes through indexRequested.
+    """
+
+    noteClicked = pyqtSignal(str)
+    deleteRequested = pyqtSignal(str)
+    removeRequested = pyqtSignal(str)  # root
+    indexRequested = pyqtSignal(list, object)  # paths, removed paths or None for a full sync
+
+    CHANGE_DELAY_MS = 300  # filesystem events within this window are handled together
+    FOUND_DELAY_MS = 250  # notes found by a running scan are added to the list this often
+    WATCH_FILE_LIMIT = 2000  # notes watched individually; the rest only via their directory
+    LIST_HEIGHT = 480
+
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.paths = []
+        self.list = None  # created once the catalog is open
+        self._materialized = False
+        self._worker = None
+        self._watcher = None
+        self._view = {"sort": "recent", "search": "", "content_hits": {}, "reverse": False}
+        self._found_notes = []
+        self._pending_changes = set()
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.CHANGE_DELAY_MS)
+        self._change_timer.timeout.connect(self._apply_pending_changes)
+        self._found_timer = QTimer(self)
+        self._found_timer.setSingleShot(True)
+        self._found_timer.setInterval(self.FOUND_DELAY_MS)
+        self._found_timer.timeout.connect(self._apply_found_notes)
+        self._setup_ui()
+        self.set_expanded(config.is_root_expanded(root))
+
+    def _setup_ui(self):
+        self.setObjectName("SettingsSection")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 8, 0, 16)
+        layout.setSpacing(12)
+
+        header = QHBoxLayout()
+        header.setSpacing(12)
+        header.setContentsMargins(8, 0, 8, 4)
+
+        self.toggle_btn = _ActionButton("▸", hover_color=QColor(157, 70, 255))
+        self.toggle_btn.setStyleSheet("font-size: 16px; padding: 2px;")
+        self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.toggle_btn.mousePressEvent = (
+            lambda e: self.set_expanded(not self.card.isVisible())
+            if e.button() == Qt.MouseButton.LeftButton
+            else None
+        )
+
+        icon_label = QLabel("🗂️")
+        icon_label.setStyleSheet("font-size: 22px; background: transparent;")
+
+        title_label = QLabel(os.path.basename(self.root.rstrip("\\/")) or self.root)
+        title_label.setObjectName("SectionHeader")
+        title_label.setFont(QFont("Segoe UI", 18, QFont.Weight.DemiBold))
+        title_label.setToolTip(self.root)
+
+        # Unknown until the catalog is opened
+        self.count_badge = QLabel("…")
+        self.count_badge.setStyleSheet("""
+            background: rgba(157, 70, 255, 0.2);
+            color: #B76EFF;
+            border-radius: 10px;
+            padding: 2px 10px;
+            font-size: 12px;
+            font-weight: 600;
+        """)
+
+        remove_btn = _ActionButton("✕", hover_color=QColor(156, 163, 175))
+        remove_btn.setStyleSheet("font-size: 14px; padding: 2px;")
+        remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        remove_btn.setToolTip("Remove folder from workspace (files are kept)")
+        remove_btn.mousePressEvent = (
+            lambda e: self.removeRequested.emit(self.root)
+            if e.button() == Qt.MouseButton.LeftButton
+            else None
+        )
+
+        header.addWidget(self.toggle_btn)
+        header.addWidget(icon_label)
+        header.addWidget(title_label)
+        header.addWidget(self.count_badge)
+        header.addStretch()
+        header.addWidget(remove_btn)
+        layout.addLayout(header)
+
+        self.card = QFrame()
+        self.card.setObjectName("SettingsCard")
+        card_layout = QVBoxLayout(self.card)
+        card_layout.setContentsMargins(20, 16, 20, 16)
+        card_layout.setSpacing(16)
+        self.card.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.card.setMinimumHeight(self.LIST_HEIGHT)
+        self.card.hide()
+        layout.addWidget(self.card)
+
+    # -------------------------------------------------------------------------
+    # Expansion
+    # -------------------------------------------------------------------------
+
+    def set_expanded(self, expanded):
+        self.card.setVisible(expanded)
+        self.toggle_btn.setText("▾" if expanded else "▸")
+        if expanded != config.is_root_expanded(self.root):
+            config.set_root_expanded(self.root, expanded)
+        if expanded and not self._materialized:
+            self._materialized = True
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self._on_path_changed)
+            self._watcher.directoryChanged.connect(self._on_path_changed)
+            # After the current event, so expanding paints before the scan starts
+            QTimer.singleShot(0, self.refresh)
+
+    def _ensure_list(self, catalog):
+        if self.list is not None:
+            return
+        self.list = VirtualNoteList(catalog=catalog, actions=("delete",))
+        self.list.noteClicked.connect(self.noteClicked.emit)
+        self.list.deleteRequested.connect(self.deleteRequested.emit)
+        self.card.layout().addWidget(self.list)
+
+    # -------------------------------------------------------------------------
+    # Catalog
+    # -------------------------------------------------------------------------
+
+    def refresh(self):
+        """Re-scan the whole root; does nothing until the section has been expanded"""
+        if self._materialized:
+            self._reconcile()
+
+    def notes_changed(self, paths):
+        """Patch the list after the given notes under this root changed"""
+        if self._materialized:
+            self._reconcile(paths)
+
+    def _reconcile(self, touched=None):
+        running = self._worker
+        if running is not None:
+            running.requestInterruption()
+            # A superseded reconcile still has to happen; widen this one to cover it
+            if running.touched is None:
+                touched = None
+            elif touched is not None:
+                touched = set(running.touched) | set(touched)
+        self._found_notes = []
+        self._found_timer.stop()
+        worker = _RootScanWorker(self.root, touched, self)
+        worker.cached.connect(lambda paths: self._on_cached(worker, paths))
+        worker.found.connect(lambda paths: self._on_found(worker, paths))
+        worker.finished.connect(lambda: self._on_reconciled(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._worker = worker
+        worker.start()
+
+    def _on_cached(self, worker, paths):
+        if worker is not self._worker:
+            return
+        self._ensure_list(worker.catalog)
+        if paths and paths != self.paths:
+            self._show(paths)
+
+    def _on_found(self, worker, paths):
+        if worker is not self._worker:
+            return
+        self._found_notes += paths
+        if not self._found_timer.isActive():
+            self._found_timer.start()
+
+    def _apply_found_notes(self):
+        found, self._found_notes = self._found_notes, []
+        listed = set(self.paths)
+        fresh = [path for path in found if path not in listed]
+        if fresh and self.list is not None:
+            self._show(self.paths + fresh)
+
+    def _on_reconciled(self, worker):
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self._found_notes = []
+        self._found_timer.stop()
+        if worker.result is None:
+            return
+        self._ensure_list(worker.catalog)
+        paths, changed = worker.result
+        listed = {index_key(path) for path in paths}
+        removed = [path for path in self.paths if index_key(path) not in listed]
+        if paths != self.paths:
+            self._show(paths)
+        self.list.refresh_notes(changed)
+        self._update_watches(paths)
+        if worker.touched is None:
+            self.indexRequested.emit(list(paths), None)
+        elif changed or removed:
+            self.indexRequested.emit(list(changed), removed)
+
+    # -------------------------------------------------------------------------
+    # Filesystem watching
+    # -------------------------------------------------------------------------
+
+    def _update_watches(self, paths):
+        """Watch the root, the directories of its notes and the first notes themselves"""
+        directories = {self.root} | {os.path.dirname(path) for path in paths}
+        files = set(paths[: self.WATCH_FILE_LIMIT])
+        for wanted, watched in (
+            (directories, set(self._watcher.directories())),
+            (files, set(self._watcher.files())),
+        ):
+            stale = watched - wanted
+            if stale:
+                self._watcher.removePaths(list(stale))
+            fresh = wanted - watched
+            if fresh:
+                self._watcher.addPaths(list(fresh))
+
+    def _on_path_changed(self, path):
+        self._pending_changes.add(path)
+        self._change_timer.start()
+
+    def _apply_pending_changes(self):
+        touched, self._pending_changes = self._pending_changes, set()
+        self.notes_changed(touched)
+
+    # -------------------------------------------------------------------------
+    # Display
+    # -------------------------------------------------------------------------
+
+    def apply_view(self, sort, search, content_hits, reverse):
+        """Show the notes with the hub's current sort and search"""
+        self._view = {"sort": sort, "search": search, "content_hits": content_hits, "reverse": reverse}
+        if self.list is not None:
+            self._show(self.paths)
+
+    def _show(self, paths):
+        self.paths = paths
+        self.count_badge.setText(str(len(paths)))
+        self.list.set_notes(paths, **self._view)
+
+    def shutdown(self):
+        """Stop background work before the section is removed"""
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker.wait()
+            self._worker = None
@@ -0,0 +1,14 @@
+"""
+Test setup: run against the source tree with app data in a temporary directory
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Config creates its directories under USERPROFILE (or the home directory) on import
+os.environ["USERPROFILE"] = tempfile.mkdtemp(prefix="glassnotes-tests-")
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from src.logic.catalog import NoteCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = NoteCatalog(db_file=tmp_path / "catalog.db")
+    yield catalog
+    catalog.close()
+
+
+@pytest.fixture
+def notes_dir(tmp_path):
+    directory = tmp_path / "notes"
+    directory.mkdir()
+    return directory
+
+
+def write(path, text, mtime=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_hub_files_lists_recent_first_then_sorted_notes(catalog, notes_dir, tmp_path):
+    recent = write(tmp_path / "elsewhere.txt", "recent")
+    b = write(notes_dir / "b.txt", "b")
+    a = write(notes_dir / "a.txt", "a")
+    listed = write(notes_dir / "listed.txt", "also recent")
+    files = catalog.hub_files([recent, listed], str(notes_dir))
+    assert [path for path, _ in files] == [recent, listed, a, b]
+    assert files[0][1] is None and files[2][1] is not None
+
+
+def test_reconcile_fills_rows_and_reports_changes(catalog, notes_dir):
+    note = write(notes_dir / "a.txt", "three little words")
+    paths, changed = catalog.reconcile([], str(notes_dir))
+    assert paths == changed == [note]
+    entry = catalog.entry(note)
+    assert entry["preview"] == "three little words"
+    assert entry["words"] == 3
+    assert catalog.reconcile([], str(notes_dir)) == ([note], [])
+
+
+def test_reconcile_rereads_changed_and_drops_missing(catalog, notes_dir):
+    a = write(notes_dir / "a.txt", "first", mtime=1_000_000)
+    b = write(notes_dir / "b.txt", "gone soon")
+    catalog.reconcile([], str(notes_dir))
+    write(notes_dir / "a.txt", "second text", mtime=2_000_000)
+    os.remove(b)
+    assert catalog.reconcile([], str(notes_dir)) == ([a], [a])
+    assert catalog.entry(b) is None
+    assert catalog.paths() == [a]
+
+
+def test_touched_reconcile_only_stats_touched_files(catalog, notes_dir):
+    a = write(notes_dir / "a.txt", "one", mtime=1_000_000)
+    b = write(notes_dir / "b.txt", "two", mtime=1_000_000)
+    catalog.reconcile([], str(notes_dir))
+    write(notes_dir / "a.txt", "one more", mtime=2_000_000)
+    write(notes_dir / "b.txt", "two more", mtime=2_000_000)
+    assert catalog.reconcile([], str(notes_dir), touched=[b]) == ([a, b], [b])
+
+
+def test_reconcile_keeps_opens_and_persists(catalog, notes_dir, tmp_path):
+    note = write(notes_dir / "a.txt", "text")
+    catalog.mark_opened(note)
+    opened = catalog.entry(note)["last_opened"]
+    catalog.reconcile([], str(notes_dir))
+    catalog.close()
+
+    reloaded = NoteCatalog(db_file=tmp_path / "catalog.db")
+    try:
+        assert reloaded.paths() == [note]
+        assert reloaded.entry(note)["last_opened"] == opened
+        assert reloaded.entry(note)["words"] == 1
+    finally:
+        reloaded.close()
+
+
+def test_cancelled_reconcile_changes_nothing(catalog, notes_dir):
+    write(notes_dir / "a.txt", "text")
+    assert catalog.reconcile([], str(notes_dir), cancelled=lambda: True) is None
+    assert catalog.paths() == []
+
+
+def test_found_streams_notes_new_to_the_catalog(catalog, notes_dir):
+    a = write(notes_dir / "a.txt", "a")
+    catalog.reconcile([], str(notes_dir))
+    b = write(notes_dir / "b.txt", "b")
+    batches = []
+    catalog.reconcile([], str(notes_dir), found=batches.append)
+    assert [path for batch in batches for path in batch] == [b]
+    assert catalog.paths() == [a, b]
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from src.logic.content_index import ContentIndex, fts_query
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ContentIndex(db_file=tmp_path / "index.db")
+    if not index.available:
+        pytest.skip("SQLite was built without FTS5")
+    return index
+
+
+def write(path, text, mtime=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_fts_query_quotes_terms_and_prefixes_the_last():
+    assert fts_query("") == ""
+    assert fts_query("alpha beta") == '"alpha" "beta"*'
+    assert fts_query('say "hi" OR') == '"say" """hi""" "OR"*'
+
+
+def test_sync_indexes_and_searches(index, tmp_path):
+    note = write(tmp_path / "groceries.txt", "buy apples and pears")
+    assert index.sync_paths([note]) == 1
+    results = index.search("appl")
+    assert [path for path, _ in results] == [str(note)]
+    assert "apples" in results[0][1]
+
+
+def test_sync_skips_unchanged_and_rereads_changed(index, tmp_path):
+    note = write(tmp_path / "a.txt", "first draft", mtime=1_000_000)
+    assert index.sync_paths([note]) == 1
+    assert index.sync_paths([note]) == 0
+    write(note, "second version", mtime=2_000_000)
+    assert index.sync_paths([note]) == 1
+    assert index.search("draft") == []
+    assert [path for path, _ in index.search("version")] == [str(note)]
+
+
+def test_sync_drops_missing_files(index, tmp_path):
+    note = write(tmp_path / "gone.txt", "ephemeral words")
+    index.sync_paths([note])
+    note.unlink()
+    index.sync_paths([note])
+    assert index.search("ephemeral") == []
+    assert index.stored_stats() == {}
+
+
+def test_remove_many_and_punctuation_in_queries(index, tmp_path):
+    keep = write(tmp_path / "keep.txt", "c++ notes: AND OR NOT")
+    drop = write(tmp_path / "drop.txt", "c++ notes too")
+    index.sync_paths([keep, drop])
+    index.remove_many([drop])
+    assert [path for path, _ in index.search("c++ AND")] == [str(keep)]
+
+
+def test_sync_stops_when_cancelled(index, tmp_path):
+    notes = [write(tmp_path / f"{n}.txt", f"note {n}") for n in range(3)]
+    assert index.sync_paths(notes, cancelled=lambda: True) is None
+    assert index.stored_stats() == {}
@@ -0,0 +1,55 @@
+from src.logic.fuzzy import FuzzyMatcher, match_key
+
+
+def matcher(*paths):
+    return FuzzyMatcher([match_key(path.rsplit("/", 1)[-1], path) for path in paths])
+
+
+def test_match_key_lowercases_and_normalizes_separators():
+    assert match_key("Todo.TXT", "C:\\Notes\\Todo.TXT") == ("todo.txt", "c:/notes/todo.txt")
+
+
+def test_empty_query_keeps_list_order():
+    assert matcher("a/x.txt", "a/y.txt").rank("") == [0, 1]
+
+
+def test_substring_beats_subsequence_beats_path():
+    fuzzy = matcher("docs/t_o_d_o.md", "work/todo.md", "todo/notes.md", "misc/other.md")
+    assert fuzzy.rank("todo") == [1, 0, 2]
+
+
+def test_word_starts_rank_first_within_a_tier():
+    fuzzy = matcher("n/xlog.txt", "n/log.txt", "n/app_log.txt")
+    assert fuzzy.rank("log") == [1, 2, 0]
+
+
+def test_compact_and_shorter_matches_rank_first():
+    fuzzy = matcher("n/a-----b.txt", "n/ab.txt", "n/a-b.txt")
+    assert fuzzy.rank("ab") == [1, 2, 0]
+    fuzzy = matcher("n/notes-archive.md", "n/notes.md")
+    assert fuzzy.rank("notes") == [1, 0]
+
+
+def test_query_is_case_insensitive():
+    assert matcher("n/README.md").rank("ReadMe") == [0]
+
+
+def test_extended_query_only_rechecks_previous_matches():
+    fuzzy = matcher("n/alpha.md", "n/beta.md", "n/alps.md")
+    assert fuzzy.rank("al") == [2, 0]
+    fuzzy._names[1] = "alpine.md"  # would match "alp" if it were re-checked
+    assert fuzzy.rank("alp") == [2, 0]
+    assert fuzzy.rank("b") == [1]
+
+
+def test_rank_chunks_yields_between_chunks(monkeypatch):
+    monkeypatch.setattr(FuzzyMatcher, "CHUNK_SIZE", 2)
+    fuzzy = matcher(*[f"n/note{n}.md" for n in range(5)])
+    steps = list(fuzzy.rank_chunks("note"))
+    assert steps[:-1] == [None, None, None]
+    assert steps[-1] == [0, 1, 2, 3, 4]
+
+
+def test_special_characters_are_literal():
+    fuzzy = matcher("n/a.b[1].txt", "n/axb1.txt")
+    assert fuzzy.rank("a.b[") == [0]
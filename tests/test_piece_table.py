@@ -0,0 +1,142 @@
+import pytest
+
+from src.logic.large_file import LargeFile, utf8_boundary, utf8_char_end, utf8_char_start
+from src.logic.piece_table import PieceTable
+
+
+@pytest.fixture
+def open_table(tmp_path):
+    files = []
+
+    def open_table(data):
+        path = tmp_path / "big.txt"
+        path.write_bytes(data)
+        large_file = LargeFile(str(path))
+        large_file.build_index()
+        files.append(large_file)
+        return PieceTable(large_file)
+
+    yield open_table
+    for large_file in files:
+        large_file.close()
+
+
+def matches(table, text, **options):
+    starts, ends = table.find_all(LargeFile.compile_pattern(text, **options))
+    return list(zip(starts, ends))
+
+
+def test_edits_round_trip_through_undo_and_redo(open_table):
+    table = open_table(b"one\ntwo\nthree\n")
+    table.insert(4, b"TWO ")
+    table.delete(0, 4)
+    assert table.read(0, table.size) == b"TWO two\nthree\n"
+    assert table.line_count == 3
+    assert table.line_text(0) == "TWO two"
+
+    # The caret lands after re-inserted text and where removed text was
+    assert table.undo() == 4
+    assert table.undo() == 4
+    assert table.read(0, table.size) == b"one\ntwo\nthree\n"
+    table.redo()
+    assert table.read(0, table.size) == b"one\nTWO two\nthree\n"
+
+
+def test_write_to_streams_the_edited_document(open_table, tmp_path):
+    table = open_table(b"alpha\nbeta\n")
+    table.insert(6, b"gamma\n")
+    out = tmp_path / "out.txt"
+    with open(out, "wb") as f:
+        table.write_to(f)
+    assert out.read_bytes() == b"alpha\ngamma\nbeta\n"
+
+
+def test_whole_word_search_ignores_piece_boundaries(open_table):
+    table = open_table(b"hello fooXbaz foo\n")
+    # Splits the original piece right after "foo"
+    table.insert(9, b"")
+    table.delete(9, 1)
+    table.insert(9, b"Y")
+    assert table.read(0, table.size) == b"hello fooYbaz foo\n"
+    assert matches(table, "foo", whole_word=True) == [(14, 17)]
+
+
+def test_line_anchors_only_match_at_real_line_ends(open_table):
+    table = open_table(b"ab cd\nab\n")
+    table.insert(2, b"")
+    table.delete(2, 1)
+    table.insert(2, b"_")
+    assert matches(table, r"ab$", regex=True) == [(6, 8)]
+
+
+def test_regex_matches_span_piece_boundaries_once(open_table):
+    table = open_table(b"hello fooXbaz\n")
+    table.insert(9, b"")
+    table.delete(9, 1)
+    table.insert(9, b"Y")
+    assert len(table.pieces) == 3
+    assert matches(table, r"\w+", regex=True) == [(0, 5), (6, 13)]
+
+
+def test_matches_are_found_across_many_windows(open_table, monkeypatch):
+    monkeypatch.setattr("src.logic.piece_table.SCAN_CHUNK", 16)
+    line = b"x needle y\n"
+    table = open_table(line * 50)
+    table.insert(5 * len(line) + 4, b"ne")
+    table.delete(5 * len(line) + 4, 2)
+    found = matches(table, "needle")
+    assert found == [(i * len(line) + 2, i * len(line) + 8) for i in range(50)]
+
+
+def test_lines_longer_than_a_window_are_scanned_whole(open_table, monkeypatch):
+    monkeypatch.setattr("src.logic.piece_table.SCAN_CHUNK", 8)
+    table = open_table(b"a" * 40 + b"needle" + b"b" * 40 + b"\nneedle\n")
+    table.insert(20, b"a")
+    assert matches(table, "needle") == [(41, 47), (88, 94)]
+
+
+def test_rebased_table_replays_later_edits_and_keeps_history(open_table, tmp_path):
+    table = open_table(b"one\ntwo\n")
+    table.insert(4, b"2 ")
+    saved = tmp_path / "saved.txt"
+    with open(saved, "wb") as f:
+        table.write_to(f)
+    table.start_journal()
+    table.insert(0, b"> ")
+
+    indexed = LargeFile(str(saved))
+    indexed.build_index()
+    indexed.close()
+    # The finished index is handed to a fresh mapping of the same bytes
+    copy = LargeFile(str(saved), indexed.line_offsets)
+    try:
+        rebased = table.rebased(copy)
+        assert rebased.read(0, rebased.size) == b"> one\n2 two\n"
+        assert rebased.line_count == 3
+        rebased.undo()
+        assert rebased.read(0, rebased.size) == b"one\n2 two\n"
+        rebased.undo()
+        assert rebased.read(0, rebased.size) == b"one\ntwo\n"
+    finally:
+        copy.close()
+
+
+def test_utf8_steps_cover_whole_characters():
+    data = "a\u00e9\u20ac\U0001f600".encode("utf-8")  # 1, 2, 3 and 4 bytes
+    ends = [0]
+    while ends[-1] < len(data):
+        ends.append(utf8_char_end(data, ends[-1]))
+    assert ends == [0, 1, 3, 6, 10]
+    starts = [len(data)]
+    while starts[-1] > 0:
+        starts.append(utf8_char_start(data, starts[-1]))
+    assert starts == [10, 6, 3, 1, 0]
+    assert [utf8_boundary(data, pos) for pos in range(11)] == [0, 1, 1, 3, 3, 3, 6, 6, 6, 6, 10]
+
+
+def test_utf8_steps_treat_malformed_bytes_as_single_characters():
+    data = b"\x80\xe2\x82A"
+    assert utf8_char_end(data, 0) == 1
+    assert utf8_char_end(data, 1) == 3
+    assert utf8_char_end(data, 3) == 4
+    assert utf8_char_start(data, 1) == 0
@@ -0,0 +1,45 @@
+import os
+
+from src.logic.scanner import WorkspaceScanner
+
+
+def make_tree(root, files):
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+
+
+def test_lists_notes_in_nested_directories(tmp_path):
+    make_tree(tmp_path, ["a.txt", "sub/b.md", "sub/deeper/c.txt", "sub/image.png"])
+    found = WorkspaceScanner().list_files(tmp_path, ignore=[])
+    assert found == [
+        str(tmp_path / "a.txt"),
+        str(tmp_path / "sub" / "b.md"),
+        str(tmp_path / "sub" / "deeper" / "c.txt"),
+    ]
+
+
+def test_ignore_patterns_skip_files_and_whole_directories(tmp_path):
+    make_tree(tmp_path, ["keep.txt", "draft.tmp.txt", ".git/HEAD.txt", "node_modules/x/y.md"])
+    found = WorkspaceScanner().list_files(tmp_path, ignore=[".*", "node_modules", "*.tmp.txt"])
+    assert found == [str(tmp_path / "keep.txt")]
+
+
+def test_missing_root_yields_nothing(tmp_path):
+    assert WorkspaceScanner().list_files(tmp_path / "missing", ignore=[]) == []
+
+
+def test_symlinked_directories_are_not_followed(tmp_path):
+    make_tree(tmp_path, ["real/a.txt"])
+    try:
+        os.symlink(tmp_path / "real", tmp_path / "link", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        return
+    assert WorkspaceScanner().list_files(tmp_path, ignore=[]) == [str(tmp_path / "real" / "a.txt")]
+
+
+def test_walk_stops_when_cancelled(tmp_path):
+    make_tree(tmp_path, ["a.txt"] + [f"d{n}/note.txt" for n in range(10)])
+    batches = list(WorkspaceScanner().walk(tmp_path, ignore=[], cancelled=lambda: True))
+    assert len(batches) <= 1
@@ -0,0 +1,179 @@
+import os
+
+from src.logic.search import (
+    DONE,
+    TIMEOUT,
+    SearchCache,
+    SearchSession,
+    compile_search_pattern,
+    jump_index,
+    line_matches,
+    run_isolated,
+)
+
+
+STARTS = [10, 20, 30]
+
+
+def test_forward_jump_lands_on_the_first_match_at_or_after_the_anchor():
+    assert jump_index(STARTS, 3, 20) == 1
+    assert jump_index(STARTS, 3, 20, inclusive=False) == 2
+    assert jump_index(STARTS, 3, 31) == 0
+    assert jump_index(STARTS, 3, 31, wrap=False) == -1
+
+
+def test_backward_jump_lands_on_the_last_match_before_the_anchor():
+    assert jump_index(STARTS, 3, 25, forward=False) == 1
+    assert jump_index(STARTS, 3, 10, forward=False) == 2
+    assert jump_index(STARTS, 3, 10, forward=False, wrap=False) == -1
+    assert jump_index([], 0, 10, forward=False) == -1
+
+
+def test_partial_results_decide_a_jump_only_once_the_scan_passed_the_anchor():
+    # Only the first two matches are known so far
+    assert jump_index(STARTS, 2, 15, final=False) == 1
+    assert jump_index(STARTS, 2, 25, final=False) is None
+    assert jump_index(STARTS, 2, 25, forward=False, final=False) is None
+    assert jump_index(STARTS, 2, 15, forward=False, final=False) == 0
+    # Nothing before the anchor: wrapping needs the last match, which is not known yet
+    assert jump_index(STARTS, 2, 5, forward=False, final=False) is None
+
+
+def spans(session):
+    return list(zip(session.starts, session.ends))
+
+
+def test_rebuild_indexes_every_match_in_order():
+    session = SearchSession("ab")
+    session.rebuild("ab xab\nAB")
+    assert spans(session) == [(0, 2), (4, 6), (7, 9)]
+    session = SearchSession("ab", case_sensitive=True, whole_word=True)
+    session.rebuild("ab xab\nAB")
+    assert spans(session) == [(0, 2)]
+
+
+def test_apply_edit_rescans_the_touched_lines_and_shifts_the_rest():
+    text = "foo\nbar\nfoo"
+    session = SearchSession("foo")
+    session.rebuild(text)
+    # "bar" becomes "foo foo": four characters longer
+    session.apply_edit(4, 7, "foo foo")
+    assert spans(session) == [(0, 3), (4, 7), (8, 11), (12, 15)]
+
+    fresh = SearchSession("foo")
+    fresh.rebuild("foo\nfoo foo\nfoo")
+    assert spans(session) == spans(fresh)
+
+
+def test_navigation_bisects_and_wraps():
+    session = SearchSession("x")
+    session.rebuild("x.x.x")
+    assert session.next_index(0) == 1
+    assert session.next_index(0, inclusive=True) == 0
+    assert session.next_index(4) == 0
+    assert session.next_index(4, wrap=False) == -1
+    assert session.previous_index(0) == 2
+    assert session.index_at(2) == 1
+    assert session.index_at(3) == -1
+
+
+def test_narrowing_a_prefix_matches_a_fresh_scan():
+    text = "tea team teapot tea"
+    previous = SearchSession("tea")
+    previous.rebuild(text)
+    session = SearchSession("team")
+    assert session.can_narrow_from(previous)
+    session.narrow(previous, text)
+    assert spans(session) == [(4, 8)]
+    # A self-overlapping prefix may hide occurrences, so it is never narrowed from
+    assert not SearchSession("aab").can_narrow_from(SearchSession("aa"))
+
+
+def test_dropped_edits_keep_other_matches_until_the_stale_lines_are_refilled():
+    session = SearchSession(r"\d+", regex=True)
+    session.starts, session.ends = [0, 3, 6], [2, 5, 8]  # "12\n34\n56"
+    # Line "34" becomes "3x45"
+    session.drop_edit(3, 5, 4)
+    assert spans(session) == [(0, 2), (8, 10)]
+    assert session.stale == (3, 7)
+    # A later edit on the last line ("56" becomes "567") widens the stale range over both
+    session.drop_edit(8, 10, 3)
+    assert spans(session) == [(0, 2)]
+    assert session.stale == (3, 11)
+
+    session.fill_stale(3, 11, [3, 5, 8], [4, 7, 11])
+    assert spans(session) == [(0, 2), (3, 4), (5, 7), (8, 11)]
+    assert session.stale is None
+
+
+def test_regex_matches_are_kept_to_single_lines():
+    session = SearchSession(r"a\s*b", regex=True)
+    status, _ = session.rebuild_isolated("ab a\nb a b", timeout=30)
+    assert status == DONE
+    assert spans(session) == [(0, 2), (7, 10)]
+
+
+def test_regex_matches_running_into_a_newline_are_clipped_to_their_line():
+    session = SearchSession(r"\w+\s*", regex=True)
+    assert session.rebuild_isolated("foo\nbar baz\n", timeout=30)[0] == DONE
+    assert spans(session) == [(0, 3), (4, 8), (8, 11)]
+
+    session = SearchSession(r"end\s", regex=True)
+    assert session.rebuild_isolated("the end\nx", timeout=30)[0] == DONE
+    assert spans(session) == []
+    session.apply_edit(0, 9, "the end \nx")
+    assert spans(session) == [(4, 8)]
+
+
+def test_line_matches_keeps_context_before_the_line_and_works_on_bytes():
+    pattern = compile_search_pattern(r"(?<=\n)x", regex=True)
+    assert [m.span() for m in line_matches(pattern, "a\nx")] == [(2, 3)]
+    pattern = compile_search_pattern(rb"\w+\s*", regex=True)
+    found = line_matches(pattern, b"foo\nbar baz\n", newline=b"\n")
+    assert [m.span() for m in found] == [(0, 3), (4, 8), (8, 11)]
+
+
+def test_catastrophic_regex_is_stopped_by_its_time_budget():
+    session = SearchSession(r"(a+)+$", regex=True)
+    status, _ = session.rebuild_isolated("a" * 40 + "b", timeout=0.5)
+    assert status == TIMEOUT
+    assert len(session) == 0
+
+
+def test_isolated_runs_reuse_a_child_until_one_is_killed():
+    status, first = run_isolated(os.getpid, (), timeout=30)
+    assert status == DONE and first != os.getpid()
+    assert run_isolated(os.getpid, (), timeout=30) == (DONE, first)
+
+    session = SearchSession(r"(a+)+$", regex=True)
+    assert session.rebuild_isolated("a" * 40 + "b", timeout=0.5)[0] == TIMEOUT
+    status, after = run_isolated(os.getpid, (), timeout=30)
+    assert status == DONE and after not in (first, os.getpid())
+
+
+def test_patterns_are_compiled_once():
+    assert compile_search_pattern("x", True) is compile_search_pattern("x", True)
+
+
+def test_cache_is_dropped_when_the_revision_changes():
+    cache = SearchCache()
+    session = SearchSession("tea")
+    session.rebuild("tea team")
+    cache.put(session, revision=1)
+    assert cache.get(session.key, 1) is session
+    assert cache.narrowing_base(SearchSession("team"), 1) is session
+    assert cache.get(session.key, 2) is None
+    assert cache.get(session.key, 1) is None
+
+
+def test_match_at_reruns_matches_that_need_context_or_were_clipped():
+    content = "a\nx"
+    session = SearchSession(r"(?<=\n)(x)", regex=True)
+    assert session.rebuild_isolated(content, timeout=30)[0] == DONE
+    assert session.match_at(content, 0).expand(r"[\1]") == "[x]"
+
+    content = "foo\nbar"
+    session = SearchSession(r"(\w+)\s*", regex=True)
+    assert session.rebuild_isolated(content, timeout=30)[0] == DONE
+    assert [session.match_at(content, i).group(1) for i in range(2)] == ["foo", "bar"]
+    assert session.match_at("fo\nbar", 0) is None
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from src.logic.corpus import tokenize_chunk
+from src.logic.trigram_index import TrigramIndex, match_snippet
+
+
+@pytest.fixture
+def index_file(tmp_path):
+    return tmp_path / "trigrams.idx"
+
+
+def index_notes(index, notes, max_chars=1000):
+    files = []
+    for path, text in notes:
+        path.write_text(text, encoding="utf-8")
+        stat = os.stat(path)
+        files.append((str(path), stat.st_mtime, stat.st_size))
+    index.add_many(*tokenize_chunk(files, max_chars))
+
+
+def test_match_snippet_keeps_the_matching_line():
+    text = "first line\nsecond has needle here\nthird"
+    assert match_snippet(text, text.index("needle"), 6) == "second has needle here"
+
+
+def test_candidates_need_every_trigram(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    index_notes(index, [(a, "request_id=42"), (b, "unrelated words")])
+    assert index.candidates("id") is None
+    assert index.candidates("REQUEST_ID") == [str(a)]
+    assert index.candidates("zzz") == []
+
+
+def test_search_verifies_substrings(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    # b has every trigram of "abcd" but not the substring itself
+    index_notes(index, [(a, "xx abcd yy"), (b, "abc bcd")])
+    assert index.search("ABCD") == [(str(a), "xx abcd yy")]
+    assert index.search("ABCD", case_sensitive=True) == []
+
+
+def test_snippets_line_up_when_lowercasing_changes_lengths(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    note = tmp_path / "a.txt"
+    # "\u0130" lowercases to two characters
+    index_notes(index, [(note, "\u0130" * 100 + " needle here")])
+    [(_, snippet)] = index.search("NEEDLE")
+    assert snippet.endswith(" needle here")
+
+
+def test_truncated_files_are_scanned_past_their_head(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    big = tmp_path / "big.log"
+    index_notes(index, [(big, "a" * 50 + "\nneedle at the end")], max_chars=20)
+    assert index.candidates("needle") == [str(big)]
+    assert index.search("needle") == [(str(big), "needle at the end")]
+
+
+def test_search_finds_matches_across_chunks(tmp_path, index_file, monkeypatch):
+    monkeypatch.setattr(TrigramIndex, "SEARCH_CHUNK_CHARS", 8)
+    index = TrigramIndex(index_file)
+    note = tmp_path / "a.txt"
+    index_notes(index, [(note, "0123456needle")])
+    assert [path for path, _ in index.search("needle")] == [str(note)]
+
+
+def test_search_stops_at_the_read_budget(tmp_path, index_file, monkeypatch):
+    monkeypatch.setattr(TrigramIndex, "SEARCH_CHAR_BUDGET", 30)
+    index = TrigramIndex(index_file)
+    notes = [(tmp_path / f"{n}.txt", "padding " * 2 + "needle") for n in range(3)]
+    index_notes(index, notes)
+    assert [path for path, _ in index.search("needle")] == [str(notes[0][0])]
+
+
+def test_search_stops_when_cancelled(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    index_notes(index, [(tmp_path / "a.txt", "needle")])
+    assert index.search("needle", cancelled=lambda: True) == []
+
+
+def test_changed_files_replace_their_old_postings(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    note = tmp_path / "a.txt"
+    index_notes(index, [(note, "old words")])
+    index_notes(index, [(note, "new words")])
+    assert index.candidates("old") == []
+    assert index.candidates("new") == [str(note)]
+    index.remove_many([note])
+    assert index.candidates("new") == []
+    assert index.indexed_keys() == set()
+
+
+def test_flush_persists_and_drops_dead_ids(tmp_path, index_file):
+    index = TrigramIndex(index_file)
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    index_notes(index, [(a, "alpha"), (b, "beta")])
+    index_notes(index, [(a, "gamma")])
+    index.flush()
+    index._close_mapping()
+
+    reloaded = TrigramIndex(index_file)
+    assert reloaded.candidates("gamma") == [str(a)]
+    assert reloaded.candidates("alpha") == []
+    assert reloaded.candidates("beta") == [str(b)]
+    assert reloaded.is_current(a, os.stat(a))
+    reloaded._close_mapping()